@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#########################################################
+# Benchmark of FastSerializer against suds marshalling.
+# Both paths serialize the same payloads (nodes, lines,
+# members and nodal loads) for the schema of running RFEM.
+# Nothing is sent to the model.
+#########################################################
+import os
+import sys
+import time
+dirName = os.path.dirname(__file__)
+sys.path.append(dirName + r'/..')
+
+from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.fastSerializer import FastSerializer
+
+def createPayloads(clientModel, count):
+    payloads = []
+    for i in range(1, count + 1):
+        node = clearAttributes(clientModel.factory.create('ns0:node'))
+        node.no = i
+        node.coordinate_1 = i * 0.5
+        node.coordinate_2 = 0.0
+        node.coordinate_3 = -1.0
+        node.comment = ''
+        payloads.append(('set_node', (deleteEmptyAttributes(node),)))
+
+        line = clearAttributes(clientModel.factory.create('ns0:line'))
+        line.no = i
+        line.definition_nodes = '%d %d' % (i, i + 1)
+        line.comment = ''
+        payloads.append(('set_line', (deleteEmptyAttributes(line),)))
+
+        member = clearAttributes(clientModel.factory.create('ns0:member'))
+        member.no = i
+        member.type = 'TYPE_BEAM'
+        member.line = i
+        member.section_start = 1
+        member.section_end = 1
+        member.rotation_angle = 0.0
+        member.comment = ''
+        payloads.append(('set_member', (deleteEmptyAttributes(member),)))
+
+        load = clearAttributes(clientModel.factory.create('ns0:nodal_load'))
+        load.no = i
+        load.load_type = 'LOAD_TYPE_FORCE'
+        load.nodes = str(i)
+        load.load_direction = 'LOAD_DIRECTION_GLOBAL_Z_OR_USER_DEFINED_W'
+        load.force_magnitude = 5000.0
+        load.comment = ''
+        payloads.append(('set_nodal_load', (1, deleteEmptyAttributes(load))))
+    return payloads
+
+def sudsPath(clientModel, payloads):
+    for operation, args in payloads:
+        method = getattr(clientModel.service, operation).method
+        method.binding.input.get_message(method, args, {}).plain().encode('utf-8')
+
+def fastPath(clientModel, payloads):
+    serializer = FastSerializer(clientModel)
+    for operation, args in payloads:
+        serializer.serialize(operation, *args).encode('utf-8')
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    Model(True, 'FastSerializerBenchmark')
+    payloads = createPayloads(Model.clientModel, count)
+
+    for name, function in (('suds', sudsPath), ('fast', fastPath)):
+        start = time.perf_counter()
+        function(Model.clientModel, payloads)
+        elapsed = time.perf_counter() - start
+        print('%-5s %8d calls %9.3f s %9.1f us/call' % (name, len(payloads), elapsed, elapsed / len(payloads) * 1e6))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#########################################################
+# Benchmark of import time of the package.
+# Every module is imported in fresh interpreter and its
+# cumulative import time reported by -X importtime is
+# printed. Star imports (from RFEM.enums import *) define
+# all lazy enums, their time is measured by the clock.
+# UnitTests/test_importTime.py enforces budgets of
+# RFEM.initModel and of the star import of RFEM.enums.
+#########################################################
+import os
+import re
+import sys
+import subprocess
+dirName = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.abspath(os.path.join(dirName, '..'))
+
+MODULES = ['RFEM.enums', 'RFEM.initModel', 'RFEM.BasicObjects.node', 'RFEM.Loads.memberLoad', 'RFEM.Results.resultTables']
+STAR_IMPORTS = ['RFEM.enums']
+
+def importTime(module: str):
+    '''
+    Cumulative import time of module in microseconds.
+    '''
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                            env=env, capture_output=True, text=True, check=True).stderr
+    match = re.search(r'^import time:\s*\d+ \|\s*(\d+) \| %s$' % re.escape(module), output, re.M)
+    return int(match.group(1))
+
+def starImportTime(module: str):
+    '''
+    Time of from module import * in microseconds.
+    '''
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    code = 'import time; start = time.perf_counter()\nfrom %s import *\nprint(int((time.perf_counter() - start) * 1e6))' % module
+    output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True).stdout
+    return int(output)
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for module in MODULES:
+        # Best of repeated imports, first import also compiles bytecode
+        best = min(importTime(module) for i in range(repeat))
+        print('%-30s %8.1f ms' % (module, best / 1000))
+    for module in STAR_IMPORTS:
+        best = min(starImportTime(module) for i in range(repeat))
+        print('%-30s %8.1f ms' % ('from %s import *' % module, best / 1000))
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#########################################################
+# Benchmark of object construction in constructors.
+# Compares factory.create + clearAttributes of every
+# object with sparse objects of cached types
+# (createEmptyObject). Nodes are built by Node class and
+# collected by ModelBuilder, nothing is sent to the model.
+#########################################################
+import os
+import sys
+import time
+dirName = os.path.dirname(__file__)
+sys.path.append(dirName + r'/..')
+
+from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, createEmptyObject
+from RFEM.BasicObjects.node import Node
+from RFEM.modelBuilder import ModelBuilder
+
+def factoryPath(builder, count):
+    for i in range(1, count + 1):
+        clientObject = clearAttributes(Model.clientModel.factory.create('ns0:node'))
+        clientObject.no = i
+        clientObject.coordinate_1 = i * 0.5
+        clientObject.coordinate_2 = 0.0
+        clientObject.coordinate_3 = 0.0
+        clientObject.comment = ''
+        builder.add('set_node', deleteEmptyAttributes(clientObject))
+
+def sparsePath(builder, count):
+    for i in range(1, count + 1):
+        Node(i, i * 0.5, 0.0, 0.0, model=builder)
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    Model(True, 'ObjectConstructionBenchmark')
+    # schema of the type is walked outside of measurement
+    createEmptyObject('ns0:node')
+
+    for name, function in (('factory', factoryPath), ('sparse', sparsePath)):
+        builder = ModelBuilder(Model, chunk_size=None)
+        start = time.perf_counter()
+        function(builder, count)
+        elapsed = time.perf_counter() - start
+        builder.discard()
+        print('%-7s %8d nodes %9.3f s %9.1f us/node' % (name, count, elapsed, elapsed / count * 1e6))
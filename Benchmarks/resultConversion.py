@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#########################################################
+# Benchmark of ConvertResultsToListOfDct on offline
+# result table of members internal forces. Cells are
+# converted by converters of ResultTableSchema.
+# RFEM doesn't have to be running.
+#########################################################
+import os
+import sys
+import time
+dirName = os.path.dirname(__file__)
+sys.path.append(dirName + r'/..')
+
+from RFEM.Results.resultTables import ConvertResultsToListOfDct
+from UnitTests.offlineClient import createModel
+from UnitTests.test_resultSchema import largeReply, legacyConvertResultsToListOfDct
+
+def measure(function, results, includeBase, repeat):
+    best = float('inf')
+    for i in range(repeat):
+        start = time.perf_counter()
+        function(results, includeBase)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    model = createModel(largeReply(count))
+    results = model.clientModel.service.get_results_for_members_internal_forces('E_OBJECT_TYPE_LOAD_CASE', 1, 1)
+
+    for includeBase in (False, True):
+        legacy = measure(legacyConvertResultsToListOfDct, results, includeBase, 3)
+        schema = measure(ConvertResultsToListOfDct, results, includeBase, 3)
+        print('%d lines, includeBase=%s: guessing %.1f ms, schema %.1f ms (%.1fx)' %
+              (count, includeBase, legacy * 1000, schema * 1000, legacy / schema))
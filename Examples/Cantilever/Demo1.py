@@ -25,28 +25,25 @@ if __name__ == '__main__':
     f = float(input('Force in kN: '))
 
     Model(True, "Demo1") # crete new model called Demo1
-    Model.clientModel.service.begin_modification()
+    with Model.transaction():
+        Material(1, 'S235')
 
+        Section(1, 'IPE 200')
 
-    Material(1, 'S235')
+        Node(1, 0.0, 0.0, 0.0)
+        Node(2, l, 0.0, 0.0)
 
-    Section(1, 'IPE 200')
+        Member(1, 1, 2, 0.0, 1, 1)
 
-    Node(1, 0.0, 0.0, 0.0)
-    Node(2, l, 0.0, 0.0)
+        NodalSupport(1, '1', NodalSupportType.FIXED)
 
-    Member(1, 1, 2, 0.0, 1, 1)
+        StaticAnalysisSettings.GeometricallyLinear(1, "Linear")
+        StaticAnalysisSettings.SecondOrderPDelta(2, "SecondOrder")
+        StaticAnalysisSettings.LargeDeformation(3, "LargeDeformation")
 
-    NodalSupport(1, '1', NodalSupportType.FIXED)
+        LoadCase(1, 'Self-Weight', [True, 0.0, 0.0, 1.0])
 
-    StaticAnalysisSettings.GeometricallyLinear(1, "Linear")
-    StaticAnalysisSettings.SecondOrderPDelta(2, "SecondOrder")
-    StaticAnalysisSettings.LargeDeformation(3, "LargeDeformation")
-
-    LoadCase(1, 'Self-Weight', [True, 0.0, 0.0, 1.0])
-
-    NodalLoad(1, 1, '2', LoadDirectionType.LOAD_DIRECTION_GLOBAL_Z_OR_USER_DEFINED_W, f*1000)
-    Model.clientModel.service.finish_modification()
+        NodalLoad(1, 1, '2', LoadDirectionType.LOAD_DIRECTION_GLOBAL_Z_OR_USER_DEFINED_W, f*1000)
 
     Calculate_all()
 
@@ -245,6 +245,7 @@ if __name__ == '__main__':
                 for i, j in zip(initPeriodsMulti.to_list(), initOrdinatesMulti.to_list()):
                     multiSpectrumData.append([i, j])
 
+                # Asked for every transfer, spectra can be added in RFEM meanwhile (no IdAllocator)
                 ResponseSpectrum.UserDefinedGFactor((FirstFreeIdNumber(ObjectTypes.E_OBJECT_TYPE_RESPONSE_SPECTRUM, 0)), user_defined_spectrum=multiSpectrumData)
 
                 Model.clientModel.service.finish_modification()
@@ -4,7 +4,7 @@ baseName = os.path.basename(__file__)
 dirName = os.path.dirname(__file__)
 sys.path.append(dirName + r'/../..')
 import pyvista as pv
-from RFEM.enums import LineSupportType, SurfaceGeometry, SurfaceLoadDirection, SurfaceLoadDistribution
+from RFEM.enums import LineSupportType, SurfaceGeometry, SurfaceLoadDirection, SurfaceLoadDistribution, ObjectTypes
 from RFEM.initModel import Calculate_all, Model, client
 from RFEM.BasicObjects.node import Node
 from RFEM.BasicObjects.line import Line
@@ -16,6 +16,12 @@ from RFEM.Results.resultTables import GetMaxValue, ResultTables
 from RFEM.Loads.surfaceLoad import SurfaceLoad
 from RFEM.LoadCasesAndCombinations.loadCase import LoadCase
 from RFEM.ImportExport.exports import ExportTo
+from RFEM.modelMirror import ModelMirror, mirrors
+
+# Object types defined in calculateTank(), kept in the mirror of the model
+SYNCED_TYPES = [ObjectTypes.E_OBJECT_TYPE_MATERIAL, ObjectTypes.E_OBJECT_TYPE_NODE, ObjectTypes.E_OBJECT_TYPE_LINE,
+                ObjectTypes.E_OBJECT_TYPE_LINE_SUPPORT, ObjectTypes.E_OBJECT_TYPE_THICKNESS, ObjectTypes.E_OBJECT_TYPE_SURFACE,
+                ObjectTypes.E_OBJECT_TYPE_LOAD_CASE, ObjectTypes.E_OBJECT_TYPE_SURFACE_LOAD]
 
 def calculateTank(d, h, util):
 
@@ -42,33 +48,41 @@ def calculateTank(d, h, util):
         print('Creating new model...!')
         Model(True, 'responsiveTank.rf6', delete_all= True)
 
-    Material(1, "S235")
-    Node(1, d/2, 0,0)
-    Node(2, d/2, 0, -h)
-    Node(3, 0,0, -(h+2))
+    # Model is mirrored once, when it is opened. Reruns compare new inputs
+    # with the mirror instead of reading every object back from RFEM.
+    if Model.clientModel not in mirrors:
+        mirror = ModelMirror.attach()
+        mirror.seed(SYNCED_TYPES)
+
+    # Only objects changed by new inputs are sent to the edited model
+    with Model.sync():
+        Material(1, "S235")
+        Node(1, d/2, 0,0)
+        Node(2, d/2, 0, -h)
+        Node(3, 0,0, -(h+2))
 
-    Line.Circle(1, [0,0,0], d/2, [0,0,1])
-    Line.Circle(2, [0,0, -h], d/2, [0,0,1])
-    Line(3, '1 2')
-    Line.Arc(4, [2,3], [d/3.5, 0, -(h+(2/1.5))])
+        Line.Circle(1, [0,0,0], d/2, [0,0,1])
+        Line.Circle(2, [0,0, -h], d/2, [0,0,1])
+        Line(3, '1 2')
+        Line.Arc(4, [2,3], [d/3.5, 0, -(h+(2/1.5))])
 
-    LineSupport(1, '1', LineSupportType.HINGED)
+        LineSupport(1, '1', LineSupportType.HINGED)
 
-    Thickness(1, '12 mm', 1, 0.012)
+        Thickness(1, '12 mm', 1, 0.012)
 
-    Surface.Standard(1, SurfaceGeometry.GEOMETRY_QUADRANGLE, [1,2,0,0], '1 2 3', 1)
-    Surface.Standard(2, SurfaceGeometry.GEOMETRY_ROTATED, [360, [0,0,0], [0,0,1], 4], "2 3", 1)
+        Surface.Standard(1, SurfaceGeometry.GEOMETRY_QUADRANGLE, [1,2,0,0], '1 2 3', 1)
+        Surface.Standard(2, SurfaceGeometry.GEOMETRY_ROTATED, [360, [0,0,0], [0,0,1], 4], "2 3", 1)
 
-    LoadCase()
+        LoadCase()
 
-    load_height = util * (h + 2)
+        load_height = util * (h + 2)
 
-    SurfaceLoad.Force(no = 1,
-                      load_case_no = 1,
-                      surface_no = '1 2',
-                      load_direction = SurfaceLoadDirection.LOAD_DIRECTION_LOCAL_Z,
-                      load_distribution = SurfaceLoadDistribution.LOAD_DISTRIBUTION_VARYING_IN_Z,
-                      load_parameter = [[-load_height, -load_height, 0],[0, load_height, 9.81 * load_height * 1000]])
+        SurfaceLoad.Force(no = 1,
+                          load_case_no = 1,
+                          surface_no = '1 2',
+                          load_direction = SurfaceLoadDirection.LOAD_DIRECTION_LOCAL_Z,
+                          load_distribution = SurfaceLoadDistribution.LOAD_DISTRIBUTION_VARYING_IN_Z,
+                          load_parameter = [[-load_height, -load_height, 0],[0, load_height, 9.81 * load_height * 1000]])
 
     Calculate_all()
 
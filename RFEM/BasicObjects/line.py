@@ -1,4 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
 from RFEM.enums import LineType, LineArcAlphaAdjustmentTarget, ObjectTypes
 
 class Line():
@@ -19,10 +21,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -38,11 +37,8 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
     def Polyline(
@@ -62,10 +58,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -84,11 +77,8 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
     def Arc(
@@ -112,10 +102,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -140,11 +127,8 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
     def Circle(
@@ -167,10 +151,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -198,11 +179,8 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
     def EllipticalArc(
@@ -229,10 +207,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -264,11 +239,8 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
     def Ellipse(
@@ -289,10 +261,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -318,11 +287,8 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
     def Parabola(
@@ -345,10 +311,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -376,11 +339,8 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
     def Spline(
@@ -399,10 +359,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -421,11 +378,8 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
     def NURBS(
@@ -450,10 +404,7 @@ class Line():
         '''
 
         # Client model | Line
-        clientObject = model.clientModel.factory.create('ns0:line')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line', model)
 
         # Line No.
         clientObject.no = no
@@ -490,21 +441,18 @@ class Line():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_line(clientObject)
+        setObject('set_line', clientObject, model=model)
 
     @staticmethod
-    def DeleteLine(lines_no: str = '1 2', model = Model):
+    def DeleteLine(lines_no: str = '1 2', loads: bool = False, model = Model):
 
         '''
         Args:
             lines_no (str): Numbers of Lines to be deleted
+            loads (bool, optional): Remove loads assigned to deleted objects as well
             model (RFEM Class, optional): Model to be edited
         '''
 
         # Delete from client model
-        for line in ConvertStrToListOfInt(lines_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_LINE.name, line)
\ No newline at end of file
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_LINE: lines_no}, loads, model=model)
\ No newline at end of file
@@ -1,4 +1,6 @@
-from RFEM.initModel import clearAttributes, deleteEmptyAttributes, Model, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
 from RFEM.enums import ObjectTypes
 
 
@@ -20,10 +22,7 @@ class Material():
         '''
 
         # Client model | Material
-        clientObject = model.clientModel.factory.create('ns0:material')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:material', model)
 
         # Material No.
         clientObject.no = no
@@ -39,11 +38,8 @@ class Material():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add material to client model
-        model.clientModel.service.set_material(clientObject)
+        setObject('set_material', clientObject, model=model)
 
     @staticmethod
     def DeleteMaterial(materials_no: str = '1 2', model = Model):
@@ -55,5 +51,4 @@ class Material():
         '''
 
         # Delete from client model
-        for material in ConvertStrToListOfInt(materials_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_MATERIAL.name, material)
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_MATERIAL: materials_no}, model=model)
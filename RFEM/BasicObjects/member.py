@@ -1,5 +1,8 @@
 from RFEM.enums import MemberType, MemberRotationSpecificationType, MemberSectionDistributionType, MemberTypeRibAlignment, MemberReferenceLengthWidthType, MemberResultBeamIntegration, ObjectTypes
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
+from RFEM.modelBuilder import ModelBuilder
 
 class Member():
     def __init__(self,
@@ -32,10 +35,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -76,11 +76,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def Beam(
@@ -159,10 +156,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -354,11 +348,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def Rigid(
@@ -400,10 +391,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -470,11 +458,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
 	## Rib Member should be corrected.
     @staticmethod
@@ -527,10 +512,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -613,11 +595,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def Truss(
@@ -667,10 +646,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -745,11 +721,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def TrussOnlyN(
@@ -799,10 +772,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -877,11 +847,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def Tension(
@@ -931,10 +898,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -1009,11 +973,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def Compression(
@@ -1063,10 +1024,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -1141,11 +1099,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def Buckling(
@@ -1195,10 +1150,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -1273,11 +1225,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def Cable(
@@ -1324,10 +1273,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -1393,11 +1339,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def ResultBeam(
@@ -1478,10 +1421,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No
         clientObject.no = no
@@ -1660,11 +1600,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def DefinableStiffness(
@@ -1706,10 +1643,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -1776,11 +1710,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def CouplingRigidRigid(
@@ -1814,10 +1745,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -1860,11 +1788,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def CouplingRigidHinge(
@@ -1898,10 +1823,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -1944,11 +1866,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def CouplingHingeRigid(
@@ -1982,10 +1901,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -2028,11 +1944,8 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
 
     @staticmethod
     def CouplingHingeHinge(
@@ -2066,10 +1979,7 @@ class Member():
         """
 
         # Client model | Member
-        clientObject = model.clientModel.factory.create('ns0:member')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member', model)
 
         # Member No.
         clientObject.no = no
@@ -2112,21 +2022,118 @@ class Member():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member to client model
-        model.clientModel.service.set_member(clientObject)
+        setObject('set_member', clientObject, model=model)
+
+    @staticmethod
+    def FromConnectivity(
+            connectivity,
+            member_type = MemberType.TYPE_BEAM,
+            hinges = None,
+            eccentricities = None,
+            comment: str = '',
+            chunk_size: int = 1000,
+            model = Model):
+        """
+        Create many members at once from connectivity table. Input is validated
+        as a whole before anything is sent. Members are sent in chunks, each inside
+        one modification window (see ModelBuilder). Requires NumPy.
+
+        Args:
+            connectivity (array_like): Connectivity table of shape (N, 3) to (N, 6), columns
+                [no, start_node_no, end_node_no, start_section_no, end_section_no, rotation_angle];
+                sections default to 1, end section to start section and rotation angle to 0.0
+            member_type (enum or list): Member Type Enumeration, one for all members or list with one per member;
+                TYPE_BEAM, TYPE_RIGID, TYPE_TRUSS, TYPE_TRUSS_ONLY_N, TYPE_TENSION, TYPE_COMPRESSION, TYPE_BUCKLING or TYPE_CABLE
+            hinges (array_like, optional): Shape (N, 2), [start_member_hinge_no, end_member_hinge_no], 0 for no hinge;
+                only for TYPE_BEAM and TYPE_RIGID
+            eccentricities (array_like, optional): Shape (N, 2), [start_member_eccentricity_no, end_member_eccentricity_no],
+                0 for no eccentricity
+            comment (str, optional): Comment of all members
+            chunk_size (int, optional): Number of members in one modification window
+            model (RFEM Class, optional): Model to be edited, can be ModelBuilder or Transaction
+        """
+        import numpy as np
+
+        connectivity = np.array(connectivity, dtype=float, ndmin=2)
+        if connectivity.ndim != 2 or not 3 <= connectivity.shape[1] <= 6:
+            raise ValueError('WARNING: Connectivity needs to be of shape (N, 3) to (N, 6), not %s.' % (connectivity.shape,))
+        count = len(connectivity)
+
+        table = np.zeros((count, 6))
+        table[:, 3:5] = 1
+        table[:, :connectivity.shape[1]] = connectivity
+        if connectivity.shape[1] == 4:
+            table[:, 4] = table[:, 3]
+
+        if np.any(table[:, :5] != np.round(table[:, :5])):
+            raise ValueError('WARNING: Member, node and section numbers need to be integers.')
+        numbers = table[:, 0].astype(int)
+
+        def invalid(mask, message):
+            if np.any(mask):
+                raise ValueError('WARNING: %s Members: %s' % (message, numbers[mask][:10].tolist()))
+
+        invalid(np.any(table[:, :5] < 1, axis=1), 'Member, node and section numbers need to be positive.')
+        invalid(table[:, 1] == table[:, 2], 'Start and end node need to be different.')
+        unique, counts = np.unique(numbers, return_counts=True)
+        invalid(np.isin(numbers, unique[counts > 1]), 'Member numbers need to be unique.')
+
+        types = [member_type] * count if isinstance(member_type, MemberType) else list(member_type)
+        if len(types) != count:
+            raise ValueError('WARNING: Member type needs to be given once or for every member.')
+        supported = (MemberType.TYPE_BEAM, MemberType.TYPE_RIGID, MemberType.TYPE_TRUSS, MemberType.TYPE_TRUSS_ONLY_N,
+                     MemberType.TYPE_TENSION, MemberType.TYPE_COMPRESSION, MemberType.TYPE_BUCKLING, MemberType.TYPE_CABLE)
+        invalid(np.array([t not in supported for t in types], dtype=bool), 'Member type is not supported.')
+
+        def pairs(values, name):
+            if values is None:
+                return None
+            values = np.array(values, ndmin=2)
+            if values.shape != (count, 2):
+                raise ValueError('WARNING: %s need to be of shape (%d, 2), not %s.' % (name, count, values.shape))
+            invalid(np.any(values < 0, axis=1), '%s need to be 0 or positive.' % name)
+            return values.astype(int).tolist()
+
+        hinges = pairs(hinges, 'Hinges')
+        eccentricities = pairs(eccentricities, 'Eccentricities')
+        if hinges:
+            hinged = np.array([t in (MemberType.TYPE_BEAM, MemberType.TYPE_RIGID) for t in types], dtype=bool)
+            invalid(~hinged & np.any(np.array(hinges) > 0, axis=1), 'Hinges can be assigned to beams and rigid members only.')
+
+        builder = model if isinstance(model, ModelBuilder) else ModelBuilder(model, chunk_size)
+
+        # Python scalars are serialized faster than NumPy scalars
+        rows = zip(numbers.tolist(), table[:, 1:5].astype(int).tolist(), table[:, 5].tolist(), types)
+        for i, (no, (node_start, node_end, section_start, section_end), rotation_angle, memberType) in enumerate(rows):
+            clientObject = createEmptyObject('ns0:member', model)
+            clientObject.no = no
+            clientObject.type = memberType.name
+            clientObject.node_start = node_start
+            clientObject.node_end = node_end
+            clientObject.rotation_angle = rotation_angle
+            if memberType != MemberType.TYPE_RIGID:
+                clientObject.section_start = section_start
+                clientObject.section_end = section_end
+            if hinges:
+                clientObject.member_hinge_start, clientObject.member_hinge_end = hinges[i]
+            if eccentricities:
+                clientObject.member_eccentricity_start, clientObject.member_eccentricity_end = eccentricities[i]
+            clientObject.comment = comment
+            builder.add('set_member', clientObject)
+
+        if builder is not model:
+            builder.flush()
 
     @staticmethod
-    def DeleteMember(members_no: str = '1 2', model = Model):
+    def DeleteMember(members_no: str = '1 2', loads: bool = False, model = Model):
 
         '''
         Args:
             members_no (str): Numbers of Members to be deleted
+            loads (bool, optional): Remove loads assigned to deleted objects as well
             model (RFEM Class, optional): Model to be edited
         '''
 
         # Delete from client model
-        for member in ConvertStrToListOfInt(members_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_MEMBER.name, member)
\ No newline at end of file
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_MEMBER: members_no}, loads, model=model)
\ No newline at end of file
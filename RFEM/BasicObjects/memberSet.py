@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SetType
 
 class MemberSet():
@@ -21,10 +22,7 @@ class MemberSet():
         '''
 
         # Client model | Member Set
-        clientObject = model.clientModel.factory.create('ns0:member_set')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set', model)
 
         # Member Set No.
         clientObject.no = no
@@ -43,11 +41,8 @@ class MemberSet():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Set to client model
-        model.clientModel.service.set_member_set(clientObject)
+        setObject('set_member_set', clientObject, model=model)
 
     @staticmethod
     def ContinuousMembers(
@@ -67,10 +62,7 @@ class MemberSet():
         '''
 
         # Client model | Member Set
-        clientObject = model.clientModel.factory.create('ns0:member_set')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set', model)
 
         # Member Set No.
         clientObject.no = no
@@ -89,11 +81,8 @@ class MemberSet():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Set to client model
-        model.clientModel.service.set_member_set(clientObject)
+        setObject('set_member_set', clientObject, model=model)
 
     @staticmethod
     def GroupOfmembers(
@@ -113,10 +102,7 @@ class MemberSet():
         '''
 
         # Client model | Member Set
-        clientObject = model.clientModel.factory.create('ns0:member_set')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set', model)
 
         # Member Set No.
         clientObject.no = no
@@ -135,8 +121,5 @@ class MemberSet():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Set to client model
-        model.clientModel.service.set_member_set(clientObject)
+        setObject('set_member_set', clientObject, model=model)
@@ -1,7 +1,10 @@
 from RFEM.enums import NodeType
 from RFEM.enums import NodeCoordinateSystemType
 from RFEM.enums import NodeReferenceType, ObjectTypes
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
+from RFEM.modelBuilder import ModelBuilder
 from math import pi
 
 class Node():
@@ -25,10 +28,7 @@ class Node():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Node
-        clientObject = model.clientModel.factory.create('ns0:node')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:node', model)
 
         # Node No.
         clientObject.no = no
@@ -46,11 +46,8 @@ class Node():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Node to client model
-        model.clientModel.service.set_node(clientObject)
+        setObject('set_node', clientObject, model=model)
 
     @staticmethod
     def Standard(
@@ -82,10 +79,7 @@ class Node():
         '''
 
         # Client model | Node
-        clientObject = model.clientModel.factory.create('ns0:node')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:node', model)
 
         # Node No.
         clientObject.no = no
@@ -136,11 +130,8 @@ class Node():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Node to client model
-        model.clientModel.service.set_node(clientObject)
+        setObject('set_node', clientObject, model=model)
 
 
     @staticmethod
@@ -177,10 +168,7 @@ class Node():
         '''
 
         # Client model | Node
-        clientObject = model.clientModel.factory.create('ns0:node')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:node', model)
 
         # Node No.
         clientObject.no = no
@@ -220,11 +208,8 @@ class Node():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Node to client model
-        model.clientModel.service.set_node(clientObject)
+        setObject('set_node', clientObject, model=model)
 
     @staticmethod
     def BetweenTwoPoints(
@@ -266,10 +251,7 @@ class Node():
         '''
 
         # Client model | Node
-        clientObject = model.clientModel.factory.create('ns0:node')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:node', model)
 
         # Node No.
         clientObject.no = no
@@ -310,11 +292,8 @@ class Node():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Node to client model
-        model.clientModel.service.set_node(clientObject)
+        setObject('set_node', clientObject, model=model)
 
     @staticmethod
     def OnLine(
@@ -344,10 +323,7 @@ class Node():
         '''
 
         # Client model | Node
-        clientObject = model.clientModel.factory.create('ns0:node')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:node', model)
 
         # Node No.
         clientObject.no = no
@@ -378,11 +354,8 @@ class Node():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Node to client model
-        model.clientModel.service.set_node(clientObject)
+        setObject('set_node', clientObject, model=model)
 
     @staticmethod
     def OnMember(
@@ -412,10 +385,7 @@ class Node():
         '''
 
         # Client model | Node
-        clientObject = model.clientModel.factory.create('ns0:node')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:node', model)
 
         # Node No.
         clientObject.no = no
@@ -446,21 +416,74 @@ class Node():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Node to client model
-        model.clientModel.service.set_node(clientObject)
+        setObject('set_node', clientObject, model=model)
+
+    @staticmethod
+    def FromArray(
+                 numbers,
+                 coordinates,
+                 coordinate_system_type = NodeCoordinateSystemType.COORDINATE_SYSTEM_CARTESIAN,
+                 comment: str = '',
+                 chunk_size: int = 1000,
+                 model = Model):
+
+        '''
+        Create many nodes at once. Nodes are sent in chunks, each inside one
+        modification window (see ModelBuilder). Requires NumPy.
+
+         Args:
+            numbers (array_like): Node Tags, shape (N,)
+            coordinates (array_like): Coordinates, shape (N, 3), in the same form as coordinate_system of Node.Standard;
+              angles are in degrees
+            coordinate_system_type (enum): Coordinate System Type Enumeration
+            comment (str, optional): Comment of all nodes
+            chunk_size (int, optional): Number of nodes in one modification window
+            model (RFEM Class, optional): Model to be edited, can be ModelBuilder or Transaction
+        '''
+        import numpy as np
+
+        numbers = np.asarray(numbers, dtype=int).ravel()
+        coordinates = np.array(coordinates, dtype=float, ndmin=2)
+        if coordinates.shape != (len(numbers), 3):
+            raise ValueError('WARNING: Coordinates need to be of shape (%d, 3), not %s.' % (len(numbers), coordinates.shape))
+
+        # Angles of Node.Standard, converted from degrees to radians
+        angleColumns = {
+            NodeCoordinateSystemType.COORDINATE_SYSTEM_X_CYLINDRICAL: [2],
+            NodeCoordinateSystemType.COORDINATE_SYSTEM_Y_CYLINDRICAL: [2],
+            NodeCoordinateSystemType.COORDINATE_SYSTEM_Z_CYLINDRICAL: [1],
+            NodeCoordinateSystemType.COORDINATE_SYSTEM_POLAR: [1, 2]}.get(coordinate_system_type, [])
+        coordinates[:, angleColumns] *= pi/180
+
+        builder = model if isinstance(model, ModelBuilder) else ModelBuilder(model, chunk_size)
+        cartesian = coordinate_system_type == NodeCoordinateSystemType.COORDINATE_SYSTEM_CARTESIAN
+
+        # Python scalars are serialized faster than NumPy scalars
+        for no, (coordinate_1, coordinate_2, coordinate_3) in zip(numbers.tolist(), coordinates.tolist()):
+            clientObject = createEmptyObject('ns0:node', model)
+            clientObject.no = no
+            if not cartesian:
+                clientObject.type = NodeType.TYPE_STANDARD.name
+                clientObject.coordinate_system_type = coordinate_system_type.name
+            clientObject.coordinate_1 = coordinate_1
+            clientObject.coordinate_2 = coordinate_2
+            clientObject.coordinate_3 = coordinate_3
+            clientObject.comment = comment
+            builder.add('set_node', clientObject)
+
+        if builder is not model:
+            builder.flush()
 
     @staticmethod
-    def DeleteNode(nodes_no: str = '1 2', model = Model):
+    def DeleteNode(nodes_no: str = '1 2', loads: bool = False, model = Model):
 
         '''
         Args:
             nodes_no (str): Numbers of Nodes to be deleted
+            loads (bool, optional): Remove loads assigned to deleted objects as well
             model (RFEM Class, optional): Model to be edited
         '''
 
         # Delete from client model
-        for node in ConvertStrToListOfInt(nodes_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_NODE.name, node)
\ No newline at end of file
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_NODE: nodes_no}, loads, model=model)
\ No newline at end of file
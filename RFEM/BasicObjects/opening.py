@@ -1,4 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
 from RFEM.enums import ObjectTypes
 
 class Opening():
@@ -19,10 +21,7 @@ class Opening():
         '''
 
         # Client model | Opening
-        clientObject = model.clientModel.factory.create('ns0:opening')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:opening', model)
 
         # Opening No.
         clientObject.no = no
@@ -38,21 +37,18 @@ class Opening():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Opening to client model
-        model.clientModel.service.set_opening(clientObject)
+        setObject('set_opening', clientObject, model=model)
 
     @staticmethod
-    def DeleteOpening(openings_no: str = '1 2', model = Model):
+    def DeleteOpening(openings_no: str = '1 2', loads: bool = False, model = Model):
 
         '''
         Args:
             openings_no (str): Numbers of Openings to be deleted
+            loads (bool, optional): Remove loads assigned to deleted objects as well
             model (RFEM Class, optional): Model to be edited
         '''
 
         # Delete from client model
-        for opening in ConvertStrToListOfInt(openings_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_OPENING.name, opening)
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_OPENING: openings_no}, loads, model=model)
@@ -1,4 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
 from RFEM.enums import ObjectTypes
 
 class Section():
@@ -21,10 +23,7 @@ class Section():
         '''
 
         # Client model | Section
-        clientObject = model.clientModel.factory.create('ns0:section')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:section', model)
 
         # Section No.
         clientObject.no = no
@@ -43,11 +42,8 @@ class Section():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Section to client model
-        model.clientModel.service.set_section(clientObject)
+        setObject('set_section', clientObject, model=model)
 
     @staticmethod
     def DeleteSection(sections_no: str = '1 2', model = Model):
@@ -59,5 +55,4 @@ class Section():
         '''
 
         # Delete from client model
-        for section in ConvertStrToListOfInt(sections_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_SECTION.name, section)
\ No newline at end of file
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_SECTION: sections_no}, model=model)
\ No newline at end of file
@@ -1,4 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
 from RFEM.enums import SolidType, ObjectTypes
 
 class Solid():
@@ -21,10 +23,7 @@ class Solid():
         '''
 
         # Client model | Solid
-        clientObject = model.clientModel.factory.create('ns0:solid')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid', model)
 
         # Solid No.
         clientObject.no = no
@@ -43,11 +42,8 @@ class Solid():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface to client model
-        model.clientModel.service.set_solid(clientObject)
+        setObject('set_solid', clientObject, model=model)
 
     @staticmethod
     def Standard(
@@ -69,10 +65,7 @@ class Solid():
         '''
 
         # Client model | Solid
-        clientObject = model.clientModel.factory.create('ns0:solid')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid', model)
 
         # Solid No.
         clientObject.no = no
@@ -94,11 +87,8 @@ class Solid():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface to client model
-        model.clientModel.service.set_solid(clientObject)
+        setObject('set_solid', clientObject, model=model)
 
     @staticmethod
     def Gas(
@@ -120,10 +110,7 @@ class Solid():
         '''
 
         # Client model | Solid
-        clientObject = model.clientModel.factory.create('ns0:solid')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid', model)
 
         # Solid No.
         clientObject.no = no
@@ -145,11 +132,8 @@ class Solid():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface to client model
-        model.clientModel.service.set_solid(clientObject)
+        setObject('set_solid', clientObject, model=model)
 
     @staticmethod
     def Contact(
@@ -171,10 +155,7 @@ class Solid():
         '''
 
         # Client model | Solid
-        clientObject = model.clientModel.factory.create('ns0:solid')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid', model)
 
         # Solid No.
         clientObject.no = no
@@ -196,11 +177,8 @@ class Solid():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface to client model
-        model.clientModel.service.set_solid(clientObject)
+        setObject('set_solid', clientObject, model=model)
 
     @staticmethod
     def Soil(
@@ -222,10 +200,7 @@ class Solid():
         '''
 
         # Client model | Solid
-        clientObject = model.clientModel.factory.create('ns0:solid')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid', model)
 
         # Solid No.
         clientObject.no = no
@@ -247,21 +222,18 @@ class Solid():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface to client model
-        model.clientModel.service.set_solid(clientObject)
+        setObject('set_solid', clientObject, model=model)
 
     @staticmethod
-    def DeleteSolid(solids_no: str = '1 2', model = Model):
+    def DeleteSolid(solids_no: str = '1 2', loads: bool = False, model = Model):
 
         '''
         Args:
             solids_no (str): Numbers of Solids to be deleted
+            loads (bool, optional): Remove loads assigned to deleted objects as well
             model (RFEM Class, optional): Model to be edited
         '''
 
         # Delete solids from client model
-        for solid in ConvertStrToListOfInt(solids_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_SOLID.name, solid)
\ No newline at end of file
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_SOLID: solids_no}, loads, model=model)
\ No newline at end of file
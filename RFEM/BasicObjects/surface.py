@@ -1,5 +1,8 @@
 from RFEM.enums import SurfaceGeometry, SurfaceLoadDistributionDirection, SurfaceType, ObjectTypes
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
+from RFEM.modelMirror import GetObject
 import math
 
 def CreateGeometryAndSetToModel(no, surface_type, boundary_lines_no, geometry_type, geometry_type_parameters, thickness = None, comment = None, params = None, model = Model):
@@ -24,10 +27,7 @@ def CreateGeometryAndSetToModel(no, surface_type, boundary_lines_no, geometry_ty
             model (RFEM Class, optional): Model to be edited
         '''
     # Client model | Surface
-    clientObject = model.clientModel.factory.create('ns0:surface')
-
-    # Clears object atributes | Sets all atributes to None
-    clearAttributes(clientObject)
+    clientObject = createEmptyObject('ns0:surface', model)
 
     # Surface No.
     clientObject.no = no
@@ -41,7 +41,10 @@ def CreateGeometryAndSetToModel(no, surface_type, boundary_lines_no, geometry_ty
         if len(geometry_type_parameters) != 4:
             raise ValueError('WARNING: The geometry type parameter needs to be of length 4. Kindly check list inputs for completeness and correctness.')
         for line in boundary_lines_list:
-            if model.clientModel.service.get_line(int(line))['type'] != 'TYPE_NURBS':
+            boundaryLine = GetObject(ObjectTypes.E_OBJECT_TYPE_LINE, int(line), model=model)
+            if boundaryLine is None:
+                raise ValueError('WARNING: Line %d of the NURBS surface does not exist' % int(line))
+            if boundaryLine['type'] != 'TYPE_NURBS':
                 raise ValueError('WARNING: For a NURBS Surface, the boundary lines need to be NURBS Curves')
         clientObject.nurbs_control_point_count_in_direction_u = geometry_type_parameters[0]
         clientObject.nurbs_control_point_count_in_direction_v = geometry_type_parameters[1]
@@ -83,7 +86,7 @@ def CreateGeometryAndSetToModel(no, surface_type, boundary_lines_no, geometry_ty
             clientObject[key] = params[key]
 
     # Add Surface to client model
-    model.clientModel.service.set_surface(clientObject)
+    setObject('set_surface', clientObject, model=model)
 
 class Surface():
     def __init__(self,
@@ -105,10 +108,7 @@ class Surface():
         '''
 
         # Client model | Surface
-        clientObject = model.clientModel.factory.create('ns0:surface')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface', model)
 
         # Surface No.
         clientObject.no = no
@@ -127,11 +127,8 @@ class Surface():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface to client model
-        model.clientModel.service.set_surface(clientObject)
+        setObject('set_surface', clientObject, model=model)
 
     @staticmethod
     def Standard(
@@ -320,10 +317,7 @@ class Surface():
         '''
 
         # Client model | Surface
-        clientObject = model.clientModel.factory.create('ns0:surface')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface', model)
 
         # Surface No.
         clientObject.no = no
@@ -368,21 +362,18 @@ class Surface():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface to client model
-        model.clientModel.service.set_surface(clientObject)
+        setObject('set_surface', clientObject, model=model)
 
     @staticmethod
-    def DeleteSurface(surfaces_no: str = '1 2', model = Model):
+    def DeleteSurface(surfaces_no: str = '1 2', loads: bool = False, model = Model):
 
         '''
         Args:
             surfaces_no (str): Numbers of Surfaces to be deleted
+            loads (bool, optional): Remove loads assigned to deleted objects as well
             model (RFEM Class, optional): Model to be edited
         '''
 
         # Delete surfaces from client model
-        for surface in ConvertStrToListOfInt(surfaces_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_SURFACE.name, surface)
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_SURFACE: surfaces_no}, loads, model=model)
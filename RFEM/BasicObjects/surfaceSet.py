@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SetType
 
 class SurfaceSet():
@@ -21,10 +22,7 @@ class SurfaceSet():
         '''
 
         # Client model | Surface Set
-        clientObject = model.clientModel.factory.create('ns0:surface_set')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set', model)
 
         # Surface Set No.
         clientObject.no = no
@@ -43,11 +41,8 @@ class SurfaceSet():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Set to client model
-        model.clientModel.service.set_surface_set(clientObject)
+        setObject('set_surface_set', clientObject, model=model)
 
     @staticmethod
     def ContinuousSurfaces(
@@ -67,10 +62,7 @@ class SurfaceSet():
         '''
 
         # Client model | Surface Set
-        clientObject = model.clientModel.factory.create('ns0:surface_set')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set', model)
 
         # Surface Set No.
         clientObject.no = no
@@ -89,11 +81,8 @@ class SurfaceSet():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Set to client model
-        model.clientModel.service.set_surface_set(clientObject)
+        setObject('set_surface_set', clientObject, model=model)
 
     @staticmethod
     def GroupOfSurfaces(
@@ -113,10 +102,7 @@ class SurfaceSet():
         '''
 
         # Client model | Surface Set
-        clientObject = model.clientModel.factory.create('ns0:surface_set')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set', model)
 
         # Surface Set No.
         clientObject.no = no
@@ -135,8 +121,5 @@ class SurfaceSet():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Set to client model
-        model.clientModel.service.set_surface_set(clientObject)
+        setObject('set_surface_set', clientObject, model=model)
@@ -2,7 +2,9 @@ from RFEM.enums import ThicknessDirection, ThicknessType, LayerType
 from RFEM.enums import ThicknessOrthotropyType, AddOn, ObjectTypes
 from RFEM.enums import ThicknessShapeOrthotropySelfWeightDefinitionType
 from RFEM.enums import ThicknessStiffnessMatrixSelfWeightDefinitionType
-from RFEM.initModel import Model, GetAddonStatus, clearAttributes, deleteEmptyAttributes, SetAddonStatus, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject, GetAddonStatus, SetAddonStatus
+from RFEM.fastSerializer import setObject
+from RFEM.bulkDelete import DeleteObjects
 from math import pi
 
 class Thickness():
@@ -27,10 +29,7 @@ class Thickness():
         '''
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -57,11 +56,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def Uniform(
@@ -85,10 +81,7 @@ class Thickness():
         '''
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -117,11 +110,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def Variable_3Nodes(
@@ -146,10 +136,7 @@ class Thickness():
         '''
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -185,11 +172,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def Variable_2NodesAndDirection(
@@ -215,10 +199,7 @@ class Thickness():
         '''
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -251,11 +232,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def Variable_4SurfaceCorners(
@@ -281,10 +259,7 @@ class Thickness():
         '''
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -322,11 +297,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def Variable_Circle(
@@ -351,10 +323,7 @@ class Thickness():
         '''
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -386,11 +355,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def Layers(
@@ -419,10 +385,7 @@ class Thickness():
             SetAddonStatus(model.clientModel, AddOn.multilayer_surfaces_design_active, True)
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -465,11 +428,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def ShapeOrthotropy(
@@ -519,10 +479,7 @@ class Thickness():
         '''
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -613,11 +570,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def StiffnessMatrix(
@@ -661,10 +615,7 @@ class Thickness():
         '''
 
         # Client model | Thickness
-        clientObject = model.clientModel.factory.create('ns0:thickness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:thickness', model)
 
         # Thickness No.
         clientObject.no = no
@@ -726,11 +677,8 @@ class Thickness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Thickness to client model
-        model.clientModel.service.set_thickness(clientObject)
+        setObject('set_thickness', clientObject, model=model)
 
     @staticmethod
     def DeleteThickness(thickness_no: str = '1 2', model = Model):
@@ -742,5 +690,4 @@ class Thickness():
         '''
 
         # Delete from client model
-        for thickness in ConvertStrToListOfInt(thickness_no):
-            model.clientModel.service.delete_object(ObjectTypes.E_OBJECT_TYPE_THICKNESS.name, thickness)
\ No newline at end of file
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_THICKNESS: thickness_no}, model=model)
\ No newline at end of file
@@ -1,5 +1,7 @@
-from RFEM.initModel import Model, GetAddonStatus
+from RFEM.initModel import Model, GetAddonStatus, notifyModel
+from RFEM.fastSerializer import setObject
 from RFEM.enums import AddOn
+from RFEM import modelMirror
 
 class MeshSettings():
     ComonMeshConfig: dict = {
@@ -151,7 +153,7 @@ class MeshSettings():
                     clientObject['windSimulationMeshConfig'][key] = windConfig[key]
 
         # Add Mesh Settings to client model
-        model.clientModel.service.set_mesh_settings(clientObject)
+        setObject('set_mesh_settings', clientObject, model=model)
 
     @staticmethod
     def set_mesh_settings(all_settings, model = Model):
@@ -164,10 +166,11 @@ class MeshSettings():
             else:
                 new_sett[i[0]] = all_settings[i[0]]
 
-        model.clientModel.service.set_mesh_settings(new_sett)
+        setObject('set_mesh_settings', new_sett, model=model)
 
 def GetModelInfo(model = Model):
-    return model.clientModel.service.get_model_info()
+    # Served by the mirror of the model, if there is one
+    return modelMirror.GetModelInfo(model)
 
 def GetMeshStatistics(model = Model):
     mesh_stats = model.clientModel.service.get_mesh_statistics()
@@ -175,6 +178,7 @@ def GetMeshStatistics(model = Model):
 
 def GenerateMesh(model = Model, skip_warnings = True):
     model.clientModel.service.generate_mesh(skip_warnings)
+    notifyModel(model.clientModel, 'generate_mesh', (skip_warnings,))
 
 def GetMeshSettings(model = Model):
     return model.clientModel.service.get_mesh_settings()
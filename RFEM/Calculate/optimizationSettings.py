@@ -1,5 +1,6 @@
 from RFEM.initModel import Model
-from RFEM.enums import *
+from RFEM.fastSerializer import setObject
+from RFEM.enums import OptimizeOnType, Optimizer
 
 class OptimizationSettings():
     def __init__(self,
@@ -29,7 +30,7 @@ class OptimizationSettings():
         opt_settings.general_number_random_mutations = general_number_random_mutations
 
         # Set Optimization settings to client model
-        model.clientModel.service.set_optimization_settings(opt_settings)
+        setObject('set_optimization_settings', opt_settings, model=model)
 
     @staticmethod
     def get(model = Model):
@@ -37,4 +38,4 @@ class OptimizationSettings():
 
     @staticmethod
     def set(opt_settings, model = Model):
-        model.clientModel.service.set_optimization_settings(opt_settings)
\ No newline at end of file
+        setObject('set_optimization_settings', opt_settings, model=model)
\ No newline at end of file
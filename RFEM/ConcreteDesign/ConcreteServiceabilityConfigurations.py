@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 
 class ConcreteServiceabilityConfiguration():
@@ -29,10 +30,7 @@ class ConcreteServiceabilityConfiguration():
         """
 
         # Client model | Concrete Durabilities
-        clientObject = model.clientModel.factory.create('ns0:concrete_design_sls_configuration')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:concrete_design_sls_configuration', model)
 
         # Concrete Durability No.
         clientObject.no = no
@@ -85,8 +83,5 @@ class ConcreteServiceabilityConfiguration():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Global Parameter to client model
-        model.clientModel.service.set_concrete_design_sls_configuration(clientObject)
+        setObject('set_concrete_design_sls_configuration', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import ResponseSpectrumDefinitionType
 
 class ResponseSpectrum():
@@ -28,10 +29,7 @@ class ResponseSpectrum():
         """
 
         # client model | response spectrum
-        clientObject = model.clientModel.factory.create('ns0:response_spectrum')
-
-        # clear object atributes | sets all the atributes to none
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:response_spectrum', model)
 
         # response spectrum no.
         clientObject.no = no
@@ -71,11 +69,8 @@ class ResponseSpectrum():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add global parameter to client model
-        model.clientModel.service.set_response_spectrum(clientObject)
+        setObject('set_response_spectrum', clientObject, model=model)
 
 
     @staticmethod
@@ -104,10 +99,7 @@ class ResponseSpectrum():
         """
 
         # client model | response spectrum
-        clientObject = model.clientModel.factory.create('ns0:response_spectrum')
-
-        # clear object atributes | sets all the atributes to none
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:response_spectrum', model)
 
         # response spectrum no.
         clientObject.no = no
@@ -147,10 +139,7 @@ class ResponseSpectrum():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # add global parameter to client model
-        model.clientModel.service.set_response_spectrum(clientObject)
+        setObject('set_response_spectrum', clientObject, model=model)
 
 
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import ImperfectionType, ImperfectionCaseDirection, DirectionForLevelDirection
 from RFEM.enums import ImperfectionCaseSourceType, ImperfectionCaseAssignmentType
 
@@ -33,10 +34,7 @@ class ImperfectionCase():
         """
 
         # Client model | Imperfection Case
-        clientObject = model.clientModel.factory.create('ns0:imperfection_case')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:imperfection_case', model)
 
         # Imperfection Case No.
         clientObject.no = no
@@ -66,11 +64,8 @@ class ImperfectionCase():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Imperfection Case to client model
-        model.clientModel.service.set_imperfection_case(clientObject)
+        setObject('set_imperfection_case', clientObject, model=model)
 
     @staticmethod
     def Local(
@@ -96,10 +91,7 @@ class ImperfectionCase():
         # usually assigned to load combinations.
 
         # Client model | Imperfection Case
-        clientObject = model.clientModel.factory.create('ns0:imperfection_case')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:imperfection_case', model)
 
         # Imperfection Case No.
         clientObject.no = no
@@ -126,11 +118,8 @@ class ImperfectionCase():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Imperfection Case to client model
-        model.clientModel.service.set_imperfection_case(clientObject)
+        setObject('set_imperfection_case', clientObject, model=model)
 
     @staticmethod
     def InitialSwayViaTable(
@@ -167,10 +156,7 @@ class ImperfectionCase():
         """
 
         # Client model | Imperfection Case
-        clientObject = model.clientModel.factory.create('ns0:imperfection_case')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:imperfection_case', model)
 
         # Imperfection Case No.
         clientObject.no = no
@@ -227,11 +213,8 @@ class ImperfectionCase():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Imperfection Case to client model
-        model.clientModel.service.set_imperfection_case(clientObject)
+        setObject('set_imperfection_case', clientObject, model=model)
 
     @staticmethod
     def NotionalLoads(
@@ -260,10 +243,7 @@ class ImperfectionCase():
         """
 
         # Client model | Imperfection Case
-        clientObject = model.clientModel.factory.create('ns0:imperfection_case')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:imperfection_case', model)
 
         # Imperfection Case No.
         clientObject.no = no
@@ -296,11 +276,8 @@ class ImperfectionCase():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Imperfection Case to client model
-        model.clientModel.service.set_imperfection_case(clientObject)
+        setObject('set_imperfection_case', clientObject, model=model)
 
     @staticmethod
     def StaticDeformation(
@@ -341,10 +318,7 @@ class ImperfectionCase():
         """
 
         # Client model | Imperfection Case
-        clientObject = model.clientModel.factory.create('ns0:imperfection_case')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:imperfection_case', model)
 
         # Imperfection Case No.
         clientObject.no = no
@@ -399,11 +373,8 @@ class ImperfectionCase():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Imperfection Case to client model
-        model.clientModel.service.set_imperfection_case(clientObject)
+        setObject('set_imperfection_case', clientObject, model=model)
 
     @staticmethod
     def Group(
@@ -432,10 +403,7 @@ class ImperfectionCase():
         """
 
         # Client model | Imperfection Case
-        clientObject = model.clientModel.factory.create('ns0:imperfection_case')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:imperfection_case', model)
 
         # Imperfection Case No.
         clientObject.no = no
@@ -478,8 +446,5 @@ class ImperfectionCase():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Imperfection Case to client model
-        model.clientModel.service.set_imperfection_case(clientObject)
+        setObject('set_imperfection_case', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import MemberImperfectionType, MemberImperfectionDefinitionType
 from RFEM.enums import ImperfectionDirection, MemberImperfectionActiveCriterion
 
@@ -33,10 +34,7 @@ class MemberSetImperfection():
         """
 
         # Client model | Imperfection Case
-        clientObject = model.clientModel.factory.create('ns0:member_set_imperfection')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_imperfection', model)
 
         # Member Imperfection No.
         clientObject.no = no
@@ -152,8 +150,5 @@ class MemberSetImperfection():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Imperfection to client model
-        model.clientModel.service.set_member_set_imperfection(imperfection_case, clientObject)
+        setObject('set_member_set_imperfection', imperfection_case, clientObject, model=model)
@@ -1,6 +1,7 @@
 import xmltodict
 import csv
 from RFEM.initModel import Model
+from RFEM.fastSerializer import setObject
 from RFEM.enums import IFCExportType, ObjectTypes
 
 def ExportDetailsOfDesignToCSV(targetDirectoryPath: str, model = Model):
@@ -143,7 +144,7 @@ def SetTableExportConfigManager(TableExportConfigManager, model = Model):
     Args:
         TableExportConfigManager (dict): Table export config
     '''
-    model.clientModel.service.set_table_export_config_manager(TableExportConfigManager)
+    setObject('set_table_export_config_manager', TableExportConfigManager, model=model)
 
 def ParseCSVResultsFromSelectedFileToDict(filePath: str):
 
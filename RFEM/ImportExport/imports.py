@@ -1,4 +1,4 @@
-from RFEM.initModel import client
+from RFEM.initModel import Model, client, notifyModel
 
 def importFrom(targetFilePath: str):
     '''
@@ -8,6 +8,9 @@ def importFrom(targetFilePath: str):
         targetFilePath (string): Destination path to the file
     '''
     client.service.import_from(targetFilePath)
+    # Objects of the active model are replaced
+    if Model.clientModel:
+        notifyModel(Model.clientModel, 'import_from', (targetFilePath,))
 
 def getConversionTables():
     '''
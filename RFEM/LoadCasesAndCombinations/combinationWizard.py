@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import LoadWizardType, InitialStateDefintionType
 
 class CombinationWizard():
@@ -37,10 +38,7 @@ class CombinationWizard():
             model (RFEM Class, optional): Model to be edited
         """
         #  Client Model | Combination Wizard
-        clientObject = model.clientModel.factory.create('ns0:combination_wizard')
-
-        # Clear all attributes
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:combination_wizard', model)
 
         # Set Combination Wizard no.
         clientObject.no = no
@@ -98,11 +96,8 @@ class CombinationWizard():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Clearing unused attributes
-        deleteEmptyAttributes(clientObject)
-
         # Setting the combination wizard
-        model.clientModel.service.set_combination_wizard(clientObject)
+        setObject('set_combination_wizard', clientObject, model=model)
 
     # Setting result combination
     @staticmethod
@@ -133,10 +128,7 @@ class CombinationWizard():
             model (RFEM Class, optional): Model to be edited
         """
         # Client Model | Combination Wizard
-        clientObject = model.clientModel.factory.create('ns0:combination_wizard')
-
-        # Clear all attributes
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:combination_wizard', model)
 
         # Set Combination Wizard no.
         clientObject.no = no
@@ -180,8 +172,5 @@ class CombinationWizard():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Clearing unused attributes
-        deleteEmptyAttributes(clientObject)
-
         # Setting the combination wizard
-        model.clientModel.service.set_combination_wizard(clientObject)
+        setObject('set_combination_wizard', clientObject, model=model)
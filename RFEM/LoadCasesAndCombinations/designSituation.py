@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import DesignSituationType
 
 class DesignSituation():
@@ -24,10 +25,7 @@ class DesignSituation():
         """
 
         # Client model | Design Situation
-        clientObject = model.clientModel.factory.create('ns0:design_situation')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:design_situation', model)
 
         # Design Situation No.
         clientObject.no = no
@@ -51,8 +49,5 @@ class DesignSituation():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Design Situation to client model
-        model.clientModel.service.set_design_situation(clientObject)
+        setObject('set_design_situation', clientObject, model=model)
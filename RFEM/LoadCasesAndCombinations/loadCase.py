@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import AnalysisType, ActionCategoryType
 from RFEM.LoadCasesAndCombinations.loadCasesAndCombinations import LoadCasesAndCombinations
 
@@ -26,10 +27,7 @@ class LoadCase():
         '''
 
         # Client model | Load Case
-        clientObject = model.clientModel.factory.create('ns0:load_case')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:load_case', model)
 
         # Load Case No.
         clientObject.no = no
@@ -71,11 +69,8 @@ class LoadCase():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Case to client model
-        model.clientModel.service.set_load_case(clientObject)
+        setObject('set_load_case', clientObject, model=model)
 
     @staticmethod
     def StaticAnalysis(
@@ -106,10 +101,7 @@ class LoadCase():
         '''
 
         # Client model | Load Case
-        clientObject = model.clientModel.factory.create('ns0:load_case')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:load_case', model)
 
         # Load Case No.
         clientObject.no = no
@@ -151,8 +143,5 @@ class LoadCase():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Case to client model
-        model.clientModel.service.set_load_case(clientObject)
+        setObject('set_load_case', clientObject, model=model)
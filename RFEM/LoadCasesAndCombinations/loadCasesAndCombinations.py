@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from enum import Enum
 
 class LoadCasesAndCombinations():
@@ -149,10 +150,7 @@ class LoadCasesAndCombinations():
         """
 
         # Client model | Load Cases And Combinations
-        clientObject = model.clientModel.factory.create('ns0:load_cases_and_combinations')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:load_cases_and_combinations', model)
 
         # Adding optional parameters via dictionary
         if params:
@@ -160,7 +158,7 @@ class LoadCasesAndCombinations():
                 clientObject[key] = params[key]
 
         # Set Load Case And Combinations to client model
-        model.clientModel.service.set_load_cases_and_combinations(clientObject)
+        setObject('set_load_cases_and_combinations', clientObject, model=model)
 
     @staticmethod
     def getAvailableLoadActionCategoryTypes(model=Model):
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import AnalysisType
 
 class LoadCombination():
@@ -38,10 +39,7 @@ class LoadCombination():
         '''
 
         # Client model | Load Combination
-        clientObject = model.clientModel.factory.create('ns0:load_combination')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:load_combination', model)
 
         # Load Combination No.
         clientObject.no = no
@@ -114,8 +112,5 @@ class LoadCombination():
 
             clientObject.items.load_combination_items.append(mlvlp)
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Combination to client model
-        model.clientModel.service.set_load_combination(clientObject)
+        setObject('set_load_combination', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import ModalSolutionMethod, ModalMassConversionType, ModalMassMatrixType, ModalNeglectMasses
 
 class ModalAnalysisSettings():
@@ -30,10 +31,7 @@ class ModalAnalysisSettings():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface
-        clientObject = model.clientModel.factory.create('ns0:modal_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:modal_analysis_settings', model)
 
         # Static Analysis Settings No.
         clientObject.no = no
@@ -78,8 +76,5 @@ class ModalAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Static Analysis Settings to client model
-        model.clientModel.service.set_modal_analysis_settings(clientObject)
+        setObject('set_modal_analysis_settings', clientObject, model=model)
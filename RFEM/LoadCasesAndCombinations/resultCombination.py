@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 
 class ResultCombination():
 
@@ -17,10 +18,7 @@ class ResultCombination():
         '''
 
         # Client model | Result Combination
-        clientObject = model.clientModel.factory.create('ns0:result_combination')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:result_combination', model)
 
         # Result Combination No.
         clientObject.no = no
@@ -33,8 +31,5 @@ class ResultCombination():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Result Combination to client model
-        model.clientModel.service.set_result_combination(clientObject)
+        setObject('set_result_combination', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, GetAddonStatus, SetAddonStatus
+from RFEM.initModel import Model, createEmptyObject, GetAddonStatus, SetAddonStatus
+from RFEM.fastSerializer import setObject
 from RFEM.enums import DirectionalComponentCombinationRule, PeriodicResponseCombinationRule, CqsDampingRule, AddOn
 
 class SpectralAnalysisSettings():
@@ -39,10 +40,7 @@ class SpectralAnalysisSettings():
             SetAddonStatus(Model.clientModel, AddOn.spectral_active)
 
         # Client model | Surface
-        clientObject = model.clientModel.factory.create('ns0:spectral_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:spectral_analysis_settings', model)
 
         # Static Analysis Settings No.
         clientObject.no = no
@@ -88,8 +86,5 @@ class SpectralAnalysisSettings():
         if params:
             for key in params:
                 clientObject[key] = params[key]
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Static Analysis Settings to client model
-        model.clientModel.service.set_spectral_analysis_settings(clientObject)
+        setObject('set_spectral_analysis_settings', clientObject, model=model)
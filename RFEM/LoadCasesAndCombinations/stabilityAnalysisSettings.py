@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import StabilityAnalysisSettingsAnalysisType
 from RFEM.enums import StabilityAnalysisSettingsEigenvalueMethod
 from RFEM.enums import StabilityAnalysisSettingsMatrixType
@@ -21,10 +22,7 @@ class StabilityAnalysisSettings():
         '''
 
         # Client model | Stability Analysis Settings
-        clientObject = model.clientModel.factory.create('ns0:stability_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:stability_analysis_settings', model)
 
         # Stability Analysis Settings No.
         clientObject.no = no
@@ -54,11 +52,8 @@ class StabilityAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Stability Analysis Settings to client model
-        model.clientModel.service.set_stability_analysis_settings(clientObject)
+        setObject('set_stability_analysis_settings', clientObject, model=model)
 
     @staticmethod
     def EigenvalueMethod(
@@ -102,10 +97,7 @@ class StabilityAnalysisSettings():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Stability Analysis Settings
-        clientObject = model.clientModel.factory.create('ns0:stability_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:stability_analysis_settings', model)
 
         # Stability Analysis Settings No.
         clientObject.no = no
@@ -154,11 +146,8 @@ class StabilityAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Stability Analysis Settings to client model
-        model.clientModel.service.set_stability_analysis_settings(clientObject)
+        setObject('set_stability_analysis_settings', clientObject, model=model)
 
     @staticmethod
     def IncrementalyMethodWithEigenvalue(
@@ -227,10 +216,7 @@ class StabilityAnalysisSettings():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Stability Analysis Settings
-        clientObject = model.clientModel.factory.create('ns0:stability_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:stability_analysis_settings', model)
 
         # Stability Analysis Settings No.
         clientObject.no = no
@@ -302,11 +288,8 @@ class StabilityAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Stability Analysis Settings to client model
-        model.clientModel.service.set_stability_analysis_settings(clientObject)
+        setObject('set_stability_analysis_settings', clientObject, model=model)
 
     @staticmethod
     def IncrementalyMethodWithoutEigenvalue(
@@ -361,10 +344,7 @@ class StabilityAnalysisSettings():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Stability Analysis Settings
-        clientObject = model.clientModel.factory.create('ns0:stability_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:stability_analysis_settings', model)
 
         # Stability Analysis Settings No.
         clientObject.no = no
@@ -419,8 +399,5 @@ class StabilityAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Stability Analysis Settings to client model
-        model.clientModel.service.set_stability_analysis_settings(clientObject)
+        setObject('set_stability_analysis_settings', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import StaticAnalysisSettingsIterativeMethodForNonlinearAnalysis
 from RFEM.enums import StaticAnalysisSettingsMethodOfEquationSystem
 from RFEM.enums import StaticAnalysisSettingsPlateBendingTheory, StaticAnalysisType
@@ -22,10 +23,7 @@ class StaticAnalysisSettings():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface
-        clientObject = model.clientModel.factory.create('ns0:static_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:static_analysis_settings', model)
 
         # Static Analysis Settings No.
         clientObject.no = no
@@ -46,11 +44,8 @@ class StaticAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Static Analysis Settings to client model
-        model.clientModel.service.set_static_analysis_settings(clientObject)
+        setObject('set_static_analysis_settings', clientObject, model=model)
 
     @staticmethod
     def GeometricallyLinear(
@@ -84,10 +79,7 @@ class StaticAnalysisSettings():
         """
 
         # Client model
-        clientObject = model.clientModel.factory.create('ns0:static_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:static_analysis_settings', model)
 
         # Static Analysis Settings No.
         clientObject.no = no
@@ -132,11 +124,8 @@ class StaticAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Static Analysis Settings to client model
-        model.clientModel.service.set_static_analysis_settings(clientObject)
+        setObject('set_static_analysis_settings', clientObject, model=model)
 
     @staticmethod
     def LargeDeformation(
@@ -184,10 +173,7 @@ class StaticAnalysisSettings():
         """
 
         # Client model
-        clientObject = model.clientModel.factory.create('ns0:static_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:static_analysis_settings', model)
 
         # Static Analysis Settings No.
         clientObject.no = no
@@ -257,11 +243,8 @@ class StaticAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Static Analysis Settings to client model
-        model.clientModel.service.set_static_analysis_settings(clientObject)
+        setObject('set_static_analysis_settings', clientObject, model=model)
 
     @staticmethod
     def SecondOrderPDelta(
@@ -307,10 +290,7 @@ class StaticAnalysisSettings():
         """
 
         # Client model
-        clientObject = model.clientModel.factory.create('ns0:static_analysis_settings')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:static_analysis_settings', model)
 
         # Static Analysis Settings No.
         clientObject.no = no
@@ -379,8 +359,5 @@ class StaticAnalysisSettings():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Static Analysis Settings to client model
-        model.clientModel.service.set_static_analysis_settings(clientObject)
+        setObject('set_static_analysis_settings', clientObject, model=model)
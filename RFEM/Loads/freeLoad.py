@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import FreeConcentratedLoadLoadType, FreeConcentratedLoadLoadDirection, FreeLoadLoadProjection
 from RFEM.enums import FreeLineLoadLoadDistribution, FreeLineLoadLoadDirection, FreeRectangularLoadLoadDistribution
 from RFEM.enums import FreeRectangularLoadLoadDirection, FreeRectangularLoadLoadLocationRectangle, FreeCircularLoadLoadDistribution
@@ -41,10 +42,7 @@ class FreeLoad():
         '''
 
         # Client model | Free Concentrated Load
-        clientObject = model.clientModel.factory.create('ns0:free_concentrated_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:free_concentrated_load', model)
 
         # Load No.
         clientObject.no = no
@@ -79,11 +77,8 @@ class FreeLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Free Concentrated Load to client model
-        model.clientModel.service.set_free_concentrated_load(load_case_no, clientObject)
+        setObject('set_free_concentrated_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def LineLoad(
@@ -117,10 +112,7 @@ class FreeLoad():
         '''
 
         # Client model | Free Concentrated Load
-        clientObject = model.clientModel.factory.create('ns0:free_line_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:free_line_load', model)
 
         # Load No.
         clientObject.no = no
@@ -167,11 +159,8 @@ class FreeLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Free Concentrated Load to client model
-        model.clientModel.service.set_free_line_load(load_case_no, clientObject)
+        setObject('set_free_line_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def RectangularLoad(
@@ -227,10 +216,7 @@ class FreeLoad():
         '''
 
         # Client model | Free Concentrated Load
-        clientObject = model.clientModel.factory.create('ns0:free_rectangular_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:free_rectangular_load', model)
 
         # Load No.
         clientObject.no = no
@@ -445,11 +431,8 @@ class FreeLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Free Concentrated Load to client model
-        model.clientModel.service.set_free_rectangular_load(load_case_no, clientObject)
+        setObject('set_free_rectangular_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def CircularLoad(
@@ -483,10 +466,7 @@ class FreeLoad():
         '''
 
         # Client model | Free Concentrated Load
-        clientObject = model.clientModel.factory.create('ns0:free_circular_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:free_circular_load', model)
 
         # Load No.
         clientObject.no = no
@@ -532,11 +512,8 @@ class FreeLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Free Concentrated Load to client model
-        model.clientModel.service.set_free_circular_load(load_case_no, clientObject)
+        setObject('set_free_circular_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def PolygonLoad(
@@ -580,10 +557,7 @@ class FreeLoad():
         '''
 
         # Client model | Free Concentrated Load
-        clientObject = model.clientModel.factory.create('ns0:free_polygon_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:free_polygon_load', model)
 
         # Load No.
         clientObject.no = no
@@ -644,8 +618,5 @@ class FreeLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Free Concentrated Load to client model
-        model.clientModel.service.set_free_polygon_load(load_case_no, clientObject)
+        setObject('set_free_polygon_load', load_case_no, clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class ImposedLineDeformation():
 
@@ -30,10 +31,7 @@ class ImposedLineDeformation():
         '''
 
         # Client model | Imposed Line Deformation
-        clientObject = model.clientModel.factory.create('ns0:imposed_line_deformation')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:imposed_line_deformation', model)
 
         # Load No.
         clientObject.no = no
@@ -52,8 +50,5 @@ class ImposedLineDeformation():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Support to client model
-        model.clientModel.service.set_imposed_line_deformation(load_case_no, clientObject)
+        setObject('set_imposed_line_deformation', load_case_no, clientObject, model=model)
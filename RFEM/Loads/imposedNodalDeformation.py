@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class ImposedNodalDeformation():
 
@@ -23,10 +24,7 @@ class ImposedNodalDeformation():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Imposed Nodal Deformation
-        clientObject = model.clientModel.factory.create('ns0:imposed_nodal_deformation')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:imposed_nodal_deformation', model)
 
         # Load No.
         clientObject.no = no
@@ -35,8 +33,7 @@ class ImposedNodalDeformation():
         clientObject.load_case = load_case_no
 
         # Assigned Node No.
-        #clientObject.node_no = ConvertToDlString(node_no()
-        clientObject.nodes = node_no
+        clientObject.nodes = ConvertToDlString(node_no)
 
         # Load Parameter
         clientObject.imposed_displacement_x = load_parameter[0]
@@ -55,8 +52,5 @@ class ImposedNodalDeformation():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Imposed Nodal Deformation to client model
-        model.clientModel.service.set_imposed_nodal_deformation(load_case_no, clientObject)
+        setObject('set_imposed_nodal_deformation', load_case_no, clientObject, model=model)
@@ -1,5 +1,6 @@
-from RFEM.initModel import Model, ConvertToDlString, clearAttributes, deleteEmptyAttributes
-from RFEM.enums import *
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.enums import LoadDirectionType, LineLoadType, LineLoadDistribution, LineLoadDirection
 
 class LineLoad():
 
@@ -26,10 +27,7 @@ class LineLoad():
         '''
 
         # Client model | Line Load
-        clientObject = model.clientModel.factory.create('ns0:line_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_load', model)
 
         # Line Load No.
         clientObject.no = no
@@ -62,11 +60,8 @@ class LineLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Line Load to client model
-        model.clientModel.service.set_line_load(load_case_no, clientObject)
+        setObject('set_line_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Force(
@@ -118,10 +113,7 @@ class LineLoad():
         '''
 
         # Client model | Line Load
-        clientObject = model.clientModel.factory.create('ns0:line_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_load', model)
 
         # Line Load No.
         clientObject.no = no
@@ -309,11 +301,8 @@ class LineLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Line Load to client model
-        model.clientModel.service.set_line_load(load_case_no, clientObject)
+        setObject('set_line_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Moment(
@@ -363,10 +352,7 @@ class LineLoad():
         '''
 
         # Client model | Line Load
-        clientObject = model.clientModel.factory.create('ns0:line_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_load', model)
 
         # Line Load No.
         clientObject.no = no
@@ -554,11 +540,8 @@ class LineLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Line Load to client model
-        model.clientModel.service.set_line_load(load_case_no, clientObject)
+        setObject('set_line_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Mass(
@@ -587,10 +570,7 @@ class LineLoad():
         '''
 
         # Client model | Line Load
-        clientObject = model.clientModel.factory.create('ns0:line_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_load', model)
 
         # Line Load No.
         clientObject.no = no
@@ -634,8 +614,5 @@ class LineLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Line Load to client model
-        model.clientModel.service.set_line_load(load_case_no, clientObject)
+        setObject('set_line_load', load_case_no, clientObject, model=model)
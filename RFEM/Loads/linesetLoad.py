@@ -1,5 +1,6 @@
-from RFEM.initModel import Model, ConvertToDlString, clearAttributes, deleteEmptyAttributes
-from RFEM.enums import *
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.enums import LineSetLoadType, LineSetLoadDistribution, LineSetLoadDirection
 
 class LineSetLoad():
 
@@ -29,10 +30,7 @@ class LineSetLoad():
         '''
 
         # Client model | Lineset Load
-        clientObject = model.clientModel.factory.create('ns0:line_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_set_load', model)
 
         # Lineset Load No.
         clientObject.no = no
@@ -65,11 +63,8 @@ class LineSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Lineset Load to client model
-        model.clientModel.service.set_line_set_load(load_case_no, clientObject)
+        setObject('set_line_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Force(
@@ -120,10 +115,7 @@ class LineSetLoad():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Lineset Load
-        clientObject = model.clientModel.factory.create('ns0:line_set_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_set_load', model)
 
         # Lineset Load No.
         clientObject.no = no
@@ -224,11 +216,11 @@ class LineSetLoad():
                 clientObject.distance_b_relative = load_parameter[5]
 
         elif load_distribution.name == "LOAD_DISTRIBUTION_CONCENTRATED_VARYING":
-            clientObject.varying_load_parameters = Model.clientModel.factory.create('ns0:line_load.varying_load_parameters')
+            clientObject.varying_load_parameters = model.clientModel.factory.create('ns0:line_load.varying_load_parameters')
             for i,j in enumerate(load_parameter):
                 if len(load_parameter[i]) != 3:
                     raise ValueError("WARNING: LineLoad no: %x, load case: %x - Wrong data input." % (no, load_case_no))
-                mlvlp = Model.clientModel.factory.create('ns0:line_set_load_varying_load_parameters_row')
+                mlvlp = model.clientModel.factory.create('ns0:line_set_load_varying_load_parameters_row')
                 mlvlp.no = i+1
                 mlvlp.row.distance = load_parameter[i][0]
                 mlvlp.row.delta_distance = load_parameter[i][1]
@@ -285,11 +277,11 @@ class LineSetLoad():
             clientObject.magnitude_3 = load_parameter[2]
 
         elif load_distribution.name == "LOAD_DISTRIBUTION_VARYING":
-            clientObject.varying_load_parameters = Model.clientModel.factory.create('ns0:line_set_load.varying_load_parameters')
+            clientObject.varying_load_parameters = model.clientModel.factory.create('ns0:line_set_load.varying_load_parameters')
             for i,j in enumerate(load_parameter):
                 if len(load_parameter[i]) != 3:
                     raise ValueError("WARNING: LineLoad no: %x, load case: %x - Wrong data input." % (no, load_case_no))
-                mlvlp = Model.clientModel.factory.create('ns0:line_set_load_varying_load_parameters_row')
+                mlvlp = model.clientModel.factory.create('ns0:line_set_load_varying_load_parameters_row')
                 mlvlp.no = i+1
                 mlvlp.row.distance = load_parameter[i][0]
                 mlvlp.row.delta_distance = load_parameter[i][1]
@@ -312,11 +304,8 @@ class LineSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Line Load to client model
-        model.clientModel.service.set_line_set_load(load_case_no, clientObject)
+        setObject('set_line_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Moment(
@@ -364,10 +353,7 @@ class LineSetLoad():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Lineset Load
-        clientObject = model.clientModel.factory.create('ns0:line_set_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_set_load', model)
 
         # Lineset Load No.
         clientObject.no = no
@@ -468,12 +454,12 @@ class LineSetLoad():
                 clientObject.distance_b_relative = load_parameter[5]
 
         elif load_distribution.name == "LOAD_DISTRIBUTION_CONCENTRATED_VARYING":
-            clientObject.varying_load_parameters = Model.clientModel.factory.create('ns0:line_load.varying_load_parameters')
+            clientObject.varying_load_parameters = model.clientModel.factory.create('ns0:line_load.varying_load_parameters')
 
             for i,j in enumerate(load_parameter):
                 if len(load_parameter[i]) != 3:
                     raise ValueError("WARNING: LineLoad no: %x, load case: %x - Wrong data input." % (no, load_case_no))
-                mlvlp = Model.clientModel.factory.create('ns0:line_set_load_varying_load_parameters_row')
+                mlvlp = model.clientModel.factory.create('ns0:line_set_load_varying_load_parameters_row')
                 mlvlp.no = i+1
                 mlvlp.row.distance = load_parameter[i][0]
                 mlvlp.row.delta_distance = load_parameter[i][1]
@@ -530,11 +516,11 @@ class LineSetLoad():
             clientObject.magnitude_3 = load_parameter[2]
 
         elif load_distribution.name == "LOAD_DISTRIBUTION_VARYING":
-            clientObject.varying_load_parameters = Model.clientModel.factory.create('ns0:line_set_load.varying_load_parameters')
+            clientObject.varying_load_parameters = model.clientModel.factory.create('ns0:line_set_load.varying_load_parameters')
             for i,j in enumerate(load_parameter):
                 if len(load_parameter[i]) != 3:
                     raise ValueError("WARNING: LineLoad no: %x, load case: %x - Wrong data input." % (no, load_case_no))
-                mlvlp = Model.clientModel.factory.create('ns0:line_set_load_varying_load_parameters_row')
+                mlvlp = model.clientModel.factory.create('ns0:line_set_load_varying_load_parameters_row')
                 mlvlp.no = i+1
                 mlvlp.row.distance = load_parameter[i][0]
                 mlvlp.row.delta_distance = load_parameter[i][1]
@@ -557,11 +543,8 @@ class LineSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Lineset Load to client model
-        model.clientModel.service.set_line_set_load(load_case_no, clientObject)
+        setObject('set_line_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Mass(
@@ -590,10 +573,7 @@ class LineSetLoad():
         '''
 
         # Client model | Line Load
-        clientObject = model.clientModel.factory.create('ns0:line_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_set_load', model)
 
         # Line Load No.
         clientObject.no = no
@@ -637,8 +617,5 @@ class LineSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Line Load to client model
-        model.clientModel.service.set_line_set_load(load_case_no, clientObject)
+        setObject('set_line_set_load', load_case_no, clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import LoadDirectionType, MemberLoadType, MemberLoadDistribution, MemberLoadDirection, MemberLoadDirectionOrientation
 from RFEM.enums import MemberLoadEccentricityHorizontalAlignment, MemberLoadEccentricityVerticalAlignment, MemberLoadEccentricitySectionMiddle
 from RFEM.enums import MemberLoadAxisDefinitionType, MemberLoadAxisDefinitionAxisOrientation, MemberLoadAxisDefinition
@@ -26,10 +27,7 @@ class MemberLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -62,11 +60,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Force(
@@ -129,10 +124,7 @@ class MemberLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -357,11 +349,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Moment(
@@ -409,10 +398,7 @@ class MemberLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -582,11 +568,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Mass(
@@ -614,10 +597,7 @@ class MemberLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -653,11 +633,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Temperature(
@@ -702,10 +679,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -813,11 +787,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def TemperatureChange(
@@ -862,10 +833,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -973,11 +941,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def AxialStrain(
@@ -1019,10 +984,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1122,11 +1084,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def AxialDisplacement(
@@ -1152,10 +1111,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1187,11 +1143,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Precamber(
@@ -1233,10 +1186,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1336,11 +1286,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def InitialPrestress(
@@ -1366,10 +1313,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1401,11 +1345,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Displacement(
@@ -1457,10 +1398,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1635,11 +1573,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Rotation(
@@ -1691,10 +1626,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1869,11 +1801,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def PipeContentFull(
@@ -1899,10 +1828,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1937,11 +1863,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def PipeContentPartial(
@@ -1969,10 +1892,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -2010,11 +1930,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def PipeInternalPressure(
@@ -2038,10 +1955,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -2073,11 +1987,8 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
+        setObject('set_member_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def RotaryMotion(
@@ -2113,10 +2024,7 @@ class MemberLoad():
         '''
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -2166,8 +2074,5 @@ class MemberLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_load(load_case_no, clientObject)
\ No newline at end of file
+        setObject('set_member_load', load_case_no, clientObject, model=model)
\ No newline at end of file
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import MemberSetLoadType, LoadDirectionType, MemberSetLoadDistribution, MemberSetLoadDirection, MemberSetLoadDirectionOrientation
 from RFEM.enums import MemberSetLoadEccentricityHorizontalAlignment, MemberSetLoadEccentricityVerticalAlignment, MemberSetLoadEccentricitySectionMiddle
 from RFEM.enums import MemberSetLoadAxisDefinitionType, MemberSetLoadAxisDefinitionAxisOrientation, MemberSetLoadAxisDefinition
@@ -27,10 +28,7 @@ class MemberSetLoad():
         """
 
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -63,11 +61,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Force(
@@ -128,10 +123,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -387,11 +379,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Moment(
@@ -437,10 +426,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -626,11 +612,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Mass(
@@ -654,10 +637,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -695,11 +675,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Temperature(
@@ -740,10 +717,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -864,11 +838,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def TemperatureChange(
@@ -909,10 +880,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1027,11 +995,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def AxialStrain(
@@ -1072,10 +1037,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1182,11 +1144,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def AxialDisplacement(
@@ -1210,10 +1169,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1245,11 +1201,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Precamber(
@@ -1290,10 +1243,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1401,11 +1351,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def InitialPrestress(
@@ -1429,10 +1376,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1464,11 +1408,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Displacement(
@@ -1516,10 +1457,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1712,11 +1650,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Rotation(
@@ -1764,10 +1699,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -1960,11 +1892,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def PipeContentFull(
@@ -1988,10 +1917,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -2026,11 +1952,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def PipeContentPartial(
@@ -2056,10 +1979,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -2097,11 +2017,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def PipeInternalPressure(
@@ -2123,10 +2040,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -2158,11 +2072,8 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def RotaryMotion(
@@ -2196,10 +2107,7 @@ class MemberSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Member Load
-        clientObject = model.clientModel.factory.create('ns0:member_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_set_load', model)
 
         # Member Load No.
         clientObject.no = no
@@ -2249,8 +2157,5 @@ class MemberSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Load Member Load to client model
-        model.clientModel.service.set_member_set_load(load_case_no, clientObject)
+        setObject('set_member_set_load', load_case_no, clientObject, model=model)
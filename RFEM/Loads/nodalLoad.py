@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import LoadDirectionType, NodalLoadType, NodalLoadSpecificDirectionType
 
 class NodalLoad():
@@ -24,10 +25,7 @@ class NodalLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Nodal Force
-        clientObject = model.clientModel.factory.create('ns0:nodal_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_load', model)
 
         # Nodal Force No.
         clientObject.no = no
@@ -56,11 +54,8 @@ class NodalLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Force to client model
-        model.clientModel.service.set_nodal_load(load_case_no, clientObject)
+        setObject('set_nodal_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Force(
@@ -104,10 +99,7 @@ class NodalLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Nodal Force
-        clientObject = model.clientModel.factory.create('ns0:nodal_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_load', model)
 
         # Nodal Force No.
         clientObject.no = no
@@ -204,11 +196,8 @@ class NodalLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Force to client model
-        model.clientModel.service.set_nodal_load(load_case_no, clientObject)
+        setObject('set_nodal_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Moment(
@@ -248,10 +237,7 @@ class NodalLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Nodal Force
-        clientObject = model.clientModel.factory.create('ns0:nodal_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_load', model)
 
         # Nodal Force No.
         clientObject.no = no
@@ -330,11 +316,8 @@ class NodalLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Force to client model
-        model.clientModel.service.set_nodal_load(load_case_no, clientObject)
+        setObject('set_nodal_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Components(
@@ -373,10 +356,7 @@ class NodalLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Nodal Force
-        clientObject = model.clientModel.factory.create('ns0:nodal_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_load', model)
 
         # Nodal Force No.
         clientObject.no = no
@@ -472,11 +452,8 @@ class NodalLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Force to client model
-        model.clientModel.service.set_nodal_load(load_case_no, clientObject)
+        setObject('set_nodal_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Mass(
@@ -504,10 +481,7 @@ class NodalLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Nodal Force
-        clientObject = model.clientModel.factory.create('ns0:nodal_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_load', model)
 
         # Nodal Force No.
         clientObject.no = no
@@ -546,8 +520,5 @@ class NodalLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Force to client model
-        model.clientModel.service.set_nodal_load(load_case_no, clientObject)
+        setObject('set_nodal_load', load_case_no, clientObject, model=model)
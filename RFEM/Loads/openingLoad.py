@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, ConvertToDlString, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import OpeningLoadDistribution, OpeningLoadDirection
 
 class OpeningLoad():
@@ -29,10 +30,7 @@ class OpeningLoad():
         '''
 
         # Client model | Opening Load
-        clientObject = Model.clientModel.factory.create('ns0:opening_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:opening_load', Model)
 
         # Opening Load No.
         clientObject.no = no
@@ -75,8 +73,5 @@ class OpeningLoad():
         for key in params:
             clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Opening Load to client model
-        Model.clientModel.service.set_opening_load(load_case_no, clientObject)
+        setObject('set_opening_load', load_case_no, clientObject, model=Model)
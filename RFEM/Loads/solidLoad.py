@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SolidLoadType, SolidLoadDistribution, SolidLoadDirection
 
 class SolidLoad():
@@ -29,10 +30,7 @@ class SolidLoad():
         """
 
         # Client model | Solid Load
-        clientObject = model.clientModel.factory.create('ns0:solid_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid_load', model)
 
         # Load No.
         clientObject.no = no
@@ -63,11 +61,8 @@ class SolidLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Solid Load to client model
-        model.clientModel.service.set_solid_load(load_case_no, clientObject)
+        setObject('set_solid_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Force(
@@ -92,10 +87,7 @@ class SolidLoad():
         """
 
         # Client model | Solid Load
-        clientObject = model.clientModel.factory.create('ns0:solid_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid_load', model)
 
         # Load No.
         clientObject.no = no
@@ -126,11 +118,8 @@ class SolidLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Solid Load to client model
-        model.clientModel.service.set_solid_load(load_case_no, clientObject)
+        setObject('set_solid_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Temperature(
@@ -162,10 +151,7 @@ class SolidLoad():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Solid Load
-        clientObject = model.clientModel.factory.create('ns0:solid_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid_load', model)
 
         # Load No.
         clientObject.no = no
@@ -198,11 +184,8 @@ class SolidLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Solid Load to client model
-        model.clientModel.service.set_solid_load(load_case_no, clientObject)
+        setObject('set_solid_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Strain(
@@ -234,10 +217,7 @@ class SolidLoad():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Solid Load
-        clientObject = model.clientModel.factory.create('ns0:solid_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid_load', model)
 
         # Load No.
         clientObject.no = no
@@ -276,11 +256,8 @@ class SolidLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Solid Load to client model
-        model.clientModel.service.set_solid_load(load_case_no, clientObject)
+        setObject('set_solid_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Motion(
@@ -303,10 +280,7 @@ class SolidLoad():
             model (RFEM Class, optional): Model to be edited
         '''
         # Client model | Solid Load
-        clientObject = model.clientModel.factory.create('ns0:solid_load')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid_load', model)
 
         # Load No.
         clientObject.no = no
@@ -342,11 +316,8 @@ class SolidLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Solid Load to client model
-        model.clientModel.service.set_solid_load(load_case_no, clientObject)
+        setObject('set_solid_load', load_case_no, clientObject, model=model)
 
     #TODO: solidLoad Buoyancy and Gas not implemented
     #def Buoyancy():
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SurfaceLoadType, SurfaceLoadDirection, SurfaceLoadDistribution, SurfaceLoadAxisDefinitionType
 
 class SurfaceLoad():
@@ -22,10 +23,7 @@ class SurfaceLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -55,11 +53,8 @@ class SurfaceLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_load(load_case_no, clientObject)
+        setObject('set_surface_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Force(
@@ -100,10 +95,7 @@ class SurfaceLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -187,11 +179,8 @@ class SurfaceLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_load(load_case_no, clientObject)
+        setObject('set_surface_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Temperature(
@@ -228,10 +217,7 @@ class SurfaceLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -302,11 +288,8 @@ class SurfaceLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_load(load_case_no, clientObject)
+        setObject('set_surface_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def AxialStrain(
@@ -338,10 +321,7 @@ class SurfaceLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -392,11 +372,8 @@ class SurfaceLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_load(load_case_no, clientObject)
+        setObject('set_surface_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Precamber(
@@ -418,10 +395,7 @@ class SurfaceLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -451,11 +425,8 @@ class SurfaceLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_load(load_case_no, clientObject)
+        setObject('set_surface_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def RotaryMotion(
@@ -481,10 +452,7 @@ class SurfaceLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -525,11 +493,8 @@ class SurfaceLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_load(load_case_no, clientObject)
+        setObject('set_surface_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Mass(
@@ -557,10 +522,7 @@ class SurfaceLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -598,8 +560,5 @@ class SurfaceLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_load(load_case_no, clientObject)
+        setObject('set_surface_load', load_case_no, clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SurfaceSetLoadType, SurfaceSetLoadDirection, SurfaceSetLoadDistribution, SurfaceSetLoadAxisDefinitionType
 
 class SurfaceSetLoad():
@@ -22,10 +23,7 @@ class SurfaceSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -55,11 +53,8 @@ class SurfaceSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_set_load(load_case_no, clientObject)
+        setObject('set_surface_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Force(
@@ -100,10 +95,7 @@ class SurfaceSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -188,11 +180,8 @@ class SurfaceSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_set_load(load_case_no, clientObject)
+        setObject('set_surface_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Temperature(
@@ -229,10 +218,7 @@ class SurfaceSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -304,11 +290,8 @@ class SurfaceSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_set_load(load_case_no, clientObject)
+        setObject('set_surface_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def AxialStrain(
@@ -341,10 +324,7 @@ class SurfaceSetLoad():
 
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -396,11 +376,8 @@ class SurfaceSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_set_load(load_case_no, clientObject)
+        setObject('set_surface_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Precamber(
@@ -422,10 +399,7 @@ class SurfaceSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -455,11 +429,8 @@ class SurfaceSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_set_load(load_case_no, clientObject)
+        setObject('set_surface_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def RotaryMotion(
@@ -485,10 +456,7 @@ class SurfaceSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -529,11 +497,8 @@ class SurfaceSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_set_load(load_case_no, clientObject)
+        setObject('set_surface_set_load', load_case_no, clientObject, model=model)
 
     @staticmethod
     def Mass(
@@ -561,10 +526,7 @@ class SurfaceSetLoad():
             model (RFEM Class, optional): Model to be edited
         """
         # Client model | Surface Load
-        clientObject = model.clientModel.factory.create('ns0:surface_set_load')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_set_load', model)
 
         # Surface Load No.
         clientObject.no = no
@@ -596,8 +558,5 @@ class SurfaceSetLoad():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Load to client model
-        model.clientModel.service.set_surface_set_load(load_case_no, clientObject)
+        setObject('set_surface_set_load', load_case_no, clientObject, model=model)
@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+from RFEM.initModel import Model, observeModel, unobserveModel, targetClient
+
+# Cache attached to every model client, see ResultCache.attach()
+caches = WeakKeyDictionary()
+
+# Marks tables missing in the cache
+MISSING = object()
+
+class ResultCache():
+    '''
+    Bounded cache of result tables of the model, least recently used tables
+    are dropped first. Tables are kept per (operation, loading type, loading no,
+    object no), so repeated requests of the same table (e.g. while building
+    reports) are served without a request to RFEM.
+
+    Every change of the model made through the library invalidates the cache:
+    calculations, delete_all_results, writing and deleting objects, meshing, ...
+    including changes made through AsyncModel, which reads through the cache too.
+    Changes made in RFEM directly are not recorded, call clear() then.
+
+    Example:
+        cache = ResultCache.attach()
+        ResultTables.MembersInternalForces(CaseObjectType.E_OBJECT_TYPE_LOAD_CASE, 1, 1)
+        ResultTables.MembersInternalForces(CaseObjectType.E_OBJECT_TYPE_LOAD_CASE, 1, 1)
+        cache.hits  -> 1
+    '''
+    def __init__(self, maxsize: int = 128):
+        '''
+        Args:
+            maxsize (int, optional): Maximal number of cached tables
+        '''
+        # (operation, *arguments): results
+        self.tables = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Incremented by every invalidation, tables read before aren't stored
+        self.generation = 0
+
+    @staticmethod
+    def attach(model = Model, maxsize: int = 128):
+        '''
+        Create cache of the model and start recording of its changes.
+        ResultTables use the cache from then on.
+
+        Args:
+            model (RFEM Class, optional): Model with results
+            maxsize (int, optional): Maximal number of cached tables
+        '''
+        ResultCache.detach(model)
+        cache = ResultCache(maxsize)
+        caches[targetClient(model.clientModel)] = cache
+        observeModel(cache.record, model)
+        return cache
+
+    @staticmethod
+    def detach(model = Model):
+        '''
+        Stop recording and drop cache of the model.
+
+        Args:
+            model (RFEM Class, optional): Model with cache
+        '''
+        cache = caches.pop(targetClient(model.clientModel), None)
+        if cache:
+            unobserveModel(cache.record, model)
+
+    def record(self, operation: str, args: tuple):
+        '''
+        Record change of the model, see initModel.observeModel().
+        Any change can change the results, so all tables are dropped.
+        '''
+        self.clear()
+
+    def clear(self):
+        '''
+        Drop all cached tables.
+        '''
+        if self.tables:
+            self.invalidations += 1
+        self.tables.clear()
+        self.generation += 1
+
+    def lookup(self, operation: str, args: tuple):
+        '''
+        Cached result table, MISSING if it isn't cached. Lookups are counted as hits or misses.
+        '''
+        key = (operation,) + args
+        if key in self.tables:
+            self.hits += 1
+            self.tables.move_to_end(key)
+            return self.tables[key]
+        self.misses += 1
+        return MISSING
+
+    def store(self, operation: str, args: tuple, results, generation: int):
+        '''
+        Store result table read while the cache was in given generation.
+        Tables read before the last invalidation are not stored.
+        '''
+        if generation != self.generation:
+            return
+        self.tables[(operation,) + args] = results
+        if len(self.tables) > self.maxsize:
+            self.tables.popitem(last=False)
+
+    def get(self, operation: str, args: tuple, model = Model):
+        '''
+        Result table from the cache, the table is read if it isn't cached.
+
+        Args:
+            operation (str): Name of the operation, e.g. 'get_results_for_members_internal_forces'
+            args (tuple): Arguments of the operation
+            model (RFEM Class, optional): Model to read missing table from
+        '''
+        results = self.lookup(operation, args)
+        if results is MISSING:
+            generation = self.generation
+            results = getattr(model.clientModel.service, operation)(*args)
+            self.store(operation, args, results, generation)
+        return results
+
+    def info(self):
+        '''
+        Statistics of the cache.
+
+        Returns:
+            dict: hits, misses, invalidations, number of cached tables and maxsize
+        '''
+        return {'hits': self.hits, 'misses': self.misses, 'invalidations': self.invalidations,
+                'size': len(self.tables), 'maxsize': self.maxsize}
+
+def GetResults(operation: str, *args, model = Model):
+    '''
+    Call get_results_for_* operation, e.g. GetResults('get_results_for_summary', 'E_OBJECT_TYPE_LOAD_CASE', 1).
+    Results are served by the cache of the model, if there is one.
+
+    Args:
+        operation (str): Name of the operation
+        args: Arguments of the operation, e.g. loading type, loading no and object no
+        model (RFEM Class, optional): Model instance
+    '''
+    cache = caches.get(model.clientModel)
+    if cache:
+        return cache.get(operation, args, model)
+    return getattr(model.clientModel.service, operation)(*args)
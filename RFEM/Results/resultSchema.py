@@ -0,0 +1,122 @@
+from weakref import WeakKeyDictionary
+
+# XSD types returned by suds as Python numbers
+NUMBER_TYPES = {'double', 'float', 'decimal', 'int', 'integer', 'long', 'short', 'byte',
+                'unsignedInt', 'unsignedLong', 'unsignedShort', 'unsignedByte', 'boolean'}
+
+def convertCell(cell):
+    '''
+    Convert cell of unknown type: value of variant (type+value structure)
+    or the cell itself, converted to float if possible.
+    '''
+    try:
+        return float(cell.value)
+    except Exception:
+        try:
+            return cell.value
+        except Exception:
+            try:
+                return float(cell)
+            except Exception:
+                return cell
+
+def convertNumber(cell):
+    '''
+    Convert cell of numeric column.
+    '''
+    if type(cell) in (float, int, bool):
+        return float(cell)
+    return convertCell(cell)
+
+def convertText(cell):
+    '''
+    Convert cell of string column. Texts of numbers are converted to float.
+    '''
+    if isinstance(cell, str):
+        try:
+            return float(cell)
+        except ValueError:
+            return cell
+    return convertCell(cell)
+
+def convertVariant(cell):
+    '''
+    Convert cell of variant column (type+value structure) to its value.
+    '''
+    try:
+        return float(cell.value)
+    except Exception:
+        return convertCell(cell)
+
+def convertBase(cell):
+    '''
+    Convert base information of line, e.g. object number or description.
+    Variants are not expected there, so the value is not looked up.
+    '''
+    try:
+        return float(cell)
+    except Exception:
+        return cell
+
+class ResultTableSchema():
+    '''
+    Converters of result table columns derived from the WSDL schema.
+    Every column is mapped to converter of its type (number, variant or
+    text), so the type of the cells doesn't have to be guessed by catching
+    exceptions. Converters fall back to the guessing if a cell doesn't match
+    its type, so the results are the same as with convertCell().
+
+    Schemas are registered per type of table line, i.e. once per
+    get_results_for_* operation and WSDL (RFEM version), see ResultTableSchema.of().
+    '''
+    # {line type of suds schema: ResultTableSchema}
+    registry = WeakKeyDictionary()
+
+    def __init__(self, lineType = None):
+        '''
+        Args:
+            lineType (suds schema type, optional): Type of table line, converters
+                of unknown types are used if it is None
+        '''
+        self.row = {}
+        if lineType is None:
+            return
+        for child, ancestry in lineType.resolve().children():
+            if child.name == 'row':
+                for cell, ancestry in child.resolve().children():
+                    self.row[cell.name] = ResultTableSchema.converter(cell.resolve())
+
+    @staticmethod
+    def converter(cellType):
+        '''
+        Converter of cells of given schema type.
+        '''
+        if any(child.name == 'value' for child, ancestry in cellType.children()):
+            return convertVariant
+        if cellType.builtin() and cellType.name in NUMBER_TYPES:
+            return convertNumber
+        if cellType.builtin() and cellType.name == 'string':
+            return convertText
+        return convertCell
+
+    @staticmethod
+    def of(line):
+        '''
+        Schema of the table, which given line belongs to.
+
+        Args:
+            line (suds object): Line of result table
+        '''
+        lineType = getattr(getattr(line, '__metadata__', None), 'sxtype', None)
+        if lineType is None:
+            return ResultTableSchema()
+        schema = ResultTableSchema.registry.get(lineType)
+        if schema is None:
+            schema = ResultTableSchema.registry[lineType] = ResultTableSchema(lineType)
+        return schema
+
+    def rowConverters(self, names: list):
+        '''
+        List of (column name, converter) of row columns.
+        '''
+        return [(name, self.row.get(name, convertCell)) for name in names]
@@ -0,0 +1,177 @@
+import enum
+from io import BytesIO
+from xml.etree.ElementTree import iterparse
+from RFEM.initModel import Model
+from RFEM.enums import CaseObjectType
+
+# Results are read from the connection by blocks of this size
+READ_BLOCK_SIZE = 64 * 1024
+
+def LocalName(tag):
+    '''
+    Element tag without namespace.
+    '''
+    return tag[tag.rfind('}') + 1:]
+
+def ConvertCell(elem):
+    '''
+    Convert one cell of result table the same way as ConvertResultsToListOfDct().
+    Variants (type+value structure) are replaced by their value.
+    '''
+    if len(elem):
+        children = {LocalName(child.tag): child for child in elem}
+        if 'value' in children:
+            return ConvertCell(children['value'])
+        return {key: ConvertCell(children[key]) for key in children}
+
+    text = elem.text
+    # suds returns xsd:boolean as bool, which is converted to float
+    if text == 'true':
+        return 1.0
+    if text == 'false':
+        return 0.0
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return text
+
+def ConvertRecord(elem, includeBase = False):
+    '''
+    Convert one line of result table to dictionary.
+    Returns None if line has no 'row' and includeBase is False.
+    '''
+    dct = {}
+    hasRow = False
+    for child in elem:
+        name = LocalName(child.tag)
+        if name == 'row':
+            hasRow = True
+            for cell in child:
+                dct[LocalName(cell.tag)] = ConvertCell(cell)
+        elif includeBase:
+            dct[name] = ConvertCell(child)
+
+    if not includeBase and not hasRow:
+        return None
+    return dct
+
+class BlockReader():
+    '''
+    Reads file-like object by blocks, so iterparse() never holds more
+    than one block of raw reply.
+    '''
+    def __init__(self, fp, size: int = READ_BLOCK_SIZE):
+        self.fp = fp
+        self.size = size
+
+    def read(self, size: int = -1):
+        if size < 0 or size > self.size:
+            size = self.size
+        return self.fp.read(size)
+
+def ParseResultRows(fp, includeBase = False):
+    '''
+    Incrementally parse SOAP reply of get_results_for_* operation.
+    Every line is released as soon as it is converted, so the memory
+    doesn't grow with the size of the table.
+
+    Args:
+        fp (file-like): SOAP reply
+        includeBase (bool): Include base information of every line. Typicaly 'object number' and 'description'.
+
+    Yields:
+        dict: One line of result table, same as item of ConvertResultsToListOfDct()
+    '''
+    depth = 0
+    recordDepth = None
+    parent = None
+
+    for event, elem in iterparse(BlockReader(fp), events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            # Envelope/Body/Response/value/line
+            if recordDepth is None and LocalName(elem.tag) == 'Body':
+                recordDepth = depth + 3
+            elif recordDepth and depth == recordDepth - 1:
+                parent = elem
+            continue
+
+        if depth == recordDepth:
+            dct = ConvertRecord(elem, includeBase)
+            parent.remove(elem)
+            if dct is not None:
+                yield dct
+        depth -= 1
+
+def StreamResults(
+        operation: str,
+        loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
+        loading_no: int = 1,
+        object_no: int = None,
+        includeBase: bool = False,
+        model = Model):
+    '''
+    Stream result table line by line instead of loading whole table at once.
+    Use it for large tables, e.g. results of surfaces or solids.
+
+    Args:
+        operation (str): Name of the operation, e.g. 'get_results_for_members_internal_forces'
+        loading_type (enum): Loading type (LC2 = E_OBJECT_TYPE_LOAD_CASE)
+        loading_no (int): Loading Number (CO2 = 2)
+        object_no (int, optional): Object number, None for operations without it (e.g. summary)
+        includeBase (bool): Include base information of every line.
+        model (class, optional): Model instance
+
+    Yields:
+        dict: One line of result table, same as item of ConvertResultsToListOfDct()
+    '''
+    from suds.client import SoapClient
+    from suds.transport import Request
+
+    client = model.clientModel
+    method = getattr(client.service, operation).method
+    args = [loading_type.name, loading_no]
+    if object_no is not None:
+        args.append(object_no)
+
+    soapClient = SoapClient(client, method)
+    request = Request(soapClient.location(), method.binding.input.get_message(method, args, {}).plain().encode('utf-8'))
+    request.headers = soapClient.headers()
+
+    transport = client.options.transport
+    if hasattr(transport, 'stream'):
+        reply = transport.stream(request)
+    else:
+        reply = transport.send(request)
+        reply.message = BytesIO(reply.message)
+
+    # Connection is released also if the caller stops iterating early
+    try:
+        if reply.code != 200:
+            # raises suds.WebFault
+            method.binding.output.get_fault(reply.message.read())
+            raise ConnectionError('Error: %s returned HTTP status %s.' % (operation, reply.code))
+
+        yield from ParseResultRows(reply.message, includeBase)
+    finally:
+        reply.message.close()
+
+def StreamResultsInChunks(
+        operation: str,
+        loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
+        loading_no: int = 1,
+        object_no: int = None,
+        includeBase: bool = False,
+        chunk_size: int = 10000,
+        model = Model):
+    '''
+    Same as StreamResults() but yields lists of up to chunk_size lines.
+    '''
+    chunk = []
+    for dct in StreamResults(operation, loading_type, loading_no, object_no, includeBase, model):
+        chunk.append(dct)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
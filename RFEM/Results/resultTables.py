@@ -3,10 +3,27 @@ import enum
 from RFEM.initModel import Model
 from RFEM.enums import CaseObjectType
 from RFEM.dataTypes import inf
+from RFEM.Results.resultSchema import ResultTableSchema, convertBase
+from RFEM.Results.resultCache import GetResults
+
+# Marks cells missing in line
+MISSING = object()
 
 # We  can't extract lines with description: Extremes, Total, and Average. Those are language dependent.
 # To do it set_settings_program_language() has to be called before calculation and the program needs to be restarted.
 
+def unionOfKeys(keys: tuple, keylist: list, transitions: dict):
+    '''
+    Same keys in the same order as list(set(keys + keylist)), looked up in
+    transitions of previous lines first. Lines of one table mostly have
+    the same keys, so the set is built only for few of them.
+    '''
+    key = (keys, tuple(keylist))
+    union = transitions.get(key)
+    if union is None:
+        union = transitions[key] = tuple(set(list(keys) + keylist))
+    return union
+
 def GetResultTableParameters(results):
     '''
     Returns dict with 3 atributes: base, row and error.
@@ -17,12 +34,15 @@ def GetResultTableParameters(results):
         return ''
 
     if results[0][0]:
+        base, row = (), ()
+        transitions = {}
         for i in results[0]:
-            params['base'] = list(set(params['base'] + i.__keylist__))
+            base = unionOfKeys(base, i.__keylist__, transitions)
             if 'row' in i.__keylist__:
-                params['row'] = list(set(params['row'] + i.row.__keylist__))
+                row = unionOfKeys(row, i.row.__keylist__, transitions)
             else:
                 params['errors'] = "Result table doesn't have attribute 'row'."
+        params['base'], params['row'] = list(base), list(row)
 
     return params
 
@@ -40,76 +60,164 @@ def ConvertResultsToListOfDct(results, includeBase = False):
     params = GetResultTableParameters(results)
     lstOfDct = []
 
-    for r in results[0]:
-        dct = {}
-        if includeBase and params['base']:
-            for i in params['base']:
-                if i == 'row':
-                    for y in params['row']:
-                        # Sometimes the parameters are not in table or
-                        # they are defined by type+value structure called 'variant',
-                        # hence using try-except notation
-                        try:
-                            dct[y] = float(r.row[y].value)
-                        except:
-                            try:
-                                dct[y] = r.row[y].value
-                            except:
-                                try:
-                                    dct[y] = float(r.row[y])
-                                except:
-                                    try:
-                                        dct[y] = r.row[y]
-                                    except:
-                                        pass
+    # Sometimes the parameters are not in table or they are defined
+    # by type+value structure called 'variant', hence converters of columns
+    # are taken from schema of the table, see ResultTableSchema
+    rowConverters = ResultTableSchema.of(results[0][0]).rowConverters(params['row']) if params['row'] else []
+    if includeBase and params['base']:
+        columns = [(i, None) if i == 'row' else (i, convertBase) for i in params['base']]
+    elif params['row']:
+        columns = [('row', None)]
+    else:
+        columns = None
+
+    if columns:
+        for r in results[0]:
+            dct = {}
+            for i, convert in columns:
+                if convert is None:
+                    row = getattr(r, 'row', None)
+                    for y, convertRow in rowConverters:
+                        cell = getattr(row, y, MISSING)
+                        if cell is not MISSING:
+                            dct[y] = convertRow(cell)
                 else:
-                    try:
-                        dct[i] = float(r[i])
-                    except:
-                        try:
-                            dct[i] = r[i]
-                        except:
-                            pass
+                    cell = getattr(r, i, MISSING)
+                    if cell is not MISSING:
+                        dct[i] = convert(cell)
             lstOfDct.append(dct)
-        # include only row
-        else:
-            if params['row']:
-                for i in params['row']:
-                    try:
-                        dct[i] = float(r.row[i].value)
-                    except:
-                        try:
-                            dct[i] = r.row[i].value
-                        except:
-                            try:
-                                dct[i] = float(r.row[i])
-                            except:
-                                try:
-                                    dct[i] = r.row[i]
-                                except:
-                                    pass
-                lstOfDct.append(dct)
 
     if params['error']:
         return lstOfDct.append({'error': params['error']})
 
     return lstOfDct
 
+def ConvertResultsToColumns(results, includeBase = False):
+    '''
+    Args:
+        results (ResultTables class): ResultTables object
+        includeBase (bool): Include base information of every line. Typicaly 'object number' and 'description'. Default is False.
+    Returns:
+        Dictionary of NumPy arrays, one per column of result table. Columns
+        with numbers only are float arrays with NaN in empty cells, other
+        columns (e.g. descriptions) are object arrays of the same values as
+        in ConvertResultsToListOfDct().
+    '''
+    import numpy as np
+
+    if not results:
+        return {}
+
+    params = GetResultTableParameters(results)
+    if not params['row'] and not includeBase:
+        return {}
+
+    rowNames = params['row']
+    baseNames = [i for i in params['base'] if i != 'row'] if includeBase else []
+    rowColumns = [[] for i in rowNames]
+    baseColumns = [[] for i in baseNames]
+
+    # Same converters as in ConvertResultsToListOfDct(), empty cells are None
+    rowConverters = ResultTableSchema.of(results[0][0]).rowConverters(rowNames) if rowNames else []
+    for r in results[0]:
+        row = getattr(r, 'row', None)
+        for (name, convert), column in zip(rowConverters, rowColumns):
+            cell = getattr(row, name, None)
+            column.append(None if cell is None else convert(cell))
+        for name, column in zip(baseNames, baseColumns):
+            cell = getattr(r, name, None)
+            column.append(None if cell is None else convertBase(cell))
+
+    columns = {}
+    for name, column in zip(rowNames + baseNames, rowColumns + baseColumns):
+        try:
+            columns[name] = np.array(column, dtype=float)
+        except (TypeError, ValueError):
+            columns[name] = np.array(column, dtype=object)
+    return columns
+
+def ConvertColumnsToStructuredArray(columns):
+    '''
+    Args:
+        columns (dict): Result of ConvertResultsToColumns() function
+    Returns:
+        NumPy structured array, float fields for numeric columns and
+        string fields for other columns (empty cells are empty strings).
+    '''
+    import numpy as np
+
+    dtype = []
+    for name, column in columns.items():
+        if column.dtype == object:
+            dtype.append((name, 'U%d' % max([len(str(i)) for i in column if i is not None] + [1])))
+        else:
+            dtype.append((name, 'f8'))
+
+    array = np.empty(len(next(iter(columns.values()))) if columns else 0, dtype=dtype)
+    for name, column in columns.items():
+        array[name] = ['' if i is None else str(i) for i in column] if column.dtype == object else column
+    return array
+
+def ConvertResults(results, output = 'dicts', includeBase = False):
+    '''
+    Args:
+        results (ResultTables class): ResultTables object
+        output (str): Format of results:
+            'dicts' - list of dictionaries, see ConvertResultsToListOfDct()
+            'columns' - dictionary of NumPy arrays per column, see ConvertResultsToColumns()
+            'structured' - NumPy structured array, see ConvertColumnsToStructuredArray()
+        includeBase (bool): Include base information of every line. Typicaly 'object number' and 'description'. Default is False.
+    '''
+    if output == 'dicts':
+        return ConvertResultsToListOfDct(results, includeBase)
+    if output == 'columns':
+        return ConvertResultsToColumns(results, includeBase)
+    if output == 'structured':
+        return ConvertColumnsToStructuredArray(ConvertResultsToColumns(results, includeBase))
+    raise ValueError("WARNING: output has to be 'dicts', 'columns' or 'structured'.")
+
+def ColumnValues(structured_results, parameter):
+    '''
+    Numeric values of parameter, if results are columns (see ConvertResultsToColumns())
+    or structured array. None for list of dictionaries.
+    '''
+    if isinstance(structured_results, dict):
+        column = structured_results[parameter]
+    elif getattr(getattr(structured_results, 'dtype', None), 'names', None):
+        column = structured_results[parameter]
+    else:
+        return None
+
+    import numpy as np
+    if column.dtype == object:
+        # Numbers of column with text
+        column = np.array([i for i in column if isinstance(i, float)], dtype=float)
+    elif column.dtype.kind == 'U':
+        return np.empty(0)
+    column = column.astype(float)
+    return column[~np.isnan(column)]
+
 def GetMinValue(structured_results, parameter):
 
     '''
     Args:
-        structured_results(list of dicts): Result of ConvertResultsToListOfDct() function
+        structured_results(list of dicts or columns): Result of ConvertResultsToListOfDct() or ConvertResults() function
         parameter(str, mandatory): The parameter for which the minimum is sought.
     '''
 
     min_val = inf
-    for i in structured_results:
-        # Sometimes there is text where the float should be
-        try:
-            min_val = min(float(i[parameter]), min_val)
-        except:
-            pass
+    values = ColumnValues(structured_results, parameter)
+    if values is not None:
+        # Vectorized over columns
+        if values.size:
+            min_val = float(values.min())
+    else:
+        for i in structured_results:
+            # Sometimes there is text where the float should be
+            try:
+                min_val = min(float(i[parameter]), min_val)
+            except:
+                pass
 
     assert min_val < inf, 'Check if the parameter is in the table.'
 
@@ -119,17 +227,23 @@ def GetMaxValue(structured_results, parameter):
 
     '''
     Args:
-        structured_results(list of dicts): Result of ConvertResultsToListOfDct() function
+        structured_results(list of dicts or columns): Result of ConvertResultsToListOfDct() or ConvertResults() function
         parameter(str, mandatory): The parameter for which the maximum is sought.
     '''
 
     max_val = -inf
-    for i in structured_results:
-        # Sometimes there is text where the float should be
-        try:
-            max_val = max(float(i[parameter]), max_val)
-        except:
-            pass
+    values = ColumnValues(structured_results, parameter)
+    if values is not None:
+        # Vectorized over columns
+        if values.size:
+            max_val = float(values.max())
+    else:
+        for i in structured_results:
+            # Sometimes there is text where the float should be
+            try:
+                max_val = max(float(i[parameter]), max_val)
+            except:
+                pass
 
     assert max_val > -inf, 'Check if the parameter is in the table.'
 
@@ -142,7 +256,8 @@ class ResultTables():
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -150,16 +265,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_building_stories_forces_in_spandrels(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_building_stories_forces_in_spandrels', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def BuildingStoriesForcesInShearWalls(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -167,16 +284,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_building_stories_forces_in_shear_walls(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_building_stories_forces_in_shear_walls', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def BuildingStoriesCentresMassRigidity(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -184,16 +303,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_building_stories_centres_mass_rigidity(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_building_stories_centres_mass_rigidity', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def BuildingStoriesInterstoryDrifts(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -201,16 +322,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_building_stories_interstory_drifts(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_building_stories_interstory_drifts', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def BuildingStoriesStoryActions(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -218,16 +341,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_building_stories_story_actions(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_building_stories_story_actions', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def CalculationDiagrams(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -235,16 +360,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_calculation_diagrams(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_calculation_diagrams', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def CriticalLoadFactors(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -252,16 +379,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_critical_load_factors(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_critical_load_factors', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def EfeectiveLengthsAndCriticalLoadsByEigenvector(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -269,16 +398,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_efeective_lengths_and_critical_loads_by_eigenvector(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_efeective_lengths_and_critical_loads_by_eigenvector', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def EfeectiveLengthsAndCriticalLoadsByMember(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -286,16 +417,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_efeective_lengths_and_critical_loads_by_member(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_efeective_lengths_and_critical_loads_by_member', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def EigenvectorsByMember(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -303,16 +436,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_eigenvectors_by_member(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_eigenvectors_by_member', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def EigenvectorsByNode(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -320,16 +455,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_eigenvectors_by_node(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_eigenvectors_by_node', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def EigenvectorsBySolid(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -337,16 +474,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_eigenvectors_by_solid(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_eigenvectors_by_solid', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def EigenvectorsBySurface(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -354,16 +493,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_eigenvectors_by_surface(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_eigenvectors_by_surface', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def Errors(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -371,16 +512,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_errors(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_errors', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def LineHingesDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -388,16 +531,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_line_hinges_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_line_hinges_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def LineHingesForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -405,16 +550,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_line_hinges_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_line_hinges_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def LinesSlabWallConnections(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -422,16 +569,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_lines_slab_wall_connections(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_lines_slab_wall_connections', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def LinesSupportForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -439,16 +588,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_lines_support_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_lines_support_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersByEigenvector(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -456,16 +607,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_by_eigenvector(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_by_eigenvector', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersContactForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -473,16 +626,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_contact_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_contact_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersGlobalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -490,16 +645,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_global_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_global_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersHingeDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -507,16 +664,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_hinge_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_hinge_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersHingeForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -524,16 +683,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_hinge_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_hinge_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -541,16 +702,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersInternalForcesByMemberSet(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -558,16 +721,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_internal_forces_by_member_set(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_internal_forces_by_member_set', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersInternalForcesBySection(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -575,16 +740,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_internal_forces_by_section(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_internal_forces_by_section', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersLocalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -592,16 +759,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_local_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_local_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def MembersStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -609,16 +778,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_members_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_members_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisEffectiveModalMasses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -626,16 +797,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_effective_modal_masses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_effective_modal_masses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisMassesInLocations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -643,16 +816,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_masses_in_locations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_masses_in_locations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisMembersByModeShape(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -660,16 +835,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_members_by_mode_shape(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_members_by_mode_shape', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisModeShapesByMember(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -677,16 +854,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_mode_shapes_by_member(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_mode_shapes_by_member', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisModeShapesByNode(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -694,16 +873,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_mode_shapes_by_node(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_mode_shapes_by_node', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisModeShapesBySolid(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -711,16 +892,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_mode_shapes_by_solid(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_mode_shapes_by_solid', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisModeShapesBySurface(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -728,16 +911,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_mode_shapes_by_surface(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_mode_shapes_by_surface', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisNaturalFrequencies(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -745,16 +930,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_natural_frequencies(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_natural_frequencies', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisNodesByModeShape(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -762,16 +949,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_nodes_by_mode_shape(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_nodes_by_mode_shape', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisParticipationFactors(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -779,16 +968,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_participation_factors(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_participation_factors', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisSolidsByModeShape(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -796,16 +987,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_solids_by_mode_shape(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_solids_by_mode_shape', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def ModalAnalysisSurfacesByModeShape(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -813,16 +1006,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_modal_analysis_surfaces_by_mode_shape(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_modal_analysis_surfaces_by_mode_shape', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def NodesByEigenvector(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -830,16 +1025,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_nodes_by_eigenvector(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_nodes_by_eigenvector', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def NodesDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -847,16 +1044,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_nodes_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_nodes_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def NodesSupportForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -864,16 +1063,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_nodes_support_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_nodes_support_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsBasicPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -881,16 +1082,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_basic_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_basic_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsBasicStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -898,16 +1101,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_basic_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_basic_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsBasicTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -915,16 +1120,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_basic_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_basic_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsByEigenvector(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -932,16 +1139,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_by_eigenvector(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_by_eigenvector', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -949,16 +1158,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsEquivalentPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -966,16 +1177,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_equivalent_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_equivalent_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsEquivalentStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -983,16 +1196,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_equivalent_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_equivalent_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsEquivalentTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1000,16 +1215,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_equivalent_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_equivalent_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsGasQuantities(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1017,16 +1234,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_gas_quantities(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_gas_quantities', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsPrincipalPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1034,16 +1253,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_principal_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_principal_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsPrincipalStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1051,16 +1272,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_principal_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_principal_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SolidsPrincipalTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1068,16 +1291,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_solids_principal_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_solids_principal_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisBuildingStoriesCentresMassRigidity(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1085,16 +1310,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_building_stories_centres_mass_rigidity(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_building_stories_centres_mass_rigidity', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisBuildingStoriesForcesInShearWalls(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1102,16 +1329,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_building_stories_forces_in_shear_walls(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_building_stories_forces_in_shear_walls', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisBuildingStoriesForcesInSpandrels(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1119,16 +1348,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_building_stories_forces_in_spandrels(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_building_stories_forces_in_spandrels', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisBuildingStoriesInterstoryDrifts(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1136,16 +1367,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_building_stories_interstory_drifts(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_building_stories_interstory_drifts', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisBuildingStoriesStoryActions(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1153,16 +1386,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_building_stories_story_actions(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_building_stories_story_actions', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisLineHingesDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1170,16 +1405,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_line_hinges_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_line_hinges_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisLineHingesForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1187,16 +1424,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_line_hinges_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_line_hinges_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisLinesSlabWallConnections(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1204,16 +1443,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_lines_slab_wall_connections(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_lines_slab_wall_connections', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisLinesSupportForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1221,16 +1462,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_lines_support_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_lines_support_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersContactForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1238,16 +1481,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_contact_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_contact_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersGlobalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1255,16 +1500,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_global_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_global_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersHingeDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1272,16 +1519,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_hinge_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_hinge_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersHingeForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1289,16 +1538,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_hinge_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_hinge_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1306,16 +1557,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersInternalForcesByMemberSet(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1323,16 +1576,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_internal_forces_by_member_set(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_internal_forces_by_member_set', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersInternalForcesBySection(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1340,16 +1595,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_internal_forces_by_section(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_internal_forces_by_section', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersLocalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1357,16 +1614,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_local_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_local_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisMembersStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1374,16 +1633,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_members_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_members_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisNodesDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1391,16 +1652,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_nodes_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_nodes_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisNodesPseudoAccelerations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1408,16 +1671,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_nodes_pseudo_accelerations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_nodes_pseudo_accelerations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisNodesPseudoVelocities(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1425,16 +1690,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_nodes_pseudo_velocities(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_nodes_pseudo_velocities', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisNodesSupportForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1442,16 +1709,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_nodes_support_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_nodes_support_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSolidsBasicStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1459,16 +1728,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_solids_basic_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_solids_basic_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSolidsBasicTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1476,16 +1747,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_solids_basic_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_solids_basic_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSolidsDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1493,16 +1766,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_solids_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_solids_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSolidsEquivalentStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1510,16 +1785,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_solids_equivalent_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_solids_equivalent_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSolidsEquivalentTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1527,16 +1804,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_solids_equivalent_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_solids_equivalent_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSolidsGasQuantities(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1544,16 +1823,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_solids_gas_quantities(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_solids_gas_quantities', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSolidsPrincipalStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1561,16 +1842,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_solids_principal_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_solids_principal_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSolidsPrincipalTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1578,16 +1861,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_solids_principal_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_solids_principal_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSummary(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1595,16 +1880,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_summary(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_summary', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesBasicInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1612,16 +1899,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_basic_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_basic_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesBasicStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1629,16 +1918,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_basic_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_basic_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesBasicTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1646,16 +1937,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_basic_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_basic_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesContactStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1663,16 +1956,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_contact_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_contact_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesDesignInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1680,16 +1975,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_design_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_design_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesElasticStressComponents(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1697,16 +1994,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_elastic_stress_components(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_elastic_stress_components', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesEquivalentStressesBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1714,16 +2013,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_equivalent_stresses_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_equivalent_stresses_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesEquivalentStressesMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1731,16 +2032,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_equivalent_stresses_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_equivalent_stresses_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesEquivalentStressesRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1748,16 +2051,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_equivalent_stresses_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_equivalent_stresses_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesEquivalentStressesTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1765,16 +2070,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_equivalent_stresses_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_equivalent_stresses_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesEquivalentTotalStrainsBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1782,16 +2089,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_equivalent_total_strains_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_equivalent_total_strains_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesEquivalentTotalStrainsMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1799,16 +2108,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_equivalent_total_strains_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_equivalent_total_strains_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesEquivalentTotalStrainsRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1816,16 +2127,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_equivalent_total_strains_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_equivalent_total_strains_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesEquivalentTotalStrainsTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1833,16 +2146,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_equivalent_total_strains_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_equivalent_total_strains_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesGlobalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1850,16 +2165,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_global_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_global_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesLocalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1867,16 +2184,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_local_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_local_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesMaximumTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1884,16 +2203,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_maximum_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_maximum_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesPrincipalInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1901,16 +2222,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_principal_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_principal_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesPrincipalStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1918,16 +2241,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_principal_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_principal_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SpectralAnalysisSurfacesPrincipalTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1935,16 +2260,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_spectral_analysis_surfaces_principal_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_spectral_analysis_surfaces_principal_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisBuildingStoriesCentresMassRigidity(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1952,16 +2279,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_building_stories_centres_mass_rigidity(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_building_stories_centres_mass_rigidity', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisBuildingStoriesForcesInShearWalls(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1969,16 +2298,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_building_stories_forces_in_shear_walls(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_building_stories_forces_in_shear_walls', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisBuildingStoriesForcesInSpandrels(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -1986,16 +2317,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_building_stories_forces_in_spandrels(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_building_stories_forces_in_spandrels', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisBuildingStoriesInterstoryDrifts(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2003,16 +2336,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_building_stories_interstory_drifts(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_building_stories_interstory_drifts', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisBuildingStoriesStoryActions(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2020,16 +2355,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_building_stories_story_actions(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_building_stories_story_actions', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisCalculationDiagrams(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2037,16 +2374,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_calculation_diagrams(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_calculation_diagrams', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisLineHingesDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2054,16 +2393,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_line_hinges_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_line_hinges_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisLineHingesForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2071,16 +2412,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_line_hinges_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_line_hinges_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisLinesSlabWallConnections(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2088,16 +2431,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_lines_slab_wall_connections(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_lines_slab_wall_connections', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisLinesSupportForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2105,16 +2450,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_lines_support_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_lines_support_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersContactForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2122,16 +2469,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_contact_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_contact_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersGlobalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2139,16 +2488,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_global_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_global_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersHingeDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2156,16 +2507,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_hinge_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_hinge_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersHingeForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2173,16 +2526,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_hinge_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_hinge_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2190,16 +2545,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersInternalForcesByMemberSet(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2207,16 +2564,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_internal_forces_by_member_set(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_internal_forces_by_member_set', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersInternalForcesBySection(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2224,16 +2583,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_internal_forces_by_section(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_internal_forces_by_section', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersLocalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2241,16 +2602,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_local_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_local_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisMembersStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2258,16 +2621,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_members_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_members_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisNodesDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2275,16 +2640,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_nodes_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_nodes_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisNodesSupportForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2292,16 +2659,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_nodes_support_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_nodes_support_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsBasicPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2309,16 +2678,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_basic_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_basic_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsBasicStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2326,16 +2697,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_basic_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_basic_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsBasicTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2343,16 +2716,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_basic_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_basic_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2360,16 +2735,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsEquivalentPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2377,16 +2754,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_equivalent_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_equivalent_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsEquivalentStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2394,16 +2773,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_equivalent_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_equivalent_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsEquivalentTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2411,16 +2792,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_equivalent_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_equivalent_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsGasQuantities(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2428,16 +2811,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_gas_quantities(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_gas_quantities', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsPrincipalPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2445,16 +2830,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_principal_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_principal_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsPrincipalStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2462,16 +2849,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_principal_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_principal_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSolidsPrincipalTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2479,16 +2868,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_solids_principal_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_solids_principal_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSummary(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2496,16 +2887,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_summary(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_summary', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesBasicInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2513,16 +2906,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_basic_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_basic_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesBasicPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2530,16 +2925,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_basic_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_basic_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesBasicStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2547,16 +2944,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_basic_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_basic_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesBasicTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2564,16 +2963,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_basic_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_basic_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesContactStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2581,16 +2982,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_contact_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_contact_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesDesignInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2598,16 +3001,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_design_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_design_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesElasticStressComponents(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2615,16 +3020,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_elastic_stress_components(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_elastic_stress_components', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentPlasticStrainsBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2632,16 +3039,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_plastic_strains_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_plastic_strains_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentPlasticStrainsMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2649,16 +3058,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_plastic_strains_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_plastic_strains_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentPlasticStrainsRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2666,16 +3077,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_plastic_strains_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_plastic_strains_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentPlasticStrainsTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2683,16 +3096,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_plastic_strains_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_plastic_strains_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentStressesBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2700,16 +3115,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_stresses_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_stresses_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentStressesMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2717,16 +3134,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_stresses_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_stresses_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentStressesRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2734,16 +3153,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_stresses_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_stresses_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentStressesTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2751,16 +3172,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_stresses_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_stresses_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentTotalStrainsBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2768,16 +3191,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_total_strains_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_total_strains_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentTotalStrainsMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2785,16 +3210,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_total_strains_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_total_strains_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentTotalStrainsRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2802,16 +3229,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_total_strains_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_total_strains_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesEquivalentTotalStrainsTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2819,16 +3248,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_equivalent_total_strains_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_equivalent_total_strains_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesGlobalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2836,16 +3267,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_global_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_global_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesLocalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2853,16 +3286,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_local_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_local_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesMaximumPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2870,16 +3305,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_maximum_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_maximum_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesMaximumTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2887,16 +3324,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_maximum_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_maximum_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesPrincipalInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2904,16 +3343,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_principal_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_principal_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesPrincipalPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2921,16 +3362,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_principal_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_principal_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesPrincipalStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2938,16 +3381,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_principal_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_principal_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def StabilityIncrementalAnalysisSurfacesPrincipalTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2955,15 +3400,17 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_stability_incremental_analysis_surfaces_principal_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_stability_incremental_analysis_surfaces_principal_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def Summary(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2971,16 +3418,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_summary(loading_type.name, loading_no))
+        return ConvertResults(GetResults('get_results_for_summary', loading_type.name, loading_no, model=model), output)
 
     @staticmethod
     def SurfacesBasicInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -2988,16 +3437,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_basic_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_basic_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesBasicPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3005,16 +3456,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_basic_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_basic_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesBasicStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3022,16 +3475,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_basic_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_basic_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesBasicTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3039,16 +3494,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_basic_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_basic_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesByEigenvector(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3056,16 +3513,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_by_eigenvector(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_by_eigenvector', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesContactStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3073,16 +3532,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_contact_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_contact_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesDesignInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3090,16 +3551,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_design_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_design_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesElasticStressComponents(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3107,16 +3570,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_elastic_stress_components(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_elastic_stress_components', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentPlasticStrainsBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3124,16 +3589,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_plastic_strains_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_plastic_strains_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentPlasticStrainsMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3141,16 +3608,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_plastic_strains_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_plastic_strains_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentPlasticStrainsRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3158,16 +3627,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_plastic_strains_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_plastic_strains_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentPlasticStrainsTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3175,16 +3646,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_plastic_strains_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_plastic_strains_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentStressesBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3192,16 +3665,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_stresses_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_stresses_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentStressesMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3209,16 +3684,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_stresses_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_stresses_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentStressesRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3226,16 +3703,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_stresses_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_stresses_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentStressesTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3243,16 +3722,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_stresses_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_stresses_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentTotalStrainsBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3260,16 +3741,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_total_strains_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_total_strains_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentTotalStrainsMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3277,16 +3760,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_total_strains_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_total_strains_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentTotalStrainsRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3294,16 +3779,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_total_strains_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_total_strains_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesEquivalentTotalStrainsTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3311,16 +3798,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_equivalent_total_strains_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_equivalent_total_strains_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesGlobalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3328,16 +3817,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_global_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_global_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesLocalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3345,16 +3836,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_local_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_local_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesMaximumPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3362,16 +3855,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_maximum_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_maximum_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesMaximumTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3379,16 +3874,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_maximum_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_maximum_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesPrincipalInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3396,16 +3893,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_principal_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_principal_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesPrincipalPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3413,16 +3912,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_principal_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_principal_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesPrincipalStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3430,16 +3931,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_principal_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_principal_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def SurfacesPrincipalTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3447,16 +3950,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_surfaces_principal_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_surfaces_principal_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisBuildingStoriesCentresMassRigidity(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3464,16 +3969,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_building_stories_centres_mass_rigidity(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_building_stories_centres_mass_rigidity', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisBuildingStoriesForcesInShearWalls(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3481,16 +3988,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_building_stories_forces_in_shear_walls(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_building_stories_forces_in_shear_walls', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisBuildingStoriesForcesInSpandrels(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3498,16 +4007,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_building_stories_forces_in_spandrels(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_building_stories_forces_in_spandrels', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisBuildingStoriesInterstoryDrifts(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3515,16 +4026,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_building_stories_interstory_drifts(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_building_stories_interstory_drifts', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisBuildingStoriesStoryActions(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3532,16 +4045,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_building_stories_story_actions(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_building_stories_story_actions', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisLineHingesDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3549,16 +4064,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_line_hinges_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_line_hinges_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisLineHingesForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3566,16 +4083,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_line_hinges_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_line_hinges_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisLinesSlabWallConnections(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3583,16 +4102,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_lines_slab_wall_connections(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_lines_slab_wall_connections', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisLinesSupportForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3600,16 +4121,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_lines_support_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_lines_support_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersContactForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3617,16 +4140,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_contact_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_contact_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersGlobalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3634,16 +4159,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_global_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_global_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersHingeDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3651,16 +4178,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_hinge_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_hinge_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersHingeForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3668,16 +4197,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_hinge_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_hinge_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3685,16 +4216,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersInternalForcesByMemberSet(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3702,16 +4235,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_internal_forces_by_member_set(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_internal_forces_by_member_set', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersInternalForcesBySection(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3719,16 +4254,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_internal_forces_by_section(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_internal_forces_by_section', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersLocalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3736,16 +4273,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_local_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_local_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisMembersStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3753,16 +4292,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_members_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_members_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisNodesAccelerations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3770,16 +4311,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_nodes_accelerations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_nodes_accelerations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisNodesDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3787,16 +4330,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_nodes_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_nodes_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisNodesSupportForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3804,16 +4349,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_nodes_support_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_nodes_support_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisNodesVelocities(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3821,16 +4368,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_nodes_velocities(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_nodes_velocities', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsBasicPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3838,16 +4387,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_basic_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_basic_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsBasicStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3855,16 +4406,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_basic_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_basic_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsBasicTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3872,16 +4425,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_basic_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_basic_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3889,16 +4444,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsEquivalentPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3906,16 +4463,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_equivalent_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_equivalent_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsEquivalentStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3923,16 +4482,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_equivalent_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_equivalent_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsEquivalentTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3940,16 +4501,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_equivalent_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_equivalent_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsGasQuantities(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3957,16 +4520,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_gas_quantities(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_gas_quantities', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsPrincipalPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3974,16 +4539,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_principal_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_principal_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsPrincipalStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -3991,16 +4558,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_principal_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_principal_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSolidsPrincipalTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4008,16 +4577,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_solids_principal_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_solids_principal_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSummary(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4025,16 +4596,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_summary(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_summary', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesBasicInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4042,16 +4615,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_basic_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_basic_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesBasicPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4059,16 +4634,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_basic_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_basic_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesBasicStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4076,16 +4653,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_basic_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_basic_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesBasicTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4093,16 +4672,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_basic_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_basic_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesContactStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4110,16 +4691,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_contact_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_contact_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesDesignInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4127,16 +4710,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_design_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_design_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesElasticStressComponents(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4144,16 +4729,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_elastic_stress_components(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_elastic_stress_components', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentPlasticStrainsBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4161,16 +4748,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_plastic_strains_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_plastic_strains_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentPlasticStrainsMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4178,16 +4767,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_plastic_strains_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_plastic_strains_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentPlasticStrainsRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4195,16 +4786,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_plastic_strains_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_plastic_strains_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentPlasticStrainsTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4212,16 +4805,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_plastic_strains_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_plastic_strains_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentStressesBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4229,16 +4824,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_stresses_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_stresses_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentStressesMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4246,16 +4843,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_stresses_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_stresses_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentStressesRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4263,16 +4862,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_stresses_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_stresses_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentStressesTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4280,16 +4881,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_stresses_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_stresses_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentTotalStrainsBach(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4297,16 +4900,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_total_strains_bach(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_total_strains_bach', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentTotalStrainsMises(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4314,16 +4919,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_total_strains_mises(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_total_strains_mises', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentTotalStrainsRankine(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4331,16 +4938,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_total_strains_rankine(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_total_strains_rankine', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesEquivalentTotalStrainsTresca(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4348,16 +4957,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_equivalent_total_strains_tresca(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_equivalent_total_strains_tresca', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesGlobalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4365,16 +4976,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_global_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_global_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesLocalDeformations(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4382,16 +4995,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_local_deformations(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_local_deformations', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesMaximumPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4399,16 +5014,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_maximum_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_maximum_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesMaximumTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4416,16 +5033,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_maximum_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_maximum_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesPrincipalInternalForces(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4433,16 +5052,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_principal_internal_forces(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_principal_internal_forces', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesPrincipalPlasticStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4450,16 +5071,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_principal_plastic_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_principal_plastic_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesPrincipalStresses(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4467,16 +5090,18 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_principal_stresses(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_principal_stresses', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def TimeHistoryAnalysisSurfacesPrincipalTotalStrains(
         loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
         loading_no: int = 1,
         object_no: int = 1,
-        model = Model):
+        model = Model,
+        output: str = 'dicts'):
 
         '''
          Args:
@@ -4484,9 +5109,10 @@ class ResultTables():
             loading_no (int): Loading Number (CO2 = 2)
             object_no (int): Object number
             model (class, optional): Model instance
+            output (str, optional): Format of results, see ConvertResults()
         '''
 
-        return ConvertResultsToListOfDct(model.clientModel.service.get_results_for_time_history_analysis_surfaces_principal_total_strains(loading_type.name, loading_no, object_no))
+        return ConvertResults(GetResults('get_results_for_time_history_analysis_surfaces_principal_total_strains', loading_type.name, loading_no, object_no, model=model), output)
 
     @staticmethod
     def HasAnyResults( model = Model):
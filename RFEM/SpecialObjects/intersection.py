@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 
 class Instersection():
     def __init__(self,
@@ -21,10 +22,7 @@ class Instersection():
         """
 
         # Client model | Intersection
-        clientObject = model.clientModel.factory.create('ns0:intersection')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:intersection', model)
 
         # Intersection No.
         clientObject.no = no
@@ -41,8 +39,5 @@ class Instersection():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Intersection to client model
-        model.clientModel.service.set_intersection(clientObject)
+        setObject('set_intersection', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import LineReleaseReleaseLocation
 
 class LineRelease():
@@ -36,10 +37,7 @@ class LineRelease():
         '''
 
         # Client model | Line Release
-        clientObject = model.clientModel.factory.create('ns0:line_release')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_release', model)
 
         # Line Release No.
         clientObject.no = no
@@ -81,8 +79,5 @@ class LineRelease():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line Release Type to Client Model
-        model.clientModel.service.set_line_release(clientObject)
+        setObject('set_line_release', clientObject, model=model)
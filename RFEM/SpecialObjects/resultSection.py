@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import ResultSectionType, ResultSectionProjection, ResultSectionResultDirection
 
 class ResultSection():
@@ -32,10 +33,7 @@ class ResultSection():
         """
 
         # Client model | Result Section
-        clientObject = model.clientModel.factory.create('ns0:result_section')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:result_section', model)
 
         # Result Section No.
         clientObject.no = no
@@ -85,11 +83,8 @@ class ResultSection():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Result Section to client model
-        model.clientModel.service.set_result_section(clientObject)
+        setObject('set_result_section', clientObject, model=model)
 
     @staticmethod
     def TwoPointsAndVector(
@@ -124,10 +119,7 @@ class ResultSection():
         """
 
         # Client model | Result Section
-        clientObject = model.clientModel.factory.create('ns0:result_section')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:result_section', model)
 
         # Result Section No.
         clientObject.no = no
@@ -179,11 +171,8 @@ class ResultSection():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Result Section to client model
-        model.clientModel.service.set_result_section(clientObject)
+        setObject('set_result_section', clientObject, model=model)
 
     @staticmethod
     def Line(
@@ -211,10 +200,7 @@ class ResultSection():
         """
 
         # Client model | Result Section
-        clientObject = model.clientModel.factory.create('ns0:result_section')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:result_section', model)
 
         # Result Section No.
         clientObject.no = no
@@ -250,8 +236,5 @@ class ResultSection():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Result Section to client model
-        model.clientModel.service.set_result_section(clientObject)
+        setObject('set_result_section', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import RigidLinkType
 
 class RigidLink():
@@ -25,10 +26,7 @@ class RigidLink():
 
 
         # Client model | Rigid Link
-        clientObject = model.clientModel.factory.create('ns0:rigid_link')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:rigid_link', model)
 
         # Type
         #clientObject.type = RigidLinkType.TYPE_LINE_TO_LINE.name
@@ -51,11 +49,8 @@ class RigidLink():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add rigid link to client model
-        model.clientModel.service.set_rigid_link(clientObject)
+        setObject('set_rigid_link', clientObject, model=model)
 
     @staticmethod
     def LineToLine(
@@ -80,10 +75,7 @@ class RigidLink():
         """
 
         # Client model | Line To Line Rigid Link
-        clientObject = model.clientModel.factory.create('ns0:rigid_link')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:rigid_link', model)
 
         # Type
         clientObject.type = RigidLinkType.TYPE_LINE_TO_LINE.name
@@ -106,11 +98,8 @@ class RigidLink():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add rigid link to client model
-        model.clientModel.service.set_rigid_link(clientObject)
+        setObject('set_rigid_link', clientObject, model=model)
 
     @staticmethod
     def LineToSurface(
@@ -135,10 +124,7 @@ class RigidLink():
         """
 
         # Client model | Line To Surface Rigid Link
-        clientObject = model.clientModel.factory.create('ns0:rigid_link')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:rigid_link', model)
 
         # Rigid Link No.
         clientObject.no = no
@@ -162,11 +148,8 @@ class RigidLink():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add rigid link to client model
-        model.clientModel.service.set_rigid_link(clientObject)
+        setObject('set_rigid_link', clientObject, model=model)
 
     @staticmethod
     def Diapragm(
@@ -187,10 +170,7 @@ class RigidLink():
         """
 
         # Client model | Diapragm Rigid Link
-        clientObject = model.clientModel.factory.create('ns0:rigid_link')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:rigid_link', model)
 
         # Rigid Link No.
         clientObject.no = no
@@ -199,10 +179,10 @@ class RigidLink():
         clientObject.type = RigidLinkType.TYPE_DIAPHRAGM.name
 
         # Attached nodes
-        clientObject.nodes = nodes
+        clientObject.nodes = ConvertToDlString(nodes)
 
         # Attached lines
-        clientObject.lines = lines
+        clientObject.lines = ConvertToDlString(lines)
 
         # Comment
         clientObject.comment = comment
@@ -212,8 +192,5 @@ class RigidLink():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add rigid link to client model
-        model.clientModel.service.set_rigid_link(clientObject)
+        setObject('set_rigid_link', clientObject, model=model)
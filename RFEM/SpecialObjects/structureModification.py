@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, deleteEmptyAttributes
+from RFEM.fastSerializer import setObject
 
 class StructureModification():
     material_item = {'no': 1, 'material_name': 1, 'modification_type': 'DIVISION_FACTOR', 'E_and_G': 1.5, 'comment': 'comment'}
@@ -81,10 +82,7 @@ class StructureModification():
         try:
             clientObject = model.clientModel.service.get_structure_modification(no)
         except:
-            clientObject = model.clientModel.factory.create('ns0:structure_modification')
-
-            # Clears object atributes | Sets all atributes to None
-            clearAttributes(clientObject)
+            clientObject = createEmptyObject('ns0:structure_modification', model)
 
             # Structure Modification No.
             clientObject.no = no
@@ -117,7 +115,7 @@ class StructureModification():
             clientObject.nonlinearities_disabled_surface_supports = modify_stiffnesses['nonlinearities_disabled_surface_supports']
             clientObject.deactivate_members_enabled = modify_stiffnesses['deactivate_members_enabled']
 
-            model.clientModel.service.set_structure_modification(clientObject)
+            setObject('set_structure_modification', clientObject, model=model)
             clientObject = model.clientModel.service.get_structure_modification(no)
 
         # Modify Stiffneesses Tables
@@ -216,4 +214,4 @@ class StructureModification():
         deleteEmptyAttributes(clientObject)
 
         # Add Structure Modification to client model
-        model.clientModel.service.set_structure_modification(clientObject)
+        setObject('set_structure_modification', clientObject, model=model)
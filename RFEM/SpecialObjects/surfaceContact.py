@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class SurfaceContact():
     def __init__(self,
@@ -23,10 +24,7 @@ class SurfaceContact():
         """
 
         # Client model | Surfaces Contact
-        clientObject = model.clientModel.factory.create('ns0:surfaces_contact')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surfaces_contact', model)
 
         # Surfaces Contact No.
         clientObject.no = no
@@ -46,8 +44,5 @@ class SurfaceContact():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surfaces Contact to client model
-        model.clientModel.service.set_surfaces_contact(clientObject)
+        setObject('set_surfaces_contact', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SurfaceResultsAdjustmentShape, SurfaceResultsAdjustmentType, SurfaceResultsAdjustmentProjection
 
 class SurfaceResultsAdjustment():
@@ -34,10 +35,7 @@ class SurfaceResultsAdjustment():
         """
 
         # Client model | Surface Result Adjustment
-        clientObject = model.clientModel.factory.create('ns0:surface_results_adjustment')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_results_adjustment', model)
 
         # Surface Result Adjustment No.
         clientObject.no = no
@@ -92,8 +90,5 @@ class SurfaceResultsAdjustment():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Result Adjustmentto client model
-        model.clientModel.service.set_surface_results_adjustment(clientObject)
+        setObject('set_surface_results_adjustment', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class SteelDesignServiceabilityConfigurations():
 
@@ -23,10 +24,7 @@ class SteelDesignServiceabilityConfigurations():
         """
 
         # Client Model | Steel Design Serviceability Configurations
-        clientObject = model.clientModel.factory.create('ns0:steel_design_sls_configuration')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:steel_design_sls_configuration', model)
 
         # ULS Configuration No.
         clientObject.no = no
@@ -60,8 +58,5 @@ class SteelDesignServiceabilityConfigurations():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Global Parameters to Client Model
-        model.clientModel.service.set_steel_design_sls_configuration(clientObject)
+        setObject('set_steel_design_sls_configuration', clientObject, model=model)
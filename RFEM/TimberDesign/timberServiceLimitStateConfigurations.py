@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class TimberDesignServiceLimitStateConfigurations():
 
@@ -22,10 +23,7 @@ class TimberDesignServiceLimitStateConfigurations():
         """
 
         # Client Model | Timber Design Service Limit State Configurations
-        clientObject = model.clientModel.factory.create('ns0:timber_design_uls_configuration')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:timber_design_uls_configuration', model)
 
         # SLS Configuration No.
         clientObject.no = no
@@ -59,9 +57,6 @@ class TimberDesignServiceLimitStateConfigurations():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Global Parameters to Client Model
-        model.clientModel.service.set_timber_design_sls_configuration(clientObject)
+        setObject('set_timber_design_sls_configuration', clientObject, model=model)
 
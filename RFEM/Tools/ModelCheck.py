@@ -1,4 +1,4 @@
-from RFEM.initModel import Model
+from RFEM.initModel import Model, notifyModel
 from RFEM.enums import ModelCheckGetOptionType, ModelCheckProcessOptionType
 
 class ModelCheck():
@@ -27,6 +27,7 @@ class ModelCheck():
 
         process = ModelCheckProcessOptionType.DELETE_UNUSED_NODES.name
         model.clientModel.service.model_check__process_object_groups_operation(process, tolerance, object_groups)
+        notifyModel(model.clientModel, 'model_check__process_object_groups_operation', (process, tolerance, object_groups))
 
     @staticmethod
     def UniteNodes(tolerance, object_groups, model = Model):
@@ -38,6 +39,7 @@ class ModelCheck():
 
         process = ModelCheckProcessOptionType.UNITE_NODES_AND_DELETE_UNUSED_NODES.name
         model.clientModel.service.model_check__process_object_groups_operation(process, tolerance, object_groups)
+        notifyModel(model.clientModel, 'model_check__process_object_groups_operation', (process, tolerance, object_groups))
 
     @staticmethod
     def GetNotConnectedLines(tolerance, model = Model):
@@ -63,6 +65,7 @@ class ModelCheck():
 
         process = ModelCheckProcessOptionType.CROSS_LINES.name
         model.clientModel.service.model_check__process_object_groups_operation(process, tolerance, line_groups)
+        notifyModel(model.clientModel, 'model_check__process_object_groups_operation', (process, tolerance, line_groups))
 
     @staticmethod
     def GetNotConnectedMembers(tolerance, model = Model):
@@ -88,6 +91,7 @@ class ModelCheck():
 
         process = ModelCheckProcessOptionType.CROSS_MEMBERS.name
         model.clientModel.service.model_check__process_object_groups_operation(process, tolerance, member_groups)
+        notifyModel(model.clientModel, 'model_check__process_object_groups_operation', (process, tolerance, member_groups))
 
     @staticmethod
     def GetOverlappingLines(model = Model):
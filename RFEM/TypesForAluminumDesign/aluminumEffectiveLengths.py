@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import AluminumEffectiveLengthsDeterminationMcrEurope
 
 class AluminumEffectiveLengths():
@@ -44,10 +45,7 @@ class AluminumEffectiveLengths():
         """
 
         # Client Model | Types For Aluminum Design Effective Lengths
-        clientObject = model.clientModel.factory.create('ns0:aluminum_effective_lengths')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:aluminum_effective_lengths', model)
 
         # Effective Lengths No.
         clientObject.no = no
@@ -104,8 +102,5 @@ class AluminumEffectiveLengths():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Aluminum Effective Lengths to client model
-        model.clientModel.service.set_aluminum_effective_lengths(clientObject)
+        setObject('set_aluminum_effective_lengths', clientObject, model=model)
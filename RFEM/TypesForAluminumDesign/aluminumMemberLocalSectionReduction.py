@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, clearAttributes, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import AluminumMemberLocalSectionReductionType, MultipleOffsetDefinitionType, FastenerDefinitionType
 
 class AluminumMemberLocalSectionReduction():
@@ -44,10 +45,7 @@ class AluminumMemberLocalSectionReduction():
         """
 
         # Client Model | Types For Aluminum Member Local Section Reduction
-        clientObject = model.clientModel.factory.create('ns0:aluminum_member_local_section_reduction')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:aluminum_member_local_section_reduction', model)
 
         #Local Section Reduction No.
         clientObject.no = no
@@ -96,8 +94,5 @@ class AluminumMemberLocalSectionReduction():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Aluminum Member Local Section Reduction to Client Model
-        model.clientModel.service.set_aluminum_member_local_section_reduction(clientObject)
+        setObject('set_aluminum_member_local_section_reduction', clientObject, model=model)
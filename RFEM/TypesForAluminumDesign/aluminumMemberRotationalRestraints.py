@@ -1,5 +1,7 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString, SetAddonStatus
-from RFEM.enums import *
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString, SetAddonStatus
+from RFEM.modelMirror import GetModelInfo
+from RFEM.fastSerializer import setObject
+from RFEM.enums import AddOn, AluminumMemberRotationalRestraintType
 
 class AluminumMemberRotationalRestraint():
     def __init__(self,
@@ -57,7 +59,7 @@ class AluminumMemberRotationalRestraint():
         """
 
         # Deducing RFEM Language from aluminum_design_addon String:
-        modelInfo = Model.clientModel.service.get_model_info()
+        modelInfo = GetModelInfo(model)
         if modelInfo.property_addon_aluminum_design.split()[0] != 'Aluminum':
             raise ValueError("WARNING: The aluminumMemberRotationalRestraints operates with the RFEM Application set to English. Kindly switch RFEM to English such that Database searches can completed successfully.")
 
@@ -65,10 +67,7 @@ class AluminumMemberRotationalRestraint():
         SetAddonStatus(model.clientModel, AddOn.aluminum_design_active, True)
 
         # Client Model / Types For Aluminum Design Member Rotational Restraints
-        clientObject = model.clientModel.factory.create('ns0:aluminum_member_rotational_restraint')
-
-        # Clears Object Attributes / Sets all the attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:aluminum_member_rotational_restraint', model)
 
         # Member Rotational Restraint No.
         clientObject.no = no
@@ -128,8 +127,5 @@ class AluminumMemberRotationalRestraint():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Aluminum Member Rotational Restraint to Client Model
-        model.clientModel.service.set_aluminum_member_rotational_restraint(clientObject)
+        setObject('set_aluminum_member_rotational_restraint', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import AluminumMemberShearPanelDefinitionType, AluminumMemberShearPanelPositionOnSection, AluminumMemberShearPanelFasteningArrangement
 
 class AluminumMemberShearPanel():
@@ -73,10 +74,7 @@ class AluminumMemberShearPanel():
         """
 
          # Client Model | Types For Aluminum Design Member Shear Panel
-        clientObject = Model.clientModel.factory.create('ns0:aluminum_member_shear_panel')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:aluminum_member_shear_panel', Model)
 
         # Member Shear Panel No.
         clientObject.no = no
@@ -164,8 +162,5 @@ class AluminumMemberShearPanel():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Aluminum Effective Lengths to client model
-        Model.clientModel.service.set_aluminum_member_shear_panel(clientObject)
+        setObject('set_aluminum_member_shear_panel', clientObject, model=Model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject, ConvertStrToListOfInt
+from RFEM.fastSerializer import setObject
 from RFEM.enums import WeldComponentType, MultipleOffsetDefinitionType, WeldingMethod
 
 transverseWeldComponent = {
@@ -38,10 +39,7 @@ class AluminumMemberTransverseWeld():
         """
 
         # Client model | Aluminum Member Transverse Weld
-        clientObject = model.clientModel.factory.create('ns0:aluminum_member_transverse_weld')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:aluminum_member_transverse_weld', model)
 
         # Weld No.
         clientObject.no = no
@@ -86,8 +84,5 @@ class AluminumMemberTransverseWeld():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Aluminum Member Transverse Weld to client model
-        model.clientModel.service.set_aluminum_member_transverse_weld(clientObject)
+        setObject('set_aluminum_member_transverse_weld', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.dataTypes import inf
 
 class LineHinge():
@@ -32,10 +33,7 @@ class LineHinge():
         """
 
         # Client model | Line Hinge
-        clientObject = model.clientModel.factory.create('ns0:line_hinge')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_hinge', model)
 
         # Line Hinge No.
         clientObject.no = no
@@ -60,9 +58,6 @@ class LineHinge():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line Hinge to client model
-        model.clientModel.service.set_line_hinge(clientObject)
+        setObject('set_line_hinge', clientObject, model=model)
 
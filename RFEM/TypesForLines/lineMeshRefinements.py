@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import LineMeshRefinementsType
 
 class LineMeshRefinements():
@@ -25,10 +26,7 @@ class LineMeshRefinements():
         """
 
         # Client model | Line Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:line_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_mesh_refinement', model)
 
         # Line Mesh Refinement No.
         clientObject.no = no
@@ -50,11 +48,8 @@ class LineMeshRefinements():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line Mesh Refinement to client model
-        model.clientModel.service.set_line_mesh_refinement(clientObject)
+        setObject('set_line_mesh_refinement', clientObject, model=model)
 
     @staticmethod
     def TargetFELength(
@@ -77,10 +72,7 @@ class LineMeshRefinements():
         """
 
         # Client model | Line Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:line_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_mesh_refinement', model)
 
         # Line Mesh Refinement No.
         clientObject.no = no
@@ -105,11 +97,8 @@ class LineMeshRefinements():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line Mesh Refinement to client model
-        model.clientModel.service.set_line_mesh_refinement(clientObject)
+        setObject('set_line_mesh_refinement', clientObject, model=model)
 
     @staticmethod
     def NumberFiniteElements(
@@ -132,10 +121,7 @@ class LineMeshRefinements():
         """
 
         # Client model | Line Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:line_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_mesh_refinement', model)
 
         # Line Mesh Refinement No.
         clientObject.no = no
@@ -160,11 +146,8 @@ class LineMeshRefinements():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line Mesh Refinement to client model
-        model.clientModel.service.set_line_mesh_refinement(clientObject)
+        setObject('set_line_mesh_refinement', clientObject, model=model)
 
     @staticmethod
     def Gradually(
@@ -187,10 +170,7 @@ class LineMeshRefinements():
         """
 
         # Client model | Line Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:line_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_mesh_refinement', model)
 
         # Line Mesh Refinement No.
         clientObject.no = no
@@ -215,8 +195,5 @@ class LineMeshRefinements():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line Mesh Refinement to client model
-        model.clientModel.service.set_line_mesh_refinement(clientObject)
+        setObject('set_line_mesh_refinement', clientObject, model=model)
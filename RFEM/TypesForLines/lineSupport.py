@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.dataTypes import inf
 from RFEM.enums import LineSupportType
 
@@ -50,10 +51,7 @@ class LineSupport():
         """
 
         # Client model | Line Support
-        clientObject = model.clientModel.factory.create('ns0:line_support')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_support', model)
 
         # Line Support No.
         clientObject.no = no
@@ -98,8 +96,5 @@ class LineSupport():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line Support to client model
-        model.clientModel.service.set_line_support(clientObject)
+        setObject('set_line_support', clientObject, model=model)
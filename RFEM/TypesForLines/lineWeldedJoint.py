@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertStrToListOfInt
+from RFEM.initModel import Model, createEmptyObject, ConvertStrToListOfInt
+from RFEM.fastSerializer import setObject
 from RFEM.enums import LineWeldedJointType, WeldType, WeldLongitudalArrangement
 
 class LineWeldedJoint():
@@ -29,10 +30,7 @@ class LineWeldedJoint():
         """
 
         # Client model | Line Welded Joint
-        clientObject = model.clientModel.factory.create('ns0:line_welded_joint')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:line_welded_joint', model)
 
         # Line Welded Joint No.
         clientObject.no = no
@@ -57,11 +55,8 @@ class LineWeldedJoint():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line welded joint to client model
-        model.clientModel.service.set_line_welded_joint(clientObject)
+        setObject('set_line_welded_joint', clientObject, model=model)
 
         iLines = ConvertStrToListOfInt(lines)
         iSurfaces = ConvertStrToListOfInt(surfaces)
@@ -78,4 +73,4 @@ class LineWeldedJoint():
                 clientWeld.row.surface3 = iSurfaces[2]
             line.line_weld_assignment = model.clientModel.factory.create('ns0:array_of_line_line_weld_assignment')
             line.line_weld_assignment.line_line_weld_assignment.append(clientWeld)
-            model.clientModel.service.set_line(line)
+            setObject('set_line', line, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class MemberDefinableStiffness():
     def __init__(self,
@@ -43,10 +44,7 @@ class MemberDefinableStiffness():
         """
 
         # Client model | Member Definable Stffness
-        clientObject = model.clientModel.factory.create('ns0:member_definable_stiffness')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_definable_stiffness', model)
 
         # Member Definable Stffness No.
         clientObject.no = no
@@ -95,8 +93,5 @@ class MemberDefinableStiffness():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Definable Stffness to client model
-        model.clientModel.service.set_member_definable_stiffness(clientObject)
+        setObject('set_member_definable_stiffness', clientObject, model=model)
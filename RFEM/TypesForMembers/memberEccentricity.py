@@ -1,5 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
-from RFEM.enums import *
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
+from RFEM.enums import MemberEccentricityHorizontalSectionAlignment, MemberEccentricitySpecificationType, MemberEccentricityTransverseOffsetType, MemberEccentricityVerticalSectionAlignment
 
 class MemberEccentricity():
     def __init__(self,
@@ -42,10 +43,7 @@ class MemberEccentricity():
         """
 
         # Client model | Member Eccentricity
-        clientObject = model.clientModel.factory.create('ns0:member_eccentricity')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_eccentricity', model)
 
         # Member Eccentricity No.
         clientObject.no = no
@@ -111,8 +109,5 @@ class MemberEccentricity():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Eccentricity to client model
-        model.clientModel.service.set_member_eccentricity(clientObject)
+        setObject('set_member_eccentricity', clientObject, model=model)
@@ -1,5 +1,6 @@
 from RFEM.enums import MemberHingeNonlinearity
-from RFEM.initModel import Model, clearAttributes, ConvertToDlString, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.dataTypes import inf
 
 class MemberHinge():
@@ -45,10 +46,7 @@ class MemberHinge():
         """
 
         # Client model | Member Hinge
-        clientObject = model.clientModel.factory.create('ns0:member_hinge')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_hinge', model)
 
         # Member Hinge No.
         clientObject.no = no
@@ -128,10 +126,10 @@ class MemberHinge():
             clientObject.diagram_along_x_start = translational_release_n_nonlinearity[1][0].name
             clientObject.diagram_along_x_end = translational_release_n_nonlinearity[1][1].name
 
-            clientObject.diagram_along_x_table = Model.clientModel.factory.create('ns0:member_hinge.diagram_along_x_table')
+            clientObject.diagram_along_x_table = model.clientModel.factory.create('ns0:member_hinge.diagram_along_x_table')
 
             for i,j in enumerate(translational_release_n_nonlinearity[1][2]):
-                mlvlp = Model.clientModel.factory.create('ns0:member_hinge_diagram_along_x_table_row')
+                mlvlp = model.clientModel.factory.create('ns0:member_hinge_diagram_along_x_table_row')
                 mlvlp.no = i+1
                 mlvlp.row.displacement = translational_release_n_nonlinearity[1][2][i][0]
                 mlvlp.row.force = translational_release_n_nonlinearity[1][2][i][1]
@@ -199,10 +197,10 @@ class MemberHinge():
             clientObject.diagram_along_y_start = translational_release_vy_nonlinearity[1][0].name
             clientObject.diagram_along_y_end = translational_release_vy_nonlinearity[1][1].name
 
-            clientObject.diagram_along_y_table = Model.clientModel.factory.create('ns0:member_hinge.diagram_along_y_table')
+            clientObject.diagram_along_y_table = model.clientModel.factory.create('ns0:member_hinge.diagram_along_y_table')
 
             for i,j in enumerate(translational_release_vy_nonlinearity[1][2]):
-                mlvlp = Model.clientModel.factory.create('ns0:member_hinge_diagram_along_y_table_row')
+                mlvlp = model.clientModel.factory.create('ns0:member_hinge_diagram_along_y_table_row')
                 mlvlp.no = i+1
                 mlvlp.row.displacement = translational_release_vy_nonlinearity[1][2][i][0]
                 mlvlp.row.force = translational_release_vy_nonlinearity[1][2][i][1]
@@ -270,10 +268,10 @@ class MemberHinge():
             clientObject.diagram_along_z_start = translational_release_vz_nonlinearity[1][0].name
             clientObject.diagram_along_z_end = translational_release_vz_nonlinearity[1][1].name
 
-            clientObject.diagram_along_z_table = Model.clientModel.factory.create('ns0:member_hinge.diagram_along_z_table')
+            clientObject.diagram_along_z_table = model.clientModel.factory.create('ns0:member_hinge.diagram_along_z_table')
 
             for i,j in enumerate(translational_release_vz_nonlinearity[1][2]):
-                mlvlp = Model.clientModel.factory.create('ns0:member_hinge_diagram_along_z_table_row')
+                mlvlp = model.clientModel.factory.create('ns0:member_hinge_diagram_along_z_table_row')
                 mlvlp.no = i+1
                 mlvlp.row.displacement = translational_release_vz_nonlinearity[1][2][i][0]
                 mlvlp.row.force = translational_release_vz_nonlinearity[1][2][i][1]
@@ -341,10 +339,10 @@ class MemberHinge():
             clientObject.diagram_around_x_start = rotational_release_mt_nonlinearity[1][0].name
             clientObject.diagram_around_x_end = rotational_release_mt_nonlinearity[1][1].name
 
-            clientObject.diagram_around_x_table = Model.clientModel.factory.create('ns0:member_hinge.diagram_around_x_table')
+            clientObject.diagram_around_x_table = model.clientModel.factory.create('ns0:member_hinge.diagram_around_x_table')
 
             for i,j in enumerate(rotational_release_mt_nonlinearity[1][2]):
-                mlvlp = Model.clientModel.factory.create('ns0:member_hinge_diagram_around_x_table_row')
+                mlvlp = model.clientModel.factory.create('ns0:member_hinge_diagram_around_x_table_row')
                 mlvlp.no = i+1
                 mlvlp.row.rotation = rotational_release_mt_nonlinearity[1][2][i][0]
                 mlvlp.row.moment = rotational_release_mt_nonlinearity[1][2][i][1]
@@ -401,10 +399,10 @@ class MemberHinge():
             clientObject.diagram_around_y_start = rotational_release_my_nonlinearity[1][0].name
             clientObject.diagram_around_y_end = rotational_release_my_nonlinearity[1][1].name
 
-            clientObject.diagram_around_y_table = Model.clientModel.factory.create('ns0:member_hinge.diagram_around_y_table')
+            clientObject.diagram_around_y_table = model.clientModel.factory.create('ns0:member_hinge.diagram_around_y_table')
 
             for i,j in enumerate(rotational_release_my_nonlinearity[1][2]):
-                mlvlp = Model.clientModel.factory.create('ns0:member_hinge_diagram_around_y_table_row')
+                mlvlp = model.clientModel.factory.create('ns0:member_hinge_diagram_around_y_table_row')
                 mlvlp.no = i+1
                 mlvlp.row.rotation = rotational_release_my_nonlinearity[1][2][i][0]
                 mlvlp.row.moment = rotational_release_my_nonlinearity[1][2][i][1]
@@ -461,10 +459,10 @@ class MemberHinge():
             clientObject.diagram_around_z_start = rotational_release_mz_nonlinearity[1][0].name
             clientObject.diagram_around_z_end = rotational_release_mz_nonlinearity[1][1].name
 
-            clientObject.diagram_around_z_table = Model.clientModel.factory.create('ns0:member_hinge.diagram_around_z_table')
+            clientObject.diagram_around_z_table = model.clientModel.factory.create('ns0:member_hinge.diagram_around_z_table')
 
             for i,j in enumerate(rotational_release_mz_nonlinearity[1][2]):
-                mlvlp = Model.clientModel.factory.create('ns0:member_hinge_diagram_around_z_table_row')
+                mlvlp = model.clientModel.factory.create('ns0:member_hinge_diagram_around_z_table_row')
                 mlvlp.no = i+1
                 mlvlp.row.rotation = rotational_release_mz_nonlinearity[1][2][i][0]
                 mlvlp.row.moment = rotational_release_mz_nonlinearity[1][2][i][1]
@@ -480,8 +478,5 @@ class MemberHinge():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Line to client model
-        model.clientModel.service.set_member_hinge(clientObject)
+        setObject('set_member_hinge', clientObject, model=model)
@@ -1,5 +1,6 @@
 from RFEM.enums import MemberNonlinearityType
-from RFEM.initModel import Model, clearAttributes, ConvertToDlString, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class MemberNonlinearity():
     def __init__(self,
@@ -22,10 +23,7 @@ class MemberNonlinearity():
         """
 
         # Client model | Member Nonlinearity
-        clientObject = model.clientModel.factory.create('ns0:member_nonlinearity')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_nonlinearity', model)
 
         # Member Nonlinearity No.
         clientObject.no = no
@@ -57,8 +55,5 @@ class MemberNonlinearity():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Nonlinearity to client model
-        model.clientModel.service.set_member_nonlinearity(clientObject)
+        setObject('set_member_nonlinearity', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, ConvertToDlString, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class MemberResultIntermediatePoint():
     def __init__(self,
@@ -23,10 +24,7 @@ class MemberResultIntermediatePoint():
         """
 
         # Client model | Member Result Intermediate Point
-        clientObject = model.clientModel.factory.create('ns0:member_result_intermediate_point')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_result_intermediate_point', model)
 
         # Member Result Intermediate Point No.
         clientObject.no = no
@@ -40,10 +38,10 @@ class MemberResultIntermediatePoint():
             clientObject.point_count = point_count
 
         else:
-            clientObject.distances = Model.clientModel.factory.create('ns0:member_result_intermediate_point.distances')
+            clientObject.distances = model.clientModel.factory.create('ns0:member_result_intermediate_point.distances')
 
             for i,j in enumerate(distances):
-                mlvlp = Model.clientModel.factory.create('ns0:member_result_intermediate_point_distances_row')
+                mlvlp = model.clientModel.factory.create('ns0:member_result_intermediate_point_distances_row')
                 mlvlp.no = i+1
                 mlvlp.row.value = distances[i][0]
                 mlvlp.row.note = None
@@ -58,8 +56,5 @@ class MemberResultIntermediatePoint():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Result Intermediate Point to client model
-        model.clientModel.service.set_member_result_intermediate_point(clientObject)
+        setObject('set_member_result_intermediate_point', clientObject, model=model)
@@ -1,5 +1,6 @@
 from RFEM.enums import MemberStiffnessModificationType
-from RFEM.initModel import Model, clearAttributes, ConvertToDlString, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class MemberStiffnessModification():
     def __init__(self,
@@ -36,10 +37,7 @@ class MemberStiffnessModification():
         """
 
         # Client model | Member Stiffness Modification
-        clientObject = model.clientModel.factory.create('ns0:member_stiffness_modification')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_stiffness_modification', model)
 
         # Member Stiffness Modification No.
         clientObject.no = no
@@ -100,8 +98,5 @@ class MemberStiffnessModification():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Stiffness Modification to client model
-        model.clientModel.service.set_member_stiffness_modification(clientObject)
+        setObject('set_member_stiffness_modification', clientObject, model=model)
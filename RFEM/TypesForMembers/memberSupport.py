@@ -1,5 +1,6 @@
 from RFEM.enums import MemberSupportNonlinearity
-from RFEM.initModel import Model, clearAttributes, ConvertToDlString, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.dataTypes import inf
 
 class MemberSupport():
@@ -33,10 +34,7 @@ class MemberSupport():
         """
 
         # Client model | Member Support
-        clientObject = model.clientModel.factory.create('ns0:member_support')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_support', model)
 
         # Member Support No.
         clientObject.no = no
@@ -64,8 +62,5 @@ class MemberSupport():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Support to client model
-        model.clientModel.service.set_member_support(clientObject)
+        setObject('set_member_support', clientObject, model=model)
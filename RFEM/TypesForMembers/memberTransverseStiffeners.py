@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, SetAddonStatus, clearAttributes, ConvertToDlString, deleteEmptyAttributes
+from RFEM.initModel import Model, SetAddonStatus, ConvertToDlString, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import MemberTransverseStiffenerType, MemberTransverseStiffenerPosition, MemberTransverseStiffenerOffsetType, MemberTransverseStiffenerDefinitionType, AddOn
 
 class MemberTransverseStiffeners():
@@ -58,10 +59,7 @@ class MemberTransverseStiffeners():
         SetAddonStatus(model.clientModel, AddOn.steel_design_active)
 
         # Client Model | Member Transverse Stiffeners
-        clientObject= model.clientModel.factory.create('ns0:member_transverse_stiffener')
-
-        # Clear Object Atributes | Set All Atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:member_transverse_stiffener', model)
 
         # Member Transverse Stiffeners No.
         clientObject.no = no
@@ -73,10 +71,10 @@ class MemberTransverseStiffeners():
         clientObject.member_sets = ConvertToDlString(member_sets)
 
         # Member Transverse Components
-        clientObject.components = Model.clientModel.factory.create('ns0:member_transverse_stiffener.components')
+        clientObject.components = model.clientModel.factory.create('ns0:member_transverse_stiffener.components')
 
         for i in components:
-            mlvlp = Model.clientModel.factory.create('ns0:member_transverse_stiffener_components_row')
+            mlvlp = model.clientModel.factory.create('ns0:member_transverse_stiffener_components_row')
             mlvlp.no = i['no']
             mlvlp.row.stiffener_type = i['stiffener_type'].name
             mlvlp.row.position = i['position']
@@ -117,8 +115,5 @@ class MemberTransverseStiffeners():
             for key in params:
                 clientObject[key]= params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Member Definable Stffness to client model
-        model.clientModel.service.set_member_transverse_stiffener(clientObject)
+        setObject('set_member_transverse_stiffener', clientObject, model=model)
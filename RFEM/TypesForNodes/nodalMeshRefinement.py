@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import NodalMeshRefinementType
 from enum import Enum
 
@@ -32,10 +33,7 @@ class NodalMeshRefinement():
         """
 
         # Client model | Nodal Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:nodal_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_mesh_refinement', model)
 
         # Nodal Mesh Refinement No.
         clientObject.no = no
@@ -64,11 +62,8 @@ class NodalMeshRefinement():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Mesh Refinement to client model
-        model.clientModel.service.set_nodal_mesh_refinement(clientObject)
+        setObject('set_nodal_mesh_refinement', clientObject, model=model)
 
     @staticmethod
     def Circular(
@@ -97,10 +92,7 @@ class NodalMeshRefinement():
         """
 
         # Client model | Nodal Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:nodal_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_mesh_refinement', model)
 
         # Nodal Mesh Refinement No.
         clientObject.no = no
@@ -125,11 +117,8 @@ class NodalMeshRefinement():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Mesh Refinement to client model
-        model.clientModel.service.set_nodal_mesh_refinement(clientObject)
+        setObject('set_nodal_mesh_refinement', clientObject, model=model)
 
     @staticmethod
     def Rectangular(
@@ -154,10 +143,7 @@ class NodalMeshRefinement():
         """
 
         # Client model | Nodal Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:nodal_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_mesh_refinement', model)
 
         # Nodal Mesh Refinement No.
         clientObject.no = no
@@ -180,8 +166,5 @@ class NodalMeshRefinement():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Mesh Refinement to client model
-        model.clientModel.service.set_nodal_mesh_refinement(clientObject)
+        setObject('set_nodal_mesh_refinement', clientObject, model=model)
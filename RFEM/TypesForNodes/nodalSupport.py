@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.dataTypes import inf
 from RFEM.enums import NodalSupportType
 
@@ -55,10 +56,7 @@ class NodalSupport():
         """
 
         # Client model | Nodal Support
-        clientObject = model.clientModel.factory.create('ns0:nodal_support')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:nodal_support', model)
 
         # Nodal Support No.
         clientObject.no = no
@@ -109,8 +107,5 @@ class NodalSupport():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Nodal Support to client model
-        model.clientModel.service.set_nodal_support(clientObject)
+        setObject('set_nodal_support', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SolidContactPerpendicularType, SolidContactParallelType
 
 class SolidContact():
@@ -39,10 +40,7 @@ class SolidContact():
         """
 
         # Client model | Solid Contact
-        clientObject = model.clientModel.factory.create('ns0:solid_contacts')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid_contacts', model)
 
         # Solid Contact No.
         clientObject.no = no
@@ -70,7 +68,7 @@ class SolidContact():
             raise ValueError(f'There are no parameters for contact {parallel_contact.name}')
 
         # Assigned to Solids
-        clientObject.solids = solids
+        clientObject.solids = ConvertToDlString(solids)
 
         # Comment
         clientObject.comment = comment
@@ -80,8 +78,5 @@ class SolidContact():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Solid Contact to client model
-        model.clientModel.service.set_solid_contacts(clientObject)
+        setObject('set_solid_contacts', clientObject, model=model)
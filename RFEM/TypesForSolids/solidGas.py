@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class SolidGas():
     def __init__(self,
@@ -23,10 +24,7 @@ class SolidGas():
         """
 
         # Client model | Solid Gas
-        clientObject = model.clientModel.factory.create('ns0:solid_gas')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid_gas', model)
 
         # Solid Gas No.
         clientObject.no = no
@@ -38,7 +36,7 @@ class SolidGas():
         clientObject.temperature = temperature
 
         # Assigned to Solids
-        clientObject.solids = solids
+        clientObject.solids = ConvertToDlString(solids)
 
         # Comment
         clientObject.comment = comment
@@ -48,8 +46,5 @@ class SolidGas():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Solid Gas to client model
-        model.clientModel.service.set_solid_gas(clientObject)
+        setObject('set_solid_gas', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class SolidMeshRefinement():
     def __init__(self,
@@ -21,10 +22,7 @@ class SolidMeshRefinement():
         """
 
         # Client model | Solid Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:solid_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:solid_mesh_refinement', model)
 
         # Solid Mesh Refinement No.
         clientObject.no = no
@@ -33,7 +31,7 @@ class SolidMeshRefinement():
         clientObject.target_length = target_length
 
         # Assigned to solids
-        clientObject.solids = solids
+        clientObject.solids = ConvertToDlString(solids)
 
         # Comment
         clientObject.comment = comment
@@ -43,8 +41,5 @@ class SolidMeshRefinement():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Solid Mesh Refinement to client model
-        model.clientModel.service.set_solid_mesh_refinement(clientObject)
+        setObject('set_solid_mesh_refinement', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SurfaceContactPerpendicularType, SurfaceContactParallelType, SurfaceContactFrictionType
 
 class SurfaceContactType():
@@ -33,10 +34,7 @@ class SurfaceContactType():
         """
 
         # Client model | Surface Contact
-        clientObject = model.clientModel.factory.create('ns0:surfaces_contact_type')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surfaces_contact_type', model)
 
         # Surface Contact No.
         clientObject.no = no
@@ -77,11 +75,8 @@ class SurfaceContactType():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Contact to client model
-        model.clientModel.service.set_surfaces_contact_type(clientObject)
+        setObject('set_surfaces_contact_type', clientObject, model=model)
 
     @staticmethod
     def FullForce(
@@ -102,10 +97,7 @@ class SurfaceContactType():
         """
 
         # Client model | Surface Contact
-        clientObject = model.clientModel.factory.create('ns0:surfaces_contact_type')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surfaces_contact_type', model)
 
         # Surface Contact No.
         clientObject.no = no
@@ -124,11 +116,8 @@ class SurfaceContactType():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Contact to client model
-        model.clientModel.service.set_surfaces_contact_type(clientObject)
+        setObject('set_surfaces_contact_type', clientObject, model=model)
 
     @staticmethod
     def RigidFriction(
@@ -153,10 +142,7 @@ class SurfaceContactType():
         """
 
         # Client model | Surface Contact
-        clientObject = model.clientModel.factory.create('ns0:surfaces_contact_type')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surfaces_contact_type', model)
 
         # Surface Contact No.
         clientObject.no = no
@@ -184,11 +170,8 @@ class SurfaceContactType():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Contact to client model
-        model.clientModel.service.set_surfaces_contact_type(clientObject)
+        setObject('set_surfaces_contact_type', clientObject, model=model)
 
     @staticmethod
     def ElasticFriction(
@@ -215,10 +198,7 @@ class SurfaceContactType():
         """
 
         # Client model | Surface Contact
-        clientObject = model.clientModel.factory.create('ns0:surfaces_contact_type')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surfaces_contact_type', model)
 
         # Surface Contact No.
         clientObject.no = no
@@ -249,11 +229,8 @@ class SurfaceContactType():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Contact to client model
-        model.clientModel.service.set_surfaces_contact_type(clientObject)
+        setObject('set_surfaces_contact_type', clientObject, model=model)
 
     @staticmethod
     def ElasticSurface(
@@ -276,10 +253,7 @@ class SurfaceContactType():
         """
 
         # Client model | Surface Contact
-        clientObject = model.clientModel.factory.create('ns0:surfaces_contact_type')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surfaces_contact_type', model)
 
         # Surface Contact No.
         clientObject.no = no
@@ -301,8 +275,5 @@ class SurfaceContactType():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Contact to client model
-        model.clientModel.service.set_surfaces_contact_type(clientObject)
+        setObject('set_surfaces_contact_type', clientObject, model=model)
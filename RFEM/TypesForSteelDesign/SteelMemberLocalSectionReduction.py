@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, clearAttributes, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SteelMemberLocalSectionReductionType, MultipleOffsetDefinitionType, FastenerDefinitionType
 
 class SteelMemberLocalSectionReduction():
@@ -44,10 +45,7 @@ class SteelMemberLocalSectionReduction():
         """
 
         # Client Model | Types For Steel Member Local Section Reduction
-        clientObject = model.clientModel.factory.create('ns0:steel_member_local_section_reduction')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:steel_member_local_section_reduction', model)
 
         #Local Section Reduction No.
         clientObject.no = no
@@ -95,8 +93,5 @@ class SteelMemberLocalSectionReduction():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Steel Member Local Section Reduction to Client Model
-        model.clientModel.service.set_steel_member_local_section_reduction(clientObject)
+        setObject('set_steel_member_local_section_reduction', clientObject, model=model)
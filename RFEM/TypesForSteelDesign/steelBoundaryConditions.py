@@ -1,5 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, ConvertToDlString, deleteEmptyAttributes
-from RFEM.enums import *
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.enums import SteelBoundaryConditionsSupportType, SteelBoundaryConditionsEccentricityTypeZ
 
 class SteelBoundaryConditions():
     def __init__(self,
@@ -82,10 +83,7 @@ class SteelBoundaryConditions():
         """
 
         # Client Model | Types For Steel Design Boundary Conditions
-        clientObject = model.clientModel.factory.create('ns0:steel_boundary_conditions')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:steel_boundary_conditions', model)
 
         # Boundary Conditions No.
         clientObject.no = no
@@ -177,8 +175,5 @@ class SteelBoundaryConditions():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Steel Boundary Conditions to client model
-        model.clientModel.service.set_steel_boundary_conditions(clientObject)
+        setObject('set_steel_boundary_conditions', clientObject, model=model)
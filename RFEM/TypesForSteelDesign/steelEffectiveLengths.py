@@ -1,5 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
-from RFEM.enums import *
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.enums import SteelEffectiveLengthsSupportType, SteelEffectiveLengthsEccentricityType, SteelEffectiveLengthsSupportTypeInY, SteelEffectiveLengthsRestraintTypeAboutX, SteelEffectiveLengthsRestraintTypeAboutZ, SteelEffectiveLengthsRestraintTypeWarping, SteelEffectiveLengthsDeterminationMcrEurope
 
 class SteelEffectiveLengths():
     def __init__(self,
@@ -81,10 +82,7 @@ class SteelEffectiveLengths():
         """
 
         # Client Model | Types For Steel Design Effective Lengths
-        clientObject = model.clientModel.factory.create('ns0:steel_effective_lengths')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:steel_effective_lengths', model)
 
         # Effective Lengths No.
         clientObject.no = no
@@ -183,8 +181,5 @@ class SteelEffectiveLengths():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Steel Effective Lengths to client model
-        model.clientModel.service.set_steel_effective_lengths(clientObject)
+        setObject('set_steel_effective_lengths', clientObject, model=model)
@@ -1,4 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString, GetAddonStatus, SetAddonStatus
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString, GetAddonStatus, SetAddonStatus
+from RFEM.modelMirror import GetModelInfo
+from RFEM.fastSerializer import setObject
 from RFEM.enums import AddOn, SteelMemberRotationalRestraintType
 
 class SteelMemberRotationalRestraint():
@@ -57,7 +59,7 @@ class SteelMemberRotationalRestraint():
         """
 
         # Deducing RFEM Language from steel_design_addon String:
-        modelInfo = Model.clientModel.service.get_model_info()
+        modelInfo = GetModelInfo(model)
         if modelInfo.property_addon_steel_design.split()[0] != 'Steel':
             raise ValueError("WARNING: The steelMemberRotationalRestraints operates with the RFEM Application set to English. Kindly switch RFEM to English such that Database searches can completed successfully.")
 
@@ -66,10 +68,7 @@ class SteelMemberRotationalRestraint():
             SetAddonStatus(model.clientModel, AddOn.steel_design_active, True)
 
         # Client Model / Types For Steel Design Member Rotational Restraints
-        clientObject = model.clientModel.factory.create('ns0:steel_member_rotational_restraint')
-
-        # Clears Object Attributes / Sets all the attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:steel_member_rotational_restraint', model)
 
         # Member Rotational Restraint No.
         clientObject.no = no
@@ -129,8 +128,5 @@ class SteelMemberRotationalRestraint():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Steel Member Rotational Restraint to Client Model
-        model.clientModel.service.set_steel_member_rotational_restraint(clientObject)
+        setObject('set_steel_member_rotational_restraint', clientObject, model=model)
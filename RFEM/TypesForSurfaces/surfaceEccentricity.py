@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SurfaceEccentricityAlignment
 from enum import Enum
 
@@ -34,10 +35,7 @@ class SurfaceEccentricity():
         """
 
         # Client model | Surface Eccentricity
-        clientObject = model.clientModel.factory.create('ns0:surface_eccentricity')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_eccentricity', model)
 
         # Surface Eccentricity No.
         clientObject.no = no
@@ -69,8 +67,5 @@ class SurfaceEccentricity():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Eccentricity to client model
-        model.clientModel.service.set_surface_eccentricity(clientObject)
+        setObject('set_surface_eccentricity', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 
 class SurfaceMeshRefinement():
     def __init__(self,
@@ -21,10 +22,7 @@ class SurfaceMeshRefinement():
         """
 
         # Client model | Surface Mesh Refinement
-        clientObject = model.clientModel.factory.create('ns0:surface_mesh_refinement')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_mesh_refinement', model)
 
         # Surface Mesh Refinement No.
         clientObject.no = no
@@ -43,8 +41,5 @@ class SurfaceMeshRefinement():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Mesh Refinement to client model
-        model.clientModel.service.set_surface_mesh_refinement(clientObject)
+        setObject('set_surface_mesh_refinement', clientObject, model=model)
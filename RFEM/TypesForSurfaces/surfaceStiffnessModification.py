@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject
+from RFEM.fastSerializer import setObject
 from RFEM.enums import SurfaceStiffnessModificationType
 
 class SurfaceStiffnessModification():
@@ -28,10 +29,7 @@ class SurfaceStiffnessModification():
         """
 
         # Client model | Surface Stifness Modification
-        clientObject = model.clientModel.factory.create('ns0:surface_stiffness_modification')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_stiffness_modification', model)
 
         # Surface Stifness Modification No.
         clientObject.no = no
@@ -104,8 +102,5 @@ class SurfaceStiffnessModification():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Stifness Modification to client model
-        model.clientModel.service.set_surface_stiffness_modification(clientObject)
+        setObject('set_surface_stiffness_modification', clientObject, model=model)
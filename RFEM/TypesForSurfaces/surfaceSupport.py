@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, ConvertToDlString, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.dataTypes import inf
 
 class SurfaceSupport():
@@ -30,10 +31,7 @@ class SurfaceSupport():
         """
 
         # Client model | Surface Support
-        clientObject = model.clientModel.factory.create('ns0:surface_support')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:surface_support', model)
 
         # Surface Support No.
         clientObject.no = no
@@ -56,8 +54,5 @@ class SurfaceSupport():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Surface Support to client model
-        model.clientModel.service.set_surface_support(clientObject)
+        setObject('set_surface_support', clientObject, model=model)
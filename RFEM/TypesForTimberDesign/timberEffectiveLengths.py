@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import TimberEffectiveLengthsSupportType, TimberEffectiveLengthsEccentricityType, TimberEffectiveLengthsSupportTypeInY, \
     TimberEffectiveLengthsRestraintTypeAboutX, TimberEffectiveLengthsDeterminationType
 
@@ -61,10 +62,7 @@ class TimberEffectiveLengths():
         """
 
         # Client Model | Types For Timber Design Effective Lengths
-        clientObject = model.clientModel.factory.create('ns0:timber_effective_lengths')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:timber_effective_lengths', model)
 
         # Effective Lengths No.
         clientObject.no = no
@@ -142,8 +140,5 @@ class TimberEffectiveLengths():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Timber Effective Lengths to client model
-        model.clientModel.service.set_timber_effective_lengths(clientObject)
+        setObject('set_timber_effective_lengths', clientObject, model=model)
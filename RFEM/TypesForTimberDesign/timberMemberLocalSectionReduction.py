@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, clearAttributes, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import TimberMemberLocalSectionReductionType, MultipleOffsetDefinitionType, ZAxisReferenceType, OrientationType, DirectionType
 
 class Components():
@@ -97,10 +98,7 @@ class TimberMemberLocalSectionReduction():
         """
 
         # Client Model | Types For Timber Member Local Section Reduction
-        clientObject = model.clientModel.factory.create('ns0:timber_member_local_section_reduction')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:timber_member_local_section_reduction', model)
 
         #Local Section Reduction No.
         clientObject.no = no
@@ -209,8 +207,5 @@ class TimberMemberLocalSectionReduction():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Timber Member Local Section Reduction to Client Model
-        model.clientModel.service.set_timber_member_local_section_reduction(clientObject)
+        setObject('set_timber_member_local_section_reduction', clientObject, model=model)
@@ -1,4 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString, GetAddonStatus, SetAddonStatus
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString, GetAddonStatus, SetAddonStatus
+from RFEM.modelMirror import GetModelInfo
+from RFEM.fastSerializer import setObject
 from RFEM.enums import AddOn
 
 class TimberMemberRotationalRestraint():
@@ -24,7 +26,7 @@ class TimberMemberRotationalRestraint():
         """
 
         # Deducing RFEM Language from timber_design_addon String:
-        modelInfo = Model.clientModel.service.get_model_info()
+        modelInfo = GetModelInfo(model)
         if modelInfo.property_addon_timber_design.split()[0] != 'Timber':
             raise ValueError("WARNING: The TimberMemberRotationalRestraints operates with the RFEM Application set to English. Kindly switch RFEM to English such that Database searches can completed successfully.")
 
@@ -33,10 +35,7 @@ class TimberMemberRotationalRestraint():
             SetAddonStatus(model.clientModel, AddOn.timber_design_active, True)
 
         # Client Model / Types For Timber Design Member Rotational Restraints
-        clientObject = model.clientModel.factory.create('ns0:timber_member_rotational_restraint')
-
-        # Clears Object Attributes / Sets all the attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:timber_member_rotational_restraint', model)
 
         # Member Rotational Restraint No.
         clientObject.no = no
@@ -66,8 +65,5 @@ class TimberMemberRotationalRestraint():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Timber Member Rotational Restraint to Client Model
-        model.clientModel.service.set_timber_member_rotational_restraint(clientObject)
+        setObject('set_timber_member_rotational_restraint', clientObject, model=model)
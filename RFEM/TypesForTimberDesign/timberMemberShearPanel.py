@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import PositionOnSection
 
 class TimberMemberShearPanel():
@@ -26,10 +27,7 @@ class TimberMemberShearPanel():
         """
 
          # Client Model | Types For Timber Design Member Shear Panel
-        clientObject = Model.clientModel.factory.create('ns0:timber_member_shear_panel')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:timber_member_shear_panel', Model)
 
         # Member Shear Panel No.
         clientObject.no = no
@@ -65,8 +63,5 @@ class TimberMemberShearPanel():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Timber Effective Lengths to client model
-        Model.clientModel.service.set_timber_member_shear_panel(clientObject)
+        setObject('set_timber_member_shear_panel', clientObject, model=Model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import TimberServiceClassServiceClass
 
 class TimberServiceClass():
@@ -26,10 +27,7 @@ class TimberServiceClass():
         """
 
          # Client Model | Types For Timber Design Service Class
-        clientObject = Model.clientModel.factory.create('ns0:timber_service_class')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:timber_service_class', Model)
 
         # Member Service Class
         clientObject.no = no
@@ -62,8 +60,5 @@ class TimberServiceClass():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Service Class to client model
-        Model.clientModel.service.set_timber_service_class(clientObject)
+        setObject('set_timber_service_class', clientObject, model=Model)
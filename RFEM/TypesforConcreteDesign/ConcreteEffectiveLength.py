@@ -1,5 +1,6 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
-from RFEM.enums import *
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
+from RFEM.enums import ConcreteEffectiveLengthsAxisZ, ConcreteEffectiveLengthAxisY, EffectiveLengthSupportType, EffectiveLengthEccentricityType, SupportStatus, RestraintTypeAboutX, RestraintTypeAboutZ, RestraintTypeWarping
 
 class ConcreteEffectiveLength():
     def __init__(self,
@@ -39,10 +40,7 @@ class ConcreteEffectiveLength():
         """
 
         # Client model | Concrete Durabilities
-        clientObject = model.clientModel.factory.create('ns0:concrete_effective_lengths')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:concrete_effective_lengths', model)
 
         # Concrete Durability No.
         clientObject.no = no
@@ -98,8 +96,5 @@ class ConcreteEffectiveLength():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Global Parameter to client model
-        model.clientModel.service.set_concrete_effective_lengths(clientObject)
+        setObject('set_concrete_effective_lengths', clientObject, model=model)
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, ConvertToDlString
+from RFEM.initModel import Model, createEmptyObject, ConvertToDlString
+from RFEM.fastSerializer import setObject
 from RFEM.enums import ReinforcementDirectionType
 from math import pi
 
@@ -25,10 +26,7 @@ class ConcreteReinforcementDirection():
         """
 
         # Client model | Concrete Durabilities
-        clientObject = model.clientModel.factory.create('ns0:reinforcement_direction')
-
-        # Clears object atributes | Sets all atributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:reinforcement_direction', model)
 
         # Concrete Durability No.
         clientObject.no = no
@@ -56,8 +54,5 @@ class ConcreteReinforcementDirection():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Global Parameter to client model
-        model.clientModel.service.set_reinforcement_direction(clientObject)
+        setObject('set_reinforcement_direction', clientObject, model=model)
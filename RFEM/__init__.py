@@ -1 +1,15 @@
+'''
+RFEM package. Submodules are imported on first access,
+e.g. import RFEM; RFEM.initModel.Model.
+'''
+import importlib
 
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    try:
+        return importlib.import_module('RFEM.' + name)
+    except ModuleNotFoundError as e:
+        if e.name != 'RFEM.' + name:
+            raise
+        raise AttributeError("module 'RFEM' has no attribute %r" % name) from None
@@ -0,0 +1,169 @@
+import re
+import asyncio
+import contextvars
+import enum
+from concurrent.futures import ThreadPoolExecutor
+from RFEM.initModel import Model, connectionGlobals, notifyModel
+from RFEM.enums import CaseObjectType
+from RFEM.suds_requests import RequestsTransport
+from RFEM.Results.resultTables import ResultTables, ConvertResults
+from RFEM.Results.resultCache import caches, MISSING
+
+class AsyncTransport():
+    '''
+    Asyncio wrapper of RequestsTransport.
+    Requests are posted from a pool of threads sharing one keep-alive
+    connection pool, so the event loop is never blocked by network.
+    '''
+    def __init__(self, concurrency: int = 8):
+        '''
+        Args:
+            concurrency (int): Maximum number of requests in flight
+        '''
+        self.transport = RequestsTransport(pool_maxsize=concurrency, compression=connectionGlobals.compression,
+                                           timeout=connectionGlobals.timeout)
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def send(self, request):
+        loop = asyncio.get_running_loop()
+        # Context carries active suds_requests.deadline() to the thread
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self.executor, context.run, self.transport.send, request)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+class AsyncService():
+    '''
+    Counterpart of Client.service with awaitable methods,
+    e.g. await asyncModel.service.get_node(1).
+    Successful operations other than get_* and has_* are notified to
+    observers of the model (see initModel.observeModel()) the same way
+    as synchronous changes made through the library.
+    '''
+    def __init__(self, asyncModel):
+        self.asyncModel = asyncModel
+
+    def __getattr__(self, operation):
+        if operation.startswith('_'):
+            raise AttributeError(operation)
+
+        async def method(*args):
+            result = await self.asyncModel.call(operation, *args)
+            if operation == 'delete_object':
+                # Same arguments as notified by fastSerializer.deleteObject(): type, no, parent_no
+                args = (args + (0,))[:3]
+            if not operation.startswith(('get_', 'has_')):
+                notifyModel(self.asyncModel.clientModel, operation, args)
+            return result
+        return method
+
+class AsyncResultTables():
+    '''
+    Counterpart of ResultTables with awaitable methods,
+    e.g. await asyncModel.ResultTables.MembersInternalForces(loading_type, 1, 1).
+    Results are the same as of ResultTables and share the cache of the model.
+    '''
+    def __init__(self, asyncModel):
+        self.asyncModel = asyncModel
+
+    @staticmethod
+    def operation(name: str):
+        '''
+        SOAP operation of ResultTables method, e.g. MembersInternalForces ->
+        get_results_for_members_internal_forces.
+        '''
+        if not callable(getattr(ResultTables, name, None)) or name.startswith('Has'):
+            raise AttributeError(name)
+        return 'get_results_for_' + re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+    def __getattr__(self, name):
+        operation = self.operation(name)
+
+        async def method(
+                loading_type: enum = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE,
+                loading_no: int = 1,
+                object_no: int = 1,
+                output: str = 'dicts'):
+            # Summary doesn't take object number
+            args = [loading_type.name, loading_no]
+            if name != 'Summary':
+                args.append(object_no)
+            return ConvertResults(await self.results(operation, tuple(args)), output)
+        return method
+
+    async def results(self, operation: str, args: tuple):
+        '''
+        Result table served by the cache of the model (see ResultCache), if there is one.
+        '''
+        cache = caches.get(self.asyncModel.clientModel)
+        if not cache:
+            return await self.asyncModel.call(operation, *args)
+
+        results = cache.lookup(operation, args)
+        if results is MISSING:
+            generation = cache.generation
+            results = await self.asyncModel.call(operation, *args)
+            cache.store(operation, args, results, generation)
+        return results
+
+class AsyncModel():
+    '''
+    Asyncio facade of a model. SOAP messages are built and replies are
+    processed by suds Client of the model, so the results are the same
+    as of synchronous calls. Only the network part runs concurrently.
+
+    Example:
+        asyncModel = AsyncModel(Model)
+        results = await asyncio.gather(*[asyncModel.ResultTables.MembersInternalForces(
+            CaseObjectType.E_OBJECT_TYPE_LOAD_CASE, 1, i) for i in range(1, 101)])
+    '''
+    def __init__(self, model = Model, concurrency: int = 8):
+        '''
+        Args:
+            model (RFEM Class, optional): Model to be used
+            concurrency (int, optional): Maximum number of requests in flight
+        '''
+        self.clientModel = model.clientModel
+        self.transport = AsyncTransport(concurrency)
+        self.service = AsyncService(self)
+        self.ResultTables = AsyncResultTables(self)
+
+    async def call(self, operation: str, *args):
+        '''
+        Invoke SOAP operation of the model.
+
+        Args:
+            operation (str): Name of the operation, e.g. 'get_node'
+            args: Arguments of the operation
+        '''
+        from suds.client import SoapClient
+        from suds.transport import Request, TransportError
+
+        method = getattr(self.clientModel.service, operation).method
+        soapClient = SoapClient(self.clientModel, method)
+        binding = method.binding.input
+
+        request = Request(soapClient.location(), binding.get_message(method, args, {}).plain().encode('utf-8'))
+        request.headers = soapClient.headers()
+
+        # Same processing of reply as in SoapClient.send()
+        try:
+            reply = await self.transport.send(request)
+            return soapClient.succeeded(binding, reply.message)
+        except TransportError as e:
+            if e.httpcode in (202, 204):
+                return None
+            return soapClient.failed(binding, e)
+
+    def close(self):
+        '''
+        Release threads of the transport.
+        '''
+        self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
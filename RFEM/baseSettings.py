@@ -1,4 +1,5 @@
 from RFEM.initModel import Model
+from RFEM.fastSerializer import setObject
 from RFEM.enums import GlobalAxesOrientationType, LocalAxesOrientationType
 
 class BaseSettings():
@@ -49,4 +50,4 @@ class BaseSettings():
         clientObject.member_set_representatives_active = member_set_representatives
 
         # Add Base Data Settings to client model
-        model.clientModel.service.set_model_settings_and_options(clientObject)
+        setObject('set_model_settings_and_options', clientObject, model=model)
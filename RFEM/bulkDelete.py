@@ -0,0 +1,118 @@
+import copy
+from RFEM.enums import ObjectTypes
+from RFEM.initModel import Model, ConvertStrToListOfInt
+from RFEM.dataTypes import IntRangeSet
+from RFEM.fastSerializer import setObject, deleteObject
+from RFEM.modelMirror import GetObject, GetObjectLocations
+from RFEM.modelBuilder import flushedTarget
+
+# Loads assigned to objects of given type: {object type: [(load type, assignment field)]}
+DEPENDENT_LOADS = {
+    ObjectTypes.E_OBJECT_TYPE_NODE: [(ObjectTypes.E_OBJECT_TYPE_NODAL_LOAD, 'nodes'),
+                                     (ObjectTypes.E_OBJECT_TYPE_IMPOSED_NODAL_DEFORMATION, 'nodes')],
+    ObjectTypes.E_OBJECT_TYPE_LINE: [(ObjectTypes.E_OBJECT_TYPE_LINE_LOAD, 'lines'),
+                                     (ObjectTypes.E_OBJECT_TYPE_IMPOSED_LINE_DEFORMATION, 'lines')],
+    ObjectTypes.E_OBJECT_TYPE_MEMBER: [(ObjectTypes.E_OBJECT_TYPE_MEMBER_LOAD, 'members')],
+    ObjectTypes.E_OBJECT_TYPE_SURFACE: [(ObjectTypes.E_OBJECT_TYPE_SURFACE_LOAD, 'surfaces'),
+                                        (ObjectTypes.E_OBJECT_TYPE_FREE_CONCENTRATED_LOAD, 'surfaces'),
+                                        (ObjectTypes.E_OBJECT_TYPE_FREE_LINE_LOAD, 'surfaces'),
+                                        (ObjectTypes.E_OBJECT_TYPE_FREE_RECTANGULAR_LOAD, 'surfaces'),
+                                        (ObjectTypes.E_OBJECT_TYPE_FREE_CIRCULAR_LOAD, 'surfaces'),
+                                        (ObjectTypes.E_OBJECT_TYPE_FREE_POLYGON_LOAD, 'surfaces')],
+    ObjectTypes.E_OBJECT_TYPE_SOLID: [(ObjectTypes.E_OBJECT_TYPE_SOLID_LOAD, 'solids')],
+    ObjectTypes.E_OBJECT_TYPE_OPENING: [(ObjectTypes.E_OBJECT_TYPE_OPENING_LOAD, 'openings')],
+    ObjectTypes.E_OBJECT_TYPE_LINE_SET: [(ObjectTypes.E_OBJECT_TYPE_LINE_SET_LOAD, 'line_sets')],
+    ObjectTypes.E_OBJECT_TYPE_MEMBER_SET: [(ObjectTypes.E_OBJECT_TYPE_MEMBER_SET_LOAD, 'member_sets')],
+    ObjectTypes.E_OBJECT_TYPE_SURFACE_SET: [(ObjectTypes.E_OBJECT_TYPE_SURFACE_SET_LOAD, 'surface_sets')],
+    ObjectTypes.E_OBJECT_TYPE_SOLID_SET: [(ObjectTypes.E_OBJECT_TYPE_SOLID_SET_LOAD, 'solid_sets')],
+}
+
+def dependentLoads(deleted: dict, model = Model):
+    '''
+    Loads assigned to deleted objects.
+
+    Args:
+        deleted (dict): {object type: IntRangeSet of numbers}
+        model (RFEM Class, optional): Model to be read
+
+    Returns:
+        tuple: (loads to be deleted, loads to be updated), list of (load type, no, load case)
+            and list of (set_* operation, load case, load with remaining assignment)
+    '''
+    removed, updated = [], []
+    for objectType, numbers in deleted.items():
+        for loadType, field in DEPENDENT_LOADS.get(objectType, []):
+            for no, load_case_no in sorted(GetObjectLocations(loadType, model)):
+                load = GetObject(loadType, no, load_case_no, model)
+                assigned = ConvertStrToListOfInt(getattr(load, field, None) or '')
+                remaining = [i for i in assigned if i not in numbers]
+                if len(remaining) == len(assigned):
+                    continue
+                if not remaining:
+                    removed.append((loadType, no, load_case_no))
+                else:
+                    # Objects of the mirror must not be modified in place
+                    load = copy.deepcopy(load)
+                    setattr(load, field, ' '.join(map(str, remaining)))
+                    operation = 'set_' + loadType.name[len('E_OBJECT_TYPE_'):].lower()
+                    updated.append((operation, load_case_no, load))
+    return removed, updated
+
+def pipelineDelete(objects: list, concurrency: int, model = Model):
+    '''
+    Send delete_object requests of objects concurrently over one keep-alive connection pool.
+    '''
+    import asyncio
+    from RFEM.asyncModel import AsyncModel
+
+    async def delete():
+        async with AsyncModel(model, concurrency) as asyncModel:
+            await asyncio.gather(*[asyncModel.service.delete_object(objectType.name, no, *((parent_no,) if parent_no else ()))
+                                   for objectType, no, parent_no in objects])
+
+    # Deletes are notified by AsyncService
+    asyncio.run(delete())
+
+def DeleteObjects(objects: dict, loads: bool = False, concurrency: int = 1, modification: bool = False, model = Model):
+    '''
+    Delete objects of several types at once. Object types are deleted in the given order.
+    Deletes are sent inside modification window of the caller, if there is one. With
+    modification enabled, own window is opened, so the model is regenerated only once.
+
+    Example:
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_MEMBER: '1-20000',
+                       ObjectTypes.E_OBJECT_TYPE_NODE: range(1, 20002)}, loads=True, modification=True)
+
+    Args:
+        objects (dict): {Object Type Enumeration: numbers}, numbers are RFEM common string,
+            single number, IntRangeSet or iterable of numbers
+        loads (bool, optional): Remove loads assigned to deleted objects as well.
+            Loads assigned only to deleted objects are deleted, assignment of other loads is reduced.
+        concurrency (int, optional): Number of delete requests in flight. Requests of one object
+            type are pipelined if greater than 1.
+        modification (bool, optional): Delete objects inside own modification window.
+            Don't enable it inside window opened by the caller, ModelBuilder or Transaction.
+        model (RFEM Class, optional): Model to be edited. Objects buffered by ModelBuilder
+            or Transaction are sent first, then objects are deleted in the model they write to.
+    '''
+    model = flushedTarget(model)
+    deleted = {objectType: IntRangeSet(numbers) for objectType, numbers in objects.items()}
+    removed, updated = dependentLoads(deleted, model) if loads else ([], [])
+
+    service = model.clientModel.service
+    if modification:
+        service.begin_modification('DeleteObjects')
+    try:
+        for operation, load_case_no, load in updated:
+            setObject(operation, load_case_no, load, model=model)
+
+        phases = [removed] + [[(objectType, no, 0) for no in numbers] for objectType, numbers in deleted.items()]
+        for phase in phases:
+            if concurrency > 1 and len(phase) > 1:
+                pipelineDelete(phase, concurrency, model)
+            else:
+                for objectType, no, parent_no in phase:
+                    deleteObject(objectType, no, parent_no, model=model)
+    finally:
+        if modification:
+            service.finish_modification()
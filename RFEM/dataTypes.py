@@ -1,3 +1,148 @@
 # Specific data types
+from bisect import bisect_right
 
 inf = float('inf')
+
+class IntRangeSet():
+    '''
+    Set of object numbers stored as sorted runs of consecutive numbers,
+    so '1-100000' takes one run instead of 100000 numbers.
+    It is accepted everywhere RFEM common string or list of numbers is,
+    see ConvertToDlString() and ConvertStrToListOfInt().
+
+    Example:
+        members = IntRangeSet('1-100000') | IntRangeSet([200001, 200002])
+        str(members)  -> '1-100000 200001-200002'
+    '''
+    __slots__ = ('runs',)
+
+    def __init__(self, numbers = None):
+        '''
+        Args:
+            numbers (optional): RFEM common string (e.g. '1-3, 5'), number,
+                range or any iterable of numbers (list, NumPy array, ...)
+        '''
+        if numbers is None:
+            runs = []
+        elif isinstance(numbers, IntRangeSet):
+            runs = numbers.runs
+        elif isinstance(numbers, str):
+            runs = []
+            for token in numbers.replace(',', ' ').split():
+                if '-' in token:
+                    start, end = token.split('-')
+                    runs.append((int(start), int(end)))
+                else:
+                    runs.append((int(token), int(token)))
+        elif isinstance(numbers, int):
+            runs = [(numbers, numbers)]
+        elif isinstance(numbers, range) and numbers.step == 1:
+            runs = [(numbers.start, numbers.stop - 1)] if numbers else []
+        else:
+            runs = []
+            for no in sorted({int(no) for no in numbers}):
+                if runs and runs[-1][1] == no - 1:
+                    runs[-1] = (runs[-1][0], no)
+                else:
+                    runs.append((no, no))
+        self.runs = IntRangeSet.normalized(runs)
+
+    @staticmethod
+    def normalized(runs: list):
+        '''
+        Sorted runs with overlapping and adjacent runs merged.
+        '''
+        merged = []
+        for start, end in sorted((min(run), max(run)) for run in runs):
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    @staticmethod
+    def fromRuns(runs: list):
+        '''
+        IntRangeSet from list of (first, last) runs.
+        '''
+        rangeSet = IntRangeSet()
+        rangeSet.runs = IntRangeSet.normalized(runs)
+        return rangeSet
+
+    def union(self, other):
+        return IntRangeSet.fromRuns(self.runs + IntRangeSet(other).runs)
+
+    def intersection(self, other):
+        other = IntRangeSet(other).runs
+        runs = []
+        i = j = 0
+        while i < len(self.runs) and j < len(other):
+            start = max(self.runs[i][0], other[j][0])
+            end = min(self.runs[i][1], other[j][1])
+            if start <= end:
+                runs.append((start, end))
+            if self.runs[i][1] < other[j][1]:
+                i += 1
+            else:
+                j += 1
+        rangeSet = IntRangeSet()
+        rangeSet.runs = runs
+        return rangeSet
+
+    def difference(self, other):
+        other = IntRangeSet(other).runs
+        runs = []
+        j = 0
+        for start, end in self.runs:
+            # Skip runs of other ending before this run
+            while j < len(other) and other[j][1] < start:
+                j += 1
+            k = j
+            while k < len(other) and other[k][0] <= end:
+                if other[k][0] > start:
+                    runs.append((start, other[k][0] - 1))
+                start = max(start, other[k][1] + 1)
+                k += 1
+            if start <= end:
+                runs.append((start, end))
+        rangeSet = IntRangeSet()
+        rangeSet.runs = runs
+        return rangeSet
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __iter__(self):
+        for start, end in self.runs:
+            yield from range(start, end + 1)
+
+    def __len__(self):
+        return sum(end - start + 1 for start, end in self.runs)
+
+    def __bool__(self):
+        return bool(self.runs)
+
+    def __contains__(self, no):
+        i = bisect_right(self.runs, (no, inf)) - 1
+        return i >= 0 and self.runs[i][1] >= no
+
+    def __eq__(self, other):
+        return isinstance(other, IntRangeSet) and self.runs == other.runs
+
+    def __hash__(self):
+        return hash(tuple(self.runs))
+
+    def __str__(self):
+        # Compact RFEM common string
+        return ' '.join(str(start) if start == end else '%d-%d' % (start, end) for start, end in self.runs)
+
+    def __repr__(self):
+        return "IntRangeSet('%s')" % self
+
+    def toDlString(self):
+        '''
+        Numbers separated by spaces as expected by web services, see ConvertToDlString().
+        '''
+        return ' '.join(map(str, self))
@@ -6,15 +6,14 @@ if not sys.version_info[0] == 3:
     input('Press Enter to exit...')
     sys.exit()
 
-# Check all dependencies
+# Check all dependencies.
+# Modules are only located, not imported, so the check doesn't slow down import of RFEM.
+# Test tooling (pytest, mock) isn't needed at runtime.
 try:
-    import requests
-    import six
-    import xmltodict
-    import pytest
-    import mock
-    import suds.transport
-    import suds.client # suds-py3
+    from importlib.util import find_spec
+    for module in ('requests', 'six', 'xmltodict', 'suds'): # suds-py3
+        if find_spec(module) is None:
+            raise ImportError(module)
 
 except:
     print('One of the required modules is not installed in your Python env.')
@@ -0,0 +1,186 @@
+import re
+from weakref import WeakKeyDictionary
+from RFEM.initModel import Model, notifyModel, targetClient
+
+# Object types handled by fast serializer
+FAST_OPERATIONS = ('set_node', 'set_member', 'set_line', 'set_surface', 'set_member_load', 'set_nodal_load')
+
+# Sentinels used when rendering template of an operation
+ARG_SENTINEL = 918273645
+NO_SENTINEL = 546372819
+
+def escape(text: str):
+    '''
+    Escape XML special characters, same as xml.sax.saxutils.escape(),
+    which imports urllib.request and would slow down import of RFEM.
+    '''
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+class RawEnvelope():
+    '''
+    Already serialized SOAP envelope.
+    Replaces suds Document in SoapClient.send().
+    '''
+    def __init__(self, text: str):
+        self.text = text
+
+    def root(self):
+        return None
+
+    def plain(self):
+        return self.text
+
+    def str(self):
+        return self.text
+
+    def __str__(self):
+        return self.text
+
+class FastSerializer():
+    '''
+    Serializes set_* calls straight to SOAP XML without suds marshalling.
+    Envelope of every operation is rendered by suds only once and kept
+    as template. Object fields are then written in the order of the schema.
+    Objects with other than scalar fields are left to suds.
+    '''
+    def __init__(self, clientModel):
+        '''
+        Args:
+            clientModel (suds.client.Client): Model client
+        '''
+        self.clientModel = clientModel
+        self.templates = {}
+
+    def template(self, operation: str, args_count: int):
+        '''
+        Template of operation.
+
+        Returns:
+            tuple: (head, tail, prefix), head is format string with
+                placeholder for every leading argument, prefix is namespace
+                prefix of object fields.
+        '''
+        key = (operation, args_count)
+        if key in self.templates:
+            return self.templates[key]
+
+        method = getattr(self.clientModel.service, operation).method
+        # set_node sets ns0:node etc.
+        clientObject = self.clientModel.factory.create('ns0:' + operation[4:])
+        for attribute in list(clientObject.__keylist__):
+            delattr(clientObject, attribute)
+        clientObject.no = NO_SENTINEL
+
+        args = [ARG_SENTINEL + i for i in range(args_count)] + [clientObject]
+        envelope = method.binding.input.get_message(method, args, {}).plain()
+
+        match = re.search(r'<((?:\w+:)?)no>%d</\1no>' % NO_SENTINEL, envelope)
+        head = envelope[:match.start()].replace('{', '{{').replace('}', '}}')
+        for i in range(args_count):
+            head = head.replace(str(ARG_SENTINEL + i), '{%d}' % i)
+
+        self.templates[key] = (head, envelope[match.end():], match.group(1))
+        return self.templates[key]
+
+    @staticmethod
+    def value(value):
+        '''
+        Scalar value as XML text, None if value is not a scalar.
+        '''
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, (int, float)):
+            return str(value)
+        if isinstance(value, str):
+            return escape(value)
+        return None
+
+    def serialize(self, operation: str, *args):
+        '''
+        Serialize set_* call.
+
+        Args:
+            operation (str): Name of the operation, e.g. 'set_node'
+            args: Arguments of the operation, leading scalars (e.g. load_case_no)
+                followed by object without empty attributes (see deleteEmptyAttributes)
+
+        Returns:
+            str: SOAP envelope, None if object can't be serialized by template
+        '''
+        clientObject = args[-1]
+        args = args[:-1]
+        head, tail, prefix = self.template(operation, len(args))
+
+        fields = []
+        for attribute, value in clientObject:
+            text = self.value(value)
+            if text is None:
+                return None
+            fields.append('<%s%s>%s</%s%s>' % (prefix, attribute, text, prefix, attribute))
+
+        return head.format(*args) + ''.join(fields) + tail
+
+    def send(self, operation: str, *args):
+        '''
+        Serialize and send set_* call. Falls back to suds when object
+        can't be serialized by template.
+        '''
+        method = getattr(self.clientModel.service, operation)
+        envelope = self.serialize(operation, *args)
+        if envelope is None:
+            return method(*args)
+
+        from suds.client import SoapClient
+        return SoapClient(self.clientModel, method.method).send(RawEnvelope(envelope))
+
+serializers = WeakKeyDictionary()
+
+def useFastSerializer(enabled: bool = True, model = Model):
+    '''
+    Enable or disable fast serializer of set_* calls for
+    nodes, members, lines, surfaces, member loads and nodal loads.
+
+    Args:
+        enabled (bool): Enable/Disable fast serializer
+        model (RFEM Class, optional): Model to be edited
+    '''
+    if enabled:
+        serializers[model.clientModel] = FastSerializer(model.clientModel)
+    else:
+        serializers.pop(model.clientModel, None)
+
+def setObject(operation: str, *args, model = Model):
+    '''
+    Call set_* operation, e.g. setObject('set_node', clientObject).
+    Fast serializer is used if it is enabled for the model.
+
+    Args:
+        operation (str): Name of the operation, e.g. 'set_node'
+        args: Arguments of the operation, e.g. load_case_no, clientObject
+        model (RFEM Class, optional): Model to be edited
+    '''
+    serializer = serializers.get(model.clientModel)
+    if serializer and operation in FAST_OPERATIONS:
+        result = serializer.send(operation, *args)
+    else:
+        result = getattr(model.clientModel.service, operation)(*args)
+    # Writes buffered by ModelBuilder are notified when the buffer is sent
+    if targetClient(model.clientModel) is model.clientModel:
+        notifyModel(model.clientModel, operation, args)
+    return result
+
+def deleteObject(objectType, no: int, parent_no: int = 0, model = Model):
+    '''
+    Delete object, e.g. deleteObject(ObjectTypes.E_OBJECT_TYPE_NODE, 1).
+
+    Args:
+        objectType (enum): Object Type Enumeration
+        no (int): Number of the object
+        parent_no (int, optional): Number of parent object, e.g. load case of loads
+        model (RFEM Class, optional): Model to be edited
+    '''
+    if parent_no:
+        model.clientModel.service.delete_object(objectType.name, no, parent_no)
+    else:
+        model.clientModel.service.delete_object(objectType.name, no)
+    notifyModel(model.clientModel, 'delete_object', (objectType.name, no, parent_no))
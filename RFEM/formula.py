@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes
+from RFEM.initModel import Model, createEmptyObject, clearAttributes, deleteEmptyAttributes
+from RFEM.fastSerializer import setObject
 from RFEM.enums import ObjectTypes, FormulaParameter
 
 class Formula():
@@ -43,7 +44,7 @@ class Formula():
         deleteEmptyAttributes(opl)
 
         # Add Formula to client model
-        model.clientModel.service.set_formula(lc, opl, formula)
+        setObject('set_formula', lc, opl, formula, model=model)
 
 
     @staticmethod
@@ -114,10 +115,7 @@ class Formula():
         '''
 
         # Client model | Object Location
-        clientObject = model.clientModel.factory.create('ns0:object_location')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:object_location', model)
 
         clientObject.type = object_type.name
         clientObject.no = object_no
@@ -1,4 +1,5 @@
-from RFEM.initModel import Model, clearAttributes, deleteEmptyAttributes, SetAddonStatus
+from RFEM.initModel import Model, createEmptyObject, SetAddonStatus
+from RFEM.fastSerializer import setObject
 from RFEM.enums import GlobalParameterUnitGroup, GlobalParameterDefinitionType, AddOn
 
 class GlobalParameter():
@@ -38,10 +39,7 @@ class GlobalParameter():
         '''
 
         # Client model | Global Parameter
-        clientObject = model.clientModel.factory.create('ns0:global_parameter')
-
-        # Clears object attributes | Sets all attributes to None
-        clearAttributes(clientObject)
+        clientObject = createEmptyObject('ns0:global_parameter', model)
 
         # Global Parameter No.
         clientObject.no = no
@@ -85,8 +83,5 @@ class GlobalParameter():
             for key in params:
                 clientObject[key] = params[key]
 
-        # Delete None attributes for improved performance
-        deleteEmptyAttributes(clientObject)
-
         # Add Global Parameter to client model
-        model.clientModel.service.set_global_parameter(clientObject)
+        setObject('set_global_parameter', clientObject, model=model)
@@ -0,0 +1,162 @@
+from weakref import WeakKeyDictionary
+from RFEM.initModel import Model, observeModel, unobserveModel, targetClient
+from RFEM.modelMirror import objectKey, staleTypes, GetObjectLocations, RESET_OPERATIONS
+
+# Allocator attached to every model client, see IdAllocator.attach()
+allocators = WeakKeyDictionary()
+
+def getAllocator(model = Model):
+    '''
+    Allocator of the model, None if there is none. Models of ModelBuilder
+    and Transaction use the allocator of the model they write to.
+    '''
+    return allocators.get(targetClient(model.clientModel))
+
+class IdAllocator():
+    '''
+    Client-side allocator of object numbers. Numbers in use are read only
+    once per object type, then numbers following the highest one are handed
+    out locally. Objects written through the library are recorded, so the
+    numbers never collide with objects created by constructors.
+    Numbers freed by deleting objects are not reused.
+
+    Numbers in use are read only once, so objects created in RFEM directly
+    afterwards (e.g. in the GUI) are not known to the allocator and their
+    numbers can be handed out again. Attach the allocator only while the
+    model is edited by the script alone. Objects RFEM creates by itself
+    (e.g. line of member defined by nodes, see modelMirror.staleTypes())
+    are taken into account by reading numbers of their type again.
+
+    Example:
+        IdAllocator.attach()
+        for i in AllocateIdNumbers(ObjectTypes.E_OBJECT_TYPE_NODE, 100):
+            Node(i, i*2.0, 0.0, 0.0)
+    '''
+    def __init__(self, model = Model, empty: bool = False):
+        '''
+        Args:
+            model (RFEM Class, optional): Model to allocate numbers in
+            empty (bool, optional): Model is empty, so numbers in use don't have to be read
+        '''
+        self.model = model
+        self.empty = empty
+        # (ObjectTypes member, parent_no): next free number
+        self.counters = {}
+        # Object types with numbers in use read
+        self.seeded = set()
+
+    @staticmethod
+    def attach(model = Model, empty: bool = False):
+        '''
+        Create allocator of the model and start recording of its changes.
+        FirstFreeIdNumber() and AllocateIdNumbers() use the allocator from then on.
+
+        Args:
+            model (RFEM Class, optional): Model to allocate numbers in
+            empty (bool, optional): Model is empty
+        '''
+        IdAllocator.detach(model)
+        allocator = IdAllocator(model, empty)
+        allocators[targetClient(model.clientModel)] = allocator
+        observeModel(allocator.record, model)
+        return allocator
+
+    @staticmethod
+    def detach(model = Model):
+        '''
+        Stop recording and drop allocator of the model.
+
+        Args:
+            model (RFEM Class, optional): Model with allocator
+        '''
+        allocator = allocators.pop(targetClient(model.clientModel), None)
+        if allocator:
+            unobserveModel(allocator.record, model)
+
+    def seed(self, objectType):
+        '''
+        Read numbers in use of given type, once per type.
+        '''
+        if objectType in self.seeded:
+            return
+        self.seeded.add(objectType)
+        if self.empty:
+            return
+        for no, parent_no in GetObjectLocations(objectType, self.model):
+            key = (objectType, parent_no)
+            self.counters[key] = max(self.counters.get(key, 1), no + 1)
+
+    def record(self, operation: str, args: tuple):
+        '''
+        Record change of the model, see initModel.observeModel().
+        '''
+        if operation == 'delete_all':
+            self.counters.clear()
+            self.seeded.clear()
+            self.empty = True
+        elif operation in RESET_OPERATIONS:
+            # Objects may have been created, e.g. by import
+            self.seeded.clear()
+            self.empty = False
+        elif operation.startswith('set_'):
+            key = objectKey(operation, args)
+            if key:
+                objectType, no, parent_no = key
+                counter = (objectType, parent_no)
+                self.counters[counter] = max(self.counters.get(counter, 1), no + 1)
+                # Objects created by RFEM, e.g. line of member defined by nodes, are read again
+                stale = staleTypes(operation, args)
+                if stale:
+                    self.seeded -= stale
+                    self.empty = False
+
+    def block(self, objectType, count: int, parent_no: int = 0):
+        '''
+        Reserve contiguous block of numbers.
+
+        Args:
+            objectType (enum): Object Type Enumeration
+            count (int): Number of reserved numbers
+            parent_no (int, optional): Number of parent object, e.g. load case of loads
+
+        Returns:
+            range: Reserved numbers
+        '''
+        self.seed(objectType)
+        key = (objectType, parent_no)
+        first = self.counters.get(key, 1)
+        self.counters[key] = first + count
+        return range(first, first + count)
+
+    def peek(self, objectType, parent_no: int = 0):
+        '''
+        Number, which would be reserved next. Nothing is reserved.
+        '''
+        self.seed(objectType)
+        return self.counters.get((objectType, parent_no), 1)
+
+    def next(self, objectType, parent_no: int = 0):
+        '''
+        Reserve one number.
+        '''
+        return self.block(objectType, 1, parent_no)[0]
+
+def AllocateIdNumbers(objectType, count: int, parent_no: int = 0, model = Model):
+    '''
+    Contiguous block of free numbers following the highest number in use.
+    Served by the allocator of the model, if there is one.
+
+    Args:
+        objectType (enum): Object Type Enumeration
+        count (int): Number of requested numbers
+        parent_no (int, optional): Number of parent object, e.g. load case of loads
+        model (RFEM Class, optional): Model to allocate numbers in
+
+    Returns:
+        range: Free numbers
+    '''
+    allocator = getAllocator(model)
+    if allocator:
+        return allocator.block(objectType, count, parent_no)
+    first = max([no for no, parent in GetObjectLocations(objectType, model) if parent == parent_no], default=0) + 1
+    return range(first, first + count)
@@ -1,72 +1,196 @@
 import os
-import sys
+import functools
+from weakref import WeakKeyDictionary
 import RFEM.dependencies # dependency check ahead of imports
 import socket
-import requests
-from suds.client import Client
 from RFEM.enums import ObjectTypes, ModelType, AddOn
-from RFEM.suds_requests import RequestsTransport
-from suds.cache import DocumentCache
+from RFEM.dataTypes import IntRangeSet
 from tempfile import gettempdir
 
-# Connect to server
-# Check server port range set in "Program Options & Settings"
-# By default range is set between 8081 ... 8089
-print('Connecting to server...')
+class connectionGlobals():
+    '''
+    Connection to RFEM application shared by all models.
+    It is populated by connectToServer(), which is invoked on first use
+    of the client, so importing RFEM doesn't open any connection.
+    '''
+    # local machine url format: 'http://127.0.0.1'
+    url = 'http://127.0.0.1'
+    # port format: '8081'
+    port = '8081'
+    client = None
+    ca = None
+    session = None
+    poolSize = 1
+    compression = True
+    timeout = None
+    version = ''
+    connected = False
+
+def connectToServer(url: str = connectionGlobals.url, port: str = connectionGlobals.port, pool_size: int = 1, compression: bool = True, timeout = None):
+    '''
+    Connect to RFEM application server.
+    Check server port range set in "Program Options & Settings".
+    By default range is set between 8081 ... 8089.
+    It is called automatically with default parameters on first use of the client.
+    Call it explicitly to connect to different url or port.
 
-# local machine url format: 'http://127.0.0.1'
-url = 'http://127.0.0.1'
-# port format: '8081'
-port = '8081'
-urlAndPort = url+':'+port
+    Args:
+        url (str): Server url, e.g. 'http://127.0.0.1'
+        port (str): Server port, e.g. '8081'
+        pool_size (int): Number of keep-alive connections of every model Client.
+            Increase it when one model is used from several threads at once.
+        compression (bool): Accept compressed (gzip/deflate) responses of model Clients.
+            It saves transfer time of large results on remote hosts.
+        timeout (float or tuple, optional): Timeout of every request in seconds, or
+            (connect timeout, read timeout) tuple. None waits forever.
+            Use suds_requests.deadline() to limit duration of individual calls or whole jobs.
+
+    Raises:
+        ConnectionError: If the server can't be reached. Nothing waits for user input,
+            so the error can be handled by batch jobs.
+    '''
+    # heavy imports are deferred until the connection is really requested
+    import requests
+    from suds.client import Client
+    from suds.cache import DocumentCache
 
-# Check if port is listening
-a_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    print('Connecting to server...')
 
-location = (url[7:], int(port))
-result_of_check = a_socket.connect_ex(location)
+    port = str(port)
+    urlAndPort = url+':'+port
 
-if result_of_check == 0:
-    a_socket.close()
-else:
-    print('Error: Port '+urlAndPort+' is not open.')
-    print('Please check:')
-    print('- If you have started RFEM application at the remote destination correctly.')
+    connectTimeout, readTimeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+    # Check if port is listening
+    a_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    a_socket.settimeout(connectTimeout)
+
+    location = (url[7:], int(port))
+    try:
+        result_of_check = a_socket.connect_ex(location)
+    except socket.timeout:
+        result_of_check = -1
     a_socket.close()
-    sys.exit()
-
-# Check for issues locally and remotely
-try:
-    ca = DocumentCache(location=os.path.join(gettempdir(), 'WSDL'))
-    client = Client(urlAndPort+'/wsdl', location = urlAndPort, cache=ca)
-except:
-    print('Error: Connection to server failed!')
-    print('Please check:')
-    print('- If you have started RFEM application')
-    print('- If all RFEM dialogs are closed')
-    print('- If server port range is set correctly')
-    print('- If you have a valid Web Services license')
-    print('- Check Program Options & Settings > Web Services')
-    print('On remote PC please check:')
-    print('- If the firewall enables you to listen to selected port.')
-    sys.exit()
-
-try:
-    modelLst = client.service.get_model_list()
-except:
-    print('Error: Please check if all RFEM dialogs are closed.')
-    input('Press Enter to exit...')
-    sys.exit()
-
-# Persistent connection
-# Next 4 lines enables Client to work within 1 session which is much faster to execute.
-# Without it the session lasts only one request which results in poor performance.
-# Assigning session to application Client (here client) instead of model Client
-# results also in poor performance.
-session = requests.Session()
-adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
-session.mount('http://', adapter)
-trans = RequestsTransport(session)
+
+    if result_of_check != 0:
+        raise ConnectionError('Error: Port '+urlAndPort+' is not open.\n'
+                              'Please check:\n'
+                              '- If you have started RFEM application at the remote destination correctly.')
+
+    # Check for issues locally and remotely
+    try:
+        ca = DocumentCache(location=os.path.join(gettempdir(), 'WSDL'))
+        if readTimeout:
+            cl = Client(urlAndPort+'/wsdl', location = urlAndPort, cache=ca, timeout=readTimeout)
+        else:
+            cl = Client(urlAndPort+'/wsdl', location = urlAndPort, cache=ca)
+    except Exception as e:
+        raise ConnectionError('Error: Connection to server failed!\n'
+                              'Please check:\n'
+                              '- If you have started RFEM application\n'
+                              '- If all RFEM dialogs are closed\n'
+                              '- If server port range is set correctly\n'
+                              '- If you have a valid Web Services license\n'
+                              '- Check Program Options & Settings > Web Services\n'
+                              'On remote PC please check:\n'
+                              '- If the firewall enables you to listen to selected port.') from e
+
+    try:
+        cl.service.get_model_list()
+    except Exception as e:
+        raise ConnectionError('Error: Please check if all RFEM dialogs are closed.') from e
+
+    # RFEM version is part of the key of cached model schema
+    try:
+        connectionGlobals.version = str(cl.service.get_information().version)
+    except:
+        connectionGlobals.version = ''
+
+    # Session of application used to download model WSDLs.
+    # Model Clients get their own persistent sessions, see createModelClient().
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    session.mount('http://', adapter)
+
+    connectionGlobals.url = url
+    connectionGlobals.port = port
+    connectionGlobals.client = cl
+    connectionGlobals.ca = ca
+    connectionGlobals.session = session
+    connectionGlobals.poolSize = pool_size
+    connectionGlobals.compression = compression
+    connectionGlobals.timeout = timeout
+    connectionGlobals.connected = True
+
+def createModelClient(modelUrlPort: str, pool_size: int = None):
+    '''
+    Create Client of the model served at modelUrlPort.
+    Parsed WSDL and schema is taken from SchemaCache, so only the first
+    model of given RFEM version is parsed. All others reuse it.
+    Every model Client gets its own persistent (keep-alive) session.
+    Without it every request opens new connection which results in poor performance.
+
+    Args:
+        modelUrlPort (str): Model url and port, e.g. 'http://127.0.0.1:8082'
+        pool_size (int, optional): Number of keep-alive connections,
+            connectionGlobals.poolSize by default
+
+    Returns:
+        Client: Model client
+    '''
+    from suds.client import Client
+    from RFEM.schemaCache import SchemaCache, schemaKey
+    from RFEM.suds_requests import RequestsTransport
+
+    modelCompletePath = modelUrlPort+'/wsdl'
+    wsdlContent = connectionGlobals.session.get(modelCompletePath, timeout=connectionGlobals.timeout).content
+    cache = SchemaCache(schemaKey(wsdlContent, connectionGlobals.version))
+
+    trans = RequestsTransport(pool_maxsize=pool_size or connectionGlobals.poolSize, compression=connectionGlobals.compression,
+                              timeout=connectionGlobals.timeout)
+
+    return Client(modelCompletePath, transport=trans, location=modelUrlPort, cache=cache, cachingpolicy=1)
+
+class LazyClient():
+    '''
+    Stand-in for application Client (suds.client.Client).
+    Connection to the server is established on first attribute access,
+    e.g. client.service.get_model_list().
+    '''
+    def __getattr__(self, name):
+        # don't connect when tools (pytest, pickle, debuggers) probe private attributes
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if not connectionGlobals.connected:
+            connectToServer()
+        return getattr(connectionGlobals.client, name)
+
+    def __str__(self):
+        if not connectionGlobals.connected:
+            connectToServer()
+        return str(connectionGlobals.client)
+
+# Kept for backward compatibility: from RFEM.initModel import client, url
+client = LazyClient()
+
+def __getattr__(name):
+    # url is read on every access, so it follows connectToServer(url=...)
+    if name == 'url':
+        return connectionGlobals.url
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+class modelMethod():
+    '''
+    Method of Model callable on the class as well as on its instances,
+    e.g. Model.transaction() or model.transaction().
+    Class or instance is passed as the first argument.
+    '''
+    def __init__(self, function):
+        self.function = function
+        self.__doc__ = function.__doc__
+
+    def __get__(self, obj, objtype = None):
+        return functools.partial(self.function, objtype if obj is None else obj)
 
 class Model():
     clientModel = None
@@ -79,8 +203,8 @@ class Model():
                  delete_all: bool=False):
         """
         Class object representing individual model in RFEM.
-        Class enables to edit multiple models in one session through holding
-        one transport session active by not setting 'trans' into Client.
+        Class enables to edit multiple models in one session. Every model
+        Client holds its own persistent transport session.
 
         Args:
             new_model (bool, optional): Set to True if new model is requested.
@@ -105,7 +229,9 @@ class Model():
             if model_name in self.clientModelDct:
                 cModel = self.clientModelDct[model_name]
                 cModel.service.delete_all_results()
+                notifyModel(cModel, 'delete_all_results')
                 cModel.service.delete_all()
+                notifyModel(cModel, 'delete_all')
 
             # Requested new model, model with given name DOESN'T exist yet
             else:
@@ -120,13 +246,8 @@ class Model():
                 else:
                     modelPath =  client.service.new_model(original_model_name)
                 modelPort = modelPath[-5:-1]
-                modelUrlPort = url+':'+modelPort
-                modelCompletePath = modelUrlPort+'/wsdl'
-
-                if self.clientModelDct:
-                    cModel = Client(modelCompletePath, location = modelUrlPort, cache=ca)
-                else:
-                    cModel = Client(modelCompletePath, transport=trans, location = modelUrlPort, cache=ca)
+                modelUrlPort = connectionGlobals.url+':'+modelPort
+                cModel = createModelClient(modelUrlPort)
 
                 self.clientModelDct[model_name] = cModel
 
@@ -143,23 +264,56 @@ class Model():
                         id = i
                 modelPath =  client.service.get_model(id)
                 modelPort = modelPath[-5:-1]
-                modelUrlPort = url+':'+modelPort
-                modelCompletePath = modelUrlPort+'/wsdl'
-                cModel = Client(modelCompletePath, location = modelUrlPort)
+                modelUrlPort = connectionGlobals.url+':'+modelPort
+                cModel = createModelClient(modelUrlPort)
                 self.clientModelDct[model_name] = cModel
 
             if delete:
                 print('Deleting results...')
                 cModel.service.delete_all_results()
+                notifyModel(cModel, 'delete_all_results')
             if delete_all:
                 print('Delete all...')
                 cModel.service.delete_all()
+                notifyModel(cModel, 'delete_all')
 
         # when using multiple instances/model
         self.clientModel = cModel
         # when using only one instance/model
         Model.clientModel = cModel
 
+    @modelMethod
+    def transaction(model, rollback: bool = True, chunk_size: int = None):
+        '''
+        Group object writes into one modification window,
+        e.g. with Model.transaction(): ...
+
+        Args:
+            rollback (bool, optional): Restore previous state of the objects on failure
+            chunk_size (int, optional): Number of buffered objects which triggers flush
+
+        Returns:
+            RFEM.transaction.Transaction
+        '''
+        from RFEM.transaction import Transaction
+        return Transaction(model, rollback, chunk_size)
+
+    @modelMethod
+    def sync(model, prune: bool = True, rollback: bool = False):
+        '''
+        Update the model to objects defined in the block, only created and
+        changed objects are sent, e.g. with Model.sync(): ...
+
+        Args:
+            prune (bool, optional): Delete objects of defined types, which weren't defined
+            rollback (bool, optional): Restore previous state of the objects on failure
+
+        Returns:
+            RFEM.modelSync.ModelSync
+        '''
+        from RFEM.modelSync import ModelSync
+        return ModelSync(model, prune, rollback)
+
     def __delete__(self, index_or_name):
         '''
         Purpose of this function is to facilitate removing client instances
@@ -202,6 +356,123 @@ def clearAttributes(obj):
         obj[i[0]] = None
     return obj
 
+# Functions called after changes of the model made through the library, see observeModel()
+modelObservers = WeakKeyDictionary()
+
+def targetClient(clientModel):
+    '''
+    Client, which changes are written to. Buffering clients of ModelBuilder
+    and Transaction (see modelBuilder.BufferedClient) are resolved to
+    the client of the model they write to.
+    '''
+    from RFEM.modelBuilder import BufferedClient
+    while isinstance(clientModel, BufferedClient):
+        clientModel = clientModel.builder.target.clientModel
+    return clientModel
+
+def observeModel(callback, model = Model):
+    '''
+    Register function called after every change of the model made through
+    the library, i.e. by setObject(), deleteObject(), Model(delete=True),
+    Model(delete_all=True), calculations, SetAddonStatus() and SetModelType().
+    Callback is called as callback(operation, args), e.g.
+    ('set_node', (clientObject,)), ('set_nodal_load', (load_case_no, clientObject)),
+    ('delete_object', ('E_OBJECT_TYPE_NODE', 1, 0)) or ('delete_all', ()).
+
+    Args:
+        callback (function): Function to be called
+        model (RFEM Class, optional): Model to be observed
+    '''
+    modelObservers.setdefault(targetClient(model.clientModel), []).append(callback)
+
+def unobserveModel(callback, model = Model):
+    '''
+    Remove function registered by observeModel().
+
+    Args:
+        callback (function): Function to be removed
+        model (RFEM Class, optional): Observed model
+    '''
+    callbacks = modelObservers.get(targetClient(model.clientModel), [])
+    if callback in callbacks:
+        callbacks.remove(callback)
+
+def notifyModel(clientModel, operation: str, args: tuple = ()):
+    '''
+    Call functions registered by observeModel() for given model client.
+    Changes made through ModelBuilder or Transaction are notified to
+    observers of the model they write to.
+    '''
+    for callback in list(modelObservers.get(targetClient(clientModel), ())):
+        callback(operation, args)
+
+class SparseObject():
+    '''
+    Base of object types created by createEmptyObject().
+    Only attributes set to other value than None are stored, so only
+    explicitly set fields are serialized. Fields of the schema which
+    were not set read as None, the object behaves as if it was cleared
+    by clearAttributes() and cleaned by deleteEmptyAttributes().
+    '''
+    # Field name: position in the schema
+    fieldOrder = {}
+
+    def __getattr__(self, name):
+        if name in self.fieldOrder:
+            return None
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if value is None and not name.startswith('__'):
+            if name in self.__dict__:
+                self.__delattr__(name)
+            return
+        super().__setattr__(name, value)
+
+    def __iter__(self):
+        # Same order as of suds objects: order of the schema,
+        # order of assignment if there are fields out of the schema
+        keys = self.__keylist__
+        try:
+            keys = sorted(keys, key=self.fieldOrder.__getitem__)
+        except KeyError:
+            pass
+        return iter([(key, self.__dict__[key]) for key in keys])
+
+# Sparse type, metadata and printer of every type per client factory, see createEmptyObject()
+prototypes = WeakKeyDictionary()
+
+def sparseType(typeName: str, factory):
+    '''
+    Subclass of suds type with SparseObject behaviour.
+    Schema of the type is walked only once per client factory.
+    '''
+    cache = prototypes.get(factory)
+    if cache is None:
+        cache = prototypes[factory] = {}
+    if typeName not in cache:
+        prototype = factory.create(typeName)
+        fields = prototype.__metadata__.ordering or prototype.__keylist__
+        sparseClass = type(prototype.__class__.__name__, (SparseObject, prototype.__class__),
+                           {'fieldOrder': {name: i for i, name in enumerate(fields)}})
+        cache[typeName] = (sparseClass, prototype.__metadata__, prototype.__printer__)
+    return cache[typeName]
+
+def createEmptyObject(typeName: str, model = Model):
+    '''
+    Create object of given type without any attributes (see SparseObject).
+    Replaces factory.create() followed by clearAttributes() and
+    deleteEmptyAttributes(). Metadata of the type is shared by all objects.
+
+    Args:
+        typeName (str): Type of the object, e.g. 'ns0:node'
+        model (RFEM Class, optional): Model to be edited
+    '''
+    sparseClass, metadata, printer = sparseType(typeName, model.clientModel.factory)
+    clientObject = sparseClass.__new__(sparseClass)
+    clientObject.__dict__.update({'__keylist__': [], '__printer__': printer, '__metadata__': metadata})
+    return clientObject
+
 def deleteEmptyAttributes(obj):
     '''
     Delete all attributes that are None for better performance.
@@ -295,6 +566,7 @@ def Calculate_all(generateXmlSolverInput: bool = False, model = Model):
         model (RFEM Class, optional): Model to be edited
     '''
     model.clientModel.service.calculate_all(generateXmlSolverInput)
+    notifyModel(model.clientModel, 'calculate_all', (generateXmlSolverInput,))
 
 def ConvertToDlString(s):
     '''
@@ -307,33 +579,27 @@ def ConvertToDlString(s):
     '1,3,5-9'   -> '1 3 5 6 7 8 9'
 
     Args:
-        s (str): RFEM Common String
+        s (str, list, range or IntRangeSet): RFEM Common String or numbers
 
     Returns a WS conform string.
     '''
 
     # Parameter is not of required type.
-    assert isinstance(s, (list, str))
+    assert isinstance(s, (list, str, range, IntRangeSet))
+
+    if isinstance(s, IntRangeSet):
+        return s.toDlString()
 
-    if isinstance(s, list):
+    if isinstance(s, (list, range)):
         return ' '.join(map(str, s))
 
-    s = s.strip()
-    s = s.replace(',', ' ')
-    s = s.replace('  ', ' ')
-    lst = s.split(' ')
     new_lst = []
-    for element in lst:
+    for element in s.replace(',', ' ').split():
         if '-' in element:
             inLst = element.split('-')
             start = int(inLst[0])
             end   = int(inLst[1])
-            inLst = []
-            for i in range(start, end + 1):
-                inLst.append(str(i))
-
-            inS = ' '.join(inLst)
-            new_lst.append(inS)
+            new_lst.append(' '.join(map(str, range(start, end + 1))))
         else:
             new_lst.append(element)
 
@@ -344,21 +610,11 @@ def ConvertStrToListOfInt(st):
     """
     This function coverts string to list of integers.
     Args:
-        st (str): RFEM Common String
+        st (str, list, range or IntRangeSet): RFEM Common String or numbers
     """
-    st = ConvertToDlString(st)
-    lstInt = []
-    while st:
-        intNumber = 0
-        if ' ' in st:
-            idx = st.index(' ')
-            intNumber = int(st[:idx])
-            st = st[idx+1:]
-        else:
-            intNumber = int(st)
-            st = ''
-        lstInt.append(intNumber)
-    return lstInt
+    if isinstance(st, IntRangeSet):
+        return list(st)
+    return [int(i) for i in ConvertToDlString(st).split()]
 
 def CheckIfMethodOrTypeExists(modelClient, method_or_type, unitTestMode=False):
     """
@@ -477,6 +733,7 @@ def SetAddonStatus(modelClient, addOn = AddOn.stress_analysis_active, status = T
                     addonLst[listType][addOn.name] = status
 
         modelClient.service.set_addon_statuses(addonLst)
+        notifyModel(modelClient, 'set_addon_statuses', (addonLst,))
 
 def CalculateSelectedCases(loadCases: list = None, designSituations: list = None, loadCombinations: list = None, model = Model):
     '''
@@ -514,6 +771,7 @@ def CalculateSelectedCases(loadCases: list = None, designSituations: list = None
             specificObjectsToCalculate.element.append(specificObjectsToCalculateLC)
 
     model.clientModel.service.calculate_specific_objects(specificObjectsToCalculate)
+    notifyModel(model.clientModel, 'calculate_specific_objects', (specificObjectsToCalculate,))
 
 def FirstFreeIdNumber(memType = ObjectTypes.E_OBJECT_TYPE_MEMBER, parent_no: int = 0, model = Model):
     '''
@@ -526,8 +784,27 @@ def FirstFreeIdNumber(memType = ObjectTypes.E_OBJECT_TYPE_MEMBER, parent_no: int
             (1) A geometric object has, in general, a parent_no = 0
             (2) The parent_no parameter becomes significant for example with loads
         model (RFEM Class, optional): Model to be edited
+
+    Note:
+        Nothing is reserved, the same number is returned until an object
+        with it is created. With allocator attached to the model, the number
+        following the highest number in use or reserved by AllocateIdNumbers()
+        is returned, numbers freed by deletes are not reused (see RFEM.idAllocator).
+        Otherwise it is the lowest number not in use.
     '''
-    return model.clientModel.service.get_first_free_number(memType.name, parent_no)
+    # Allocator of the model, if there is one (see IdAllocator)
+    from RFEM.idAllocator import getAllocator
+    allocator = getAllocator(model)
+    if allocator:
+        return allocator.peek(memType, parent_no)
+
+    # Served by the mirror of the model, if it holds all objects of the type
+    from RFEM.modelMirror import mirrors
+    mirror = mirrors.get(model.clientModel)
+    no = mirror.firstFreeNumber(memType, parent_no) if mirror else None
+    if no is None:
+        no = model.clientModel.service.get_first_free_number(memType.name, parent_no)
+    return no
 
 def SetModelType(model_type = ModelType.E_MODEL_TYPE_3D, model = Model):
     '''
@@ -547,6 +824,7 @@ def SetModelType(model_type = ModelType.E_MODEL_TYPE_3D, model = Model):
     '''
 
     model.clientModel.service.set_model_type(model_type.name)
+    notifyModel(model.clientModel, 'set_model_type', (model_type.name,))
 
 def GetModelType(model = Model):
 
@@ -0,0 +1,130 @@
+from RFEM.initModel import Model
+from RFEM.fastSerializer import setObject
+
+class BufferedService():
+    '''
+    Counterpart of Client.service. Calls of set_* operations are buffered
+    in ModelBuilder, any other operation flushes the buffer first and is
+    invoked immediately, so the order of calls is kept.
+    '''
+    def __init__(self, builder):
+        self.builder = builder
+
+    def __getattr__(self, operation):
+        if operation.startswith('_'):
+            raise AttributeError(operation)
+
+        if operation.startswith('set_'):
+            def method(*args):
+                self.builder.add(operation, *args)
+            return method
+
+        self.builder.flush()
+        return getattr(self.builder.target.clientModel.service, operation)
+
+class BufferedClient():
+    '''
+    Counterpart of suds Client used by constructors via model.clientModel.
+    '''
+    def __init__(self, builder):
+        self.builder = builder
+        self.service = BufferedService(builder)
+
+    def __getattr__(self, name):
+        # factory, wsdl, options, ... of the real client
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.builder.target.clientModel, name)
+
+class TargetModel():
+    '''
+    Model-like holder of the real client, the builder sends objects to.
+    '''
+    def __init__(self, clientModel):
+        self.clientModel = clientModel
+
+def flushedTarget(model = Model):
+    '''
+    Model-like object of the client, which the model writes to. Objects
+    buffered by ModelBuilder or Transaction are sent first, so operations
+    which don't go through the buffer see the current state of the model.
+
+    Args:
+        model (RFEM Class, optional): Model, builder or transaction
+    '''
+    clientModel = model.clientModel
+    while isinstance(clientModel, BufferedClient):
+        clientModel.builder.flush()
+        clientModel = clientModel.builder.target.clientModel
+    return model if clientModel is model.clientModel else TargetModel(clientModel)
+
+class ModelBuilder():
+    '''
+    Collects objects in memory and writes them to the model in bulk.
+    Objects are sent inside one begin_modification/finish_modification
+    window per chunk, so RFEM regenerates the model only once per chunk
+    instead of after every object.
+    Existing constructors can target it transparently via model=builder.
+
+    Example:
+        with ModelBuilder(chunk_size=5000) as builder:
+            for i in range(1000):
+                Node(i+1, i*2.0, 0.0, 0.0, model=builder)
+    '''
+    def __init__(self, model = Model, chunk_size: int = 1000):
+        '''
+        Args:
+            model (RFEM Class, optional): Model to be edited
+            chunk_size (int, optional): Number of buffered objects which triggers flush.
+                None or 0 buffers everything until flush() is called.
+        '''
+        self.model = model
+        self.target = TargetModel(model.clientModel)
+        self.chunk_size = chunk_size
+        self.buffer = []
+        self.clientModel = BufferedClient(self)
+
+    def add(self, operation: str, *args):
+        '''
+        Buffer set_* operation.
+
+        Args:
+            operation (str): Name of the operation, e.g. 'set_node'
+            args: Arguments of the operation
+        '''
+        self.buffer.append((operation, args))
+        if self.chunk_size and len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        '''
+        Send all buffered objects in one modification window.
+        The window is always closed, even if one of the objects fails.
+        '''
+        if not self.buffer:
+            return
+
+        buffer = self.buffer
+        self.buffer = []
+        service = self.target.clientModel.service
+        service.begin_modification('ModelBuilder')
+        try:
+            for operation, args in buffer:
+                setObject(operation, *args, model=self.target)
+        finally:
+            service.finish_modification()
+
+    def discard(self):
+        '''
+        Drop buffered objects without sending them.
+        '''
+        self.buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
@@ -0,0 +1,262 @@
+from weakref import WeakKeyDictionary
+from RFEM.enums import ObjectTypes
+from RFEM.initModel import Model, observeModel, unobserveModel, targetClient
+
+# Mirror attached to every model client, see ModelMirror.attach()
+mirrors = WeakKeyDictionary()
+
+# Types of objects RFEM creates by itself when object of given type is written,
+# e.g. line of member defined by nodes
+IMPLICIT_TYPES = {ObjectTypes.E_OBJECT_TYPE_MEMBER: (ObjectTypes.E_OBJECT_TYPE_LINE,)}
+
+# Types of objects no other objects depend on, deleting them deletes nothing else
+LEAF_TYPES = frozenset(t for t in ObjectTypes if t.name.endswith('_LOAD') or t.name.startswith('E_OBJECT_TYPE_IMPOSED_'))
+
+# Operations changing any objects of the model, e.g. merging nodes or import
+RESET_OPERATIONS = ('delete_all', 'model_check__process_object_groups_operation', 'import_from')
+
+def objectKey(operation: str, args: tuple):
+    '''
+    Key of the object written by set_* operation: (ObjectTypes member, no, parent_no).
+    Parent is the leading argument, e.g. load case of loads. None if the operation
+    doesn't write numbered object, e.g. set_model_type.
+    '''
+    objectType = ObjectTypes.__members__.get('E_OBJECT_TYPE_' + operation[4:].upper())
+    if objectType is None or not args:
+        return None
+    no = getattr(args[-1], 'no', None)
+    if no is None:
+        return None
+    parent_no = args[0] if len(args) > 1 and isinstance(args[0], int) else 0
+    return (objectType, no, parent_no)
+
+def staleTypes(operation: str, args: tuple):
+    '''
+    Object types, whose objects may have been created, changed or deleted by RFEM
+    without being recorded, when the model was changed by given operation.
+    Deleting an object deletes objects depending on it (e.g. lines of deleted
+    node or loads of deleted load case), writing an object can create objects
+    of other types, see IMPLICIT_TYPES.
+    '''
+    if operation in RESET_OPERATIONS:
+        return set(ObjectTypes)
+    if operation == 'delete_object':
+        objectType = ObjectTypes[args[0]]
+        return set() if objectType in LEAF_TYPES else set(ObjectTypes) - {objectType}
+    key = objectKey(operation, args) if operation.startswith('set_') else None
+    if key:
+        return set(IMPLICIT_TYPES.get(key[0], ()))
+    return set()
+
+def getOperation(objectType):
+    '''
+    Name of get_* operation of object type, e.g. E_OBJECT_TYPE_NODE -> get_node.
+    '''
+    return 'get_' + objectType.name[len('E_OBJECT_TYPE_'):].lower()
+
+def readObject(objectType, no: int, parent_no: int = 0, model = Model):
+    '''
+    Read object from the model.
+    '''
+    args = (no, parent_no) if parent_no else (no,)
+    return getattr(model.clientModel.service, getOperation(objectType))(*args)
+
+class ModelMirror():
+    '''
+    Client-side copy of the model. Objects written or deleted through the
+    library are recorded, objects of chosen types can be read in advance by
+    seed(). Lookups are then served without a request to RFEM.
+
+    Only seeded types are known completely, i.e. objects missing in the mirror
+    don't exist. RFEM creates and deletes objects by itself (see staleTypes()),
+    so types affected by a change are read again from then on, until they are
+    seeded again.
+
+    Objects are kept as they were written (only the fields set by the library)
+    or as they were read. They must not be modified in place.
+
+    Example:
+        mirror = ModelMirror.attach()
+        mirror.seed([ObjectTypes.E_OBJECT_TYPE_LINE])
+        line = GetObject(ObjectTypes.E_OBJECT_TYPE_LINE, 1)
+    '''
+    def __init__(self):
+        # (ObjectTypes member, no, parent_no): object
+        self.objects = {}
+        # Seeded object types with all objects in the mirror
+        self.complete = set()
+        self.modelInfo = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def attach(model = Model):
+        '''
+        Create mirror of the model and start recording of its changes.
+        Functions of the library use the mirror of the model from then on.
+
+        Args:
+            model (RFEM Class, optional): Model to be mirrored
+        '''
+        ModelMirror.detach(model)
+        mirror = ModelMirror()
+        mirrors[targetClient(model.clientModel)] = mirror
+        observeModel(mirror.record, model)
+        return mirror
+
+    @staticmethod
+    def detach(model = Model):
+        '''
+        Stop recording and drop mirror of the model.
+
+        Args:
+            model (RFEM Class, optional): Mirrored model
+        '''
+        mirror = mirrors.pop(targetClient(model.clientModel), None)
+        if mirror:
+            unobserveModel(mirror.record, model)
+
+    def record(self, operation: str, args: tuple):
+        '''
+        Record change of the model, see initModel.observeModel().
+        '''
+        self.modelInfo = None
+        stale = staleTypes(operation, args)
+        if operation == 'delete_object':
+            typeName, no, parent_no = args
+            self.objects.pop((ObjectTypes[typeName], no, parent_no), None)
+            # Dependent objects may be deleted as well
+            self.dropTypes(stale)
+        elif operation in RESET_OPERATIONS:
+            self.dropTypes(stale)
+        elif operation.startswith('set_'):
+            key = objectKey(operation, args)
+            if key:
+                self.objects[key] = args[-1]
+        self.complete -= stale
+
+    def dropTypes(self, objectTypes: set):
+        '''
+        Drop objects of given types from the mirror.
+        '''
+        for key in [key for key in self.objects if key[0] in objectTypes]:
+            del self.objects[key]
+
+    def get(self, objectType, no: int, parent_no: int = 0, model = Model):
+        '''
+        Object from the mirror. Objects missing in the mirror are read from the
+        model, unless all objects of the type are in the mirror.
+
+        Args:
+            objectType (enum): Object Type Enumeration
+            no (int): Number of the object
+            parent_no (int, optional): Number of parent object, e.g. load case of loads
+            model (RFEM Class, optional): Model to read missing objects from
+
+        Returns:
+            Object, None if it doesn't exist
+        '''
+        key = (objectType, no, parent_no)
+        if key in self.objects:
+            self.hits += 1
+            return self.objects[key]
+        if objectType in self.complete:
+            self.hits += 1
+            return None
+
+        self.misses += 1
+        clientObject = self.objects[key] = readObject(objectType, no, parent_no, model)
+        return clientObject
+
+    def numbers(self, objectType, parent_no: int = 0):
+        '''
+        Sorted numbers of objects of given type in the mirror.
+        '''
+        return sorted(no for t, no, parent in self.objects if t == objectType and parent == parent_no)
+
+    def firstFreeNumber(self, objectType, parent_no: int = 0):
+        '''
+        Lowest number not used by objects of given type, None if the mirror
+        doesn't hold all objects of the type.
+        '''
+        if objectType not in self.complete:
+            return None
+        used = set(self.numbers(objectType, parent_no))
+        no = 1
+        while no in used:
+            no += 1
+        return no
+
+    def seed(self, objectTypes: list, model = Model):
+        '''
+        Read all objects of given types from the model.
+
+        Args:
+            objectTypes (list): List of Object Type Enumerations
+            model (RFEM Class, optional): Model to be read
+        '''
+        for objectType in objectTypes:
+            self.dropTypes({objectType})
+            locations = model.clientModel.service.get_all_object_numbers_by_type(objectType.name)
+            for item in (locations.item if locations else []):
+                # Loads are located by parent load case
+                parent_no = getattr(item, 'parent_no', None) or 0
+                self.objects[(objectType, item.no, parent_no)] = readObject(objectType, item.no, parent_no, model)
+            self.complete.add(objectType)
+
+    def getModelInfo(self, model = Model):
+        '''
+        Model info, read from the model after every change.
+        '''
+        if self.modelInfo is None:
+            self.misses += 1
+            self.modelInfo = model.clientModel.service.get_model_info()
+        else:
+            self.hits += 1
+        return self.modelInfo
+
+def GetObject(objectType, no: int, parent_no: int = 0, model = Model):
+    '''
+    Get object of the model. Served by the mirror of the model, if there is one.
+
+    Args:
+        objectType (enum): Object Type Enumeration
+        no (int): Number of the object
+        parent_no (int, optional): Number of parent object, e.g. load case of loads
+        model (RFEM Class, optional): Model to be read
+    '''
+    mirror = mirrors.get(model.clientModel)
+    if mirror:
+        return mirror.get(objectType, no, parent_no, model)
+    return readObject(objectType, no, parent_no, model)
+
+def GetObjectLocations(objectType, model = Model):
+    '''
+    Locations of all objects of given type. Served by the mirror of the
+    model, if it holds all objects of the type.
+
+    Args:
+        objectType (enum): Object Type Enumeration
+        model (RFEM Class, optional): Model to be read
+
+    Returns:
+        set: Set of (no, parent_no)
+    '''
+    mirror = mirrors.get(model.clientModel)
+    if mirror and objectType in mirror.complete:
+        return {(no, parent_no) for t, no, parent_no in mirror.objects if t == objectType}
+    locations = model.clientModel.service.get_all_object_numbers_by_type(objectType.name)
+    # Loads are located by parent load case
+    return {(item.no, getattr(item, 'parent_no', None) or 0) for item in (locations.item if locations else [])}
+
+def GetModelInfo(model = Model):
+    '''
+    Get model info. Served by the mirror of the model, if there is one.
+
+    Args:
+        model (RFEM Class, optional): Model to be read
+    '''
+    mirror = mirrors.get(model.clientModel)
+    if mirror:
+        return mirror.getModelInfo(model)
+    return model.clientModel.service.get_model_info()
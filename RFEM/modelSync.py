@@ -0,0 +1,182 @@
+import math
+from RFEM.initModel import Model, SparseObject
+from RFEM.modelMirror import mirrors, objectKey, readObject, GetObjectLocations
+from RFEM.transaction import Transaction, TransactionError
+from RFEM.fastSerializer import deleteObject
+
+def sameValue(desired, current):
+    '''
+    Value written by the library equals value in the model.
+    Only fields set in desired objects are compared.
+    '''
+    if hasattr(desired, '__keylist__'):
+        if not hasattr(current, '__keylist__'):
+            return False
+        for attribute, value in desired:
+            if value is not None and not sameValue(value, getattr(current, attribute, None)):
+                return False
+        if isinstance(current, SparseObject):
+            # Field written before, but not now
+            for attribute, value in current:
+                if value is not None and getattr(desired, attribute, None) is None:
+                    return False
+        return True
+
+    if isinstance(desired, (list, tuple)):
+        return isinstance(current, (list, tuple)) and len(desired) == len(current) and \
+            all(sameValue(d, c) for d, c in zip(desired, current))
+
+    if isinstance(desired, float) or isinstance(current, float):
+        if isinstance(desired, (int, float)) and isinstance(current, (int, float)) and \
+            not isinstance(desired, bool) and not isinstance(current, bool):
+            return math.isclose(desired, current, rel_tol=1e-12, abs_tol=1e-12)
+        return False
+
+    # Empty strings, e.g. comments, are read as None
+    return desired == current or (desired == '' and current is None)
+
+class ModelSync(Transaction):
+    '''
+    Declarative update of the model. Objects defined inside the sync block
+    are the desired state of the model. They are compared with the current
+    state and only created and changed objects are sent. With prune enabled,
+    objects of the defined types, which weren't defined again, are deleted.
+    Parametric models can be rebuilt this way after every change of inputs
+    instead of delete_all and sending all objects again.
+
+    Current state is taken from the mirror of the model (see ModelMirror).
+    Without the mirror, numbers of objects of every defined type are read
+    and every existing object is read one by one on every sync, which costs
+    one request per object. Attach the mirror once when the model is opened
+    if the model is synced repeatedly. Fields not set by the library are
+    not compared.
+
+    Example:
+        ModelMirror.attach().seed([ObjectTypes.E_OBJECT_TYPE_NODE, ObjectTypes.E_OBJECT_TYPE_LINE])
+        for d in (2.0, 2.5):
+            with Model.sync():
+                Node(1, 0.0, 0.0, 0.0)
+                Node(2, d, 0.0, 0.0)
+                Line(1, '1 2')
+    '''
+    def __init__(self, model = Model, prune: bool = True, rollback: bool = False):
+        '''
+        Args:
+            model (RFEM Class, optional): Model to be edited
+            prune (bool, optional): Delete objects of defined types, which weren't defined
+            rollback (bool, optional): Restore previous state of the objects on failure
+        '''
+        Transaction.__init__(self, model, rollback, None)
+        self.prune = prune
+        # Object types in order of definition
+        self.types = []
+        # Keys of defined objects, see modelMirror.objectKey()
+        self.desired = set()
+        # Object numbers in the model: {ObjectTypes member: set of (no, parent_no)}
+        self.existing = {}
+        self.created = []
+        self.modified = []
+        self.unchanged = []
+        self.deleted = []
+
+    def existingObjects(self, objectType):
+        '''
+        Set of (no, parent_no) of objects of given type in the model.
+        '''
+        if objectType in self.existing:
+            return self.existing[objectType]
+
+        self.existing[objectType] = GetObjectLocations(objectType, self.target)
+        return self.existing[objectType]
+
+    def currentObject(self, objectType, no: int, parent_no: int = 0):
+        '''
+        Object in the model, None if it doesn't exist.
+        '''
+        if (no, parent_no) not in self.existingObjects(objectType):
+            return None
+        mirror = mirrors.get(self.target.clientModel)
+        if mirror:
+            return mirror.get(objectType, no, parent_no, self.target)
+        return readObject(objectType, no, parent_no, self.target)
+
+    def diff(self, buffer: list):
+        '''
+        Created and changed objects of the buffer.
+        '''
+        changes = []
+        for operation, args in buffer:
+            key = objectKey(operation, args)
+            if key is None:
+                # Not a numbered object, e.g. set_model_type
+                changes.append((operation, args))
+                continue
+
+            objectType, no, parent_no = key
+            if objectType not in self.types:
+                self.types.append(objectType)
+            self.desired.add(key)
+
+            current = self.currentObject(objectType, no, parent_no)
+            if current is None:
+                self.created.append(key)
+            elif sameValue(args[-1], current):
+                self.unchanged.append(key)
+                continue
+            else:
+                self.modified.append(key)
+            changes.append((operation, args))
+        return changes
+
+    def flush(self):
+        '''
+        Send created and changed objects of the buffer.
+        '''
+        self.buffer = self.diff(self.buffer)
+        Transaction.flush(self)
+
+    def pruneObjects(self):
+        '''
+        Delete objects of defined types, which weren't defined. Objects are
+        deleted in reverse order of their types, dependent objects (e.g.
+        members) are usually defined after objects they depend on (e.g. nodes).
+        '''
+        unused = []
+        for objectType in reversed(self.types):
+            for no, parent_no in sorted(self.existingObjects(objectType)):
+                if (objectType, no, parent_no) not in self.desired:
+                    unused.append((objectType, no, parent_no))
+        if not unused:
+            return
+
+        failures = []
+        service = self.target.clientModel.service
+        service.begin_modification('ModelSync')
+        try:
+            for objectType, no, parent_no in unused:
+                operation = 'set_' + objectType.name[len('E_OBJECT_TYPE_'):].lower()
+                parents = (parent_no,) if parent_no else ()
+                if self.rollback:
+                    self.journal.append((operation, parents, no, self.currentObject(objectType, no, parent_no)))
+                try:
+                    deleteObject(objectType, no, parent_no, model=self.target)
+                    self.deleted.append((objectType, no, parent_no))
+                except Exception as e:
+                    failures.append(('delete_object', no, e))
+            if failures and self.rollback:
+                self.undo()
+        finally:
+            service.finish_modification()
+
+        if failures:
+            raise TransactionError(failures, self.rollback)
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.model.clientModel = self.target.clientModel
+            self.flush()
+            if self.prune:
+                self.pruneObjects()
+            self.journal = []
+            return
+        Transaction.__exit__(self, exc_type, exc, tb)
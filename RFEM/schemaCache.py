@@ -0,0 +1,64 @@
+import os
+import re
+import pickle
+import hashlib
+from logging import getLogger
+from tempfile import gettempdir
+from suds.cache import ObjectCache
+
+log = getLogger(__name__)
+
+# Model WSDLs differ only in the port written into soap:address.
+LOCATION_PATTERN = re.compile(rb'location="[^"]*"')
+
+def schemaKey(wsdl_content: bytes, version: str = ''):
+    '''
+    Key of the parsed model WSDL in the cache.
+    Port specific locations are left out, so all models served by the same
+    RFEM version share one key.
+
+    Args:
+        wsdl_content (bytes): Raw WSDL document
+        version (str): RFEM version
+
+    Returns:
+        str: Hex digest
+    '''
+    h = hashlib.sha256(LOCATION_PATTERN.sub(b'', wsdl_content))
+    h.update(str(version).encode('utf-8'))
+    return h.hexdigest()
+
+class SchemaCache(ObjectCache):
+    '''
+    Cache of parsed WSDL and schema (suds Definitions) for model clients.
+    It ignores the url based id suds asks for and uses key instead.
+    Parsed definitions are kept in memory for the process lifetime and
+    pickled to disk, so next process skips schema parsing as well.
+    Use it with cachingpolicy=1 in suds Client.
+    '''
+    memory = {}
+
+    def __init__(self, key: str, location: str = os.path.join(gettempdir(), 'WSDL')):
+        '''
+        Args:
+            key (str): Key of the schema, see schemaKey()
+            location (str): Directory of pickled definitions
+        '''
+        ObjectCache.__init__(self, location)
+        self.key = key
+
+    def get(self, id):
+        definitions = SchemaCache.memory.get(self.key)
+        if definitions is None:
+            definitions = ObjectCache.get(self, self.key)
+            if definitions is not None:
+                SchemaCache.memory[self.key] = definitions
+        return definitions
+
+    def put(self, id, object):
+        SchemaCache.memory[self.key] = object
+        try:
+            return ObjectCache.put(self, self.key, object)
+        except (RecursionError, pickle.PicklingError):
+            log.debug('Schema %s kept only in memory.', self.key, exc_info=1)
+            return object
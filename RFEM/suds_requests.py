@@ -17,17 +17,44 @@
 # License: MIT
 #######################################################################
 
+import contextlib
+import contextvars
+import csv
 import functools
+import gzip
+import json
+import re
+import threading
+import time
 import requests
 import suds.transport as transport
 import traceback
 from six import BytesIO
 
+# Upper bounds (ms) of latency histogram buckets, last bucket is open
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+OPERATION_PATTERN = re.compile(rb'<(?:[\w.-]+:)?Body[^>]*>\s*<(?:[\w.-]+:)?([\w.-]+)')
+
+_profiles = []
+
+# Absolute time (time.monotonic()) by which SOAP calls must finish, see deadline()
+_deadline = contextvars.ContextVar('deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    '''
+    SOAP call didn't finish before its deadline or timeout.
+    '''
+
 def handle_errors(f):
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
         try:
             return f(*args, **kwargs)
+        except requests.Timeout as e:
+            # Not a TransportError, suds would hide its type
+            raise DeadlineExceeded('SOAP call timed out: %s' % e) from e
         except requests.HTTPError as e:
             buf = BytesIO(e.response.content)
             raise transport.TransportError(
@@ -45,24 +72,282 @@ def handle_errors(f):
     return wrapper
 
 
+@contextlib.contextmanager
+def deadline(seconds):
+    '''
+    All SOAP calls sent by RequestsTransport inside the block must finish
+    within given number of seconds, otherwise DeadlineExceeded is raised.
+    Use it around one call, or around whole job as its session deadline.
+    Nested deadlines can only shorten the outer one.
+
+    Note:
+        The read timeout applies to waiting for data, so a call which keeps
+        receiving data can run over the deadline. Calls are never started
+        after it.
+    '''
+    end = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        end = min(end, current)
+    token = _deadline.set(end)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def operation_name(request):
+    '''
+    Name of SOAP operation (first element of the Body) of the request.
+    '''
+    message = request.message or b''
+    if isinstance(message, str):
+        message = message.encode('utf-8')
+    match = OPERATION_PATTERN.search(message)
+    return match.group(1).decode('utf-8') if match else 'unknown'
+
+
+class OperationProfile(object):
+    '''
+    Statistics of one SOAP operation.
+    '''
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.request_wire_bytes = 0
+        self.response_wire_bytes = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, seconds, request_bytes, response_bytes, request_wire_bytes, response_wire_bytes):
+        self.count += 1
+        self.total_time += seconds
+        self.max_time = max(self.max_time, seconds)
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        self.request_wire_bytes += request_wire_bytes
+        self.response_wire_bytes += response_wire_bytes
+        milliseconds = seconds * 1000.0
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if milliseconds <= bound:
+                self.histogram[i] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def as_dict(self):
+        return {
+            'operation': self.name,
+            'count': self.count,
+            'total_time': self.total_time,
+            'mean_time': self.total_time / self.count if self.count else 0.0,
+            'max_time': self.max_time,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'request_wire_bytes': self.request_wire_bytes,
+            'response_wire_bytes': self.response_wire_bytes,
+            'histogram': dict(zip(
+                ['<=%dms' % bound for bound in LATENCY_BUCKETS_MS] + ['>%dms' % LATENCY_BUCKETS_MS[-1]],
+                self.histogram)),
+        }
+
+
+class SessionProfile(object):
+    '''
+    Statistics of all SOAP operations sent while the profile is active.
+    Obtained from profile_session().
+    '''
+    def __init__(self):
+        self.operations = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation, seconds, request_bytes, response_bytes, request_wire_bytes, response_wire_bytes):
+        with self._lock:
+            if operation not in self.operations:
+                self.operations[operation] = OperationProfile(operation)
+            self.operations[operation].record(seconds, request_bytes, response_bytes,
+                                              request_wire_bytes, response_wire_bytes)
+
+    def as_list(self):
+        '''
+        Statistics of operations sorted by total time, the slowest first.
+        '''
+        with self._lock:
+            stats = [op.as_dict() for op in self.operations.values()]
+        return sorted(stats, key=lambda op: op['total_time'], reverse=True)
+
+    def dump_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.as_list(), f, indent=2)
+
+    def dump_csv(self, path):
+        stats = self.as_list()
+        buckets = list(stats[0]['histogram']) if stats else []
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            columns = ['operation', 'count', 'total_time', 'mean_time', 'max_time', 'request_bytes',
+                       'response_bytes', 'request_wire_bytes', 'response_wire_bytes']
+            writer.writerow(columns + buckets)
+            for op in stats:
+                writer.writerow([op[c] for c in columns] + [op['histogram'][b] for b in buckets])
+
+
+@contextlib.contextmanager
+def profile_session():
+    '''
+    Record call count, latency histogram and request/response sizes of
+    every SOAP operation sent by RequestsTransport inside the block.
+    Sizes are recorded both decoded and as transferred on the wire
+    (after compression).
+
+    Example:
+        with profile_session() as profile:
+            ...
+        profile.dump_csv('profile.csv')
+    '''
+    profile = SessionProfile()
+    _profiles.append(profile)
+    try:
+        yield profile
+    finally:
+        _profiles.remove(profile)
+
+
+def _record(operation, start, request_bytes, response_bytes, request_wire_bytes, response_wire_bytes):
+    seconds = time.perf_counter() - start
+    for profile in list(_profiles):
+        profile.record(operation, seconds, request_bytes, response_bytes,
+                       request_wire_bytes, response_wire_bytes)
+
+
+def _wire_bytes(resp, default):
+    '''
+    Number of response bytes read from the connection (before decompression).
+    '''
+    try:
+        return int(resp.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return default
+
+
+class StreamedReply(object):
+    '''
+    File-like reply message of RequestsTransport.stream(). Counts bytes
+    actually read, the reply is recorded in active profiles once it is
+    read to the end or closed. Closing releases the connection.
+    '''
+    def __init__(self, resp, operation, start, request_bytes, request_wire_bytes):
+        self.resp = resp
+        self.operation = operation
+        self.start = start
+        self.request_bytes = request_bytes
+        self.request_wire_bytes = request_wire_bytes
+        self.response_bytes = 0
+        self.recorded = False
+
+    def read(self, size=-1):
+        block = self.resp.raw.read(None if size < 0 else size)
+        self.response_bytes += len(block)
+        if not block or size < 0:
+            self._record()
+        return block
+
+    def close(self):
+        self._record()
+        self.resp.close()
+
+    def _record(self):
+        if self.recorded:
+            return
+        self.recorded = True
+        if _profiles:
+            _record(self.operation, self.start, self.request_bytes, self.response_bytes,
+                    self.request_wire_bytes, _wire_bytes(self.resp, self.response_bytes))
+
+
 class RequestsTransport(transport.Transport):
-    def __init__(self, session=None):
+    def __init__(self, session=None, pool_maxsize=1, compression=True, compress_requests=False, timeout=None):
+        '''
+        Args:
+            session (requests.Session, optional): Session to be used. If not set,
+                new keep-alive session is created.
+            pool_maxsize (int, optional): Maximum number of connections kept alive
+                in the pool of the new session. Increase it when the Client is
+                used from several threads at once.
+            compression (bool, optional): Accept gzip/deflate compressed responses.
+                Server decides whether to compress. Set False to disable it.
+            compress_requests (bool, optional): Send requests gzip compressed.
+                Use it only if the server accepts 'Content-Encoding: gzip'.
+            timeout (float or tuple, optional): Timeout in seconds, or (connect timeout,
+                read timeout) tuple. None waits forever unless deadline() is active.
+        '''
         transport.Transport.__init__(self)
-        self._session = session or requests.Session()
+        self.timeout = timeout
+        self.compression = compression
+        self.compress_requests = compress_requests
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self._session = session
+
+    def _timeout(self):
+        '''
+        Timeout of next request, shortened to the active deadline.
+        '''
+        end = _deadline.get()
+        if end is None:
+            return self.timeout
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded('Deadline of SOAP call exceeded.')
+        connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+        return (min(connect or remaining, remaining), min(read or remaining, remaining))
+
+    def _encode(self, request):
+        '''
+        Body and headers of the request with compression applied.
+        '''
+        data = request.message
+        headers = request.headers
+        if not self.compression:
+            headers = dict(headers, **{'Accept-Encoding': 'identity'})
+        if self.compress_requests and data:
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            data = gzip.compress(data)
+            headers = dict(headers, **{'Content-Encoding': 'gzip'})
+        return data, headers
 
     @handle_errors
     def open(self, request):
-        resp = self._session.get(request.url)
+        start = time.perf_counter()
+        if self.compression:
+            resp = self._session.get(request.url, timeout=self._timeout())
+        else:
+            resp = self._session.get(request.url, headers={'Accept-Encoding': 'identity'}, timeout=self._timeout())
         resp.raise_for_status()
+        if _profiles:
+            _record('wsdl', start, 0, len(resp.content), 0, _wire_bytes(resp, len(resp.content)))
         return BytesIO(resp.content)
 
     @handle_errors
     def send(self, request):
+        start = time.perf_counter()
+        data, headers = self._encode(request)
         resp = self._session.post(
             request.url,
-            data=request.message,
-            headers=request.headers,
+            data=data,
+            headers=headers,
+            timeout=self._timeout(),
         )
+        if _profiles:
+            _record(operation_name(request), start, len(request.message or b''), len(resp.content),
+                    len(data or b''), _wire_bytes(resp, len(resp.content)))
         if resp.headers.get('content-type') not in ('text/xml',
                                                     'application/soap+xml'):
             resp.raise_for_status()
@@ -71,3 +356,26 @@ class RequestsTransport(transport.Transport):
             resp.headers,
             resp.content,
         )
+
+    @handle_errors
+    def stream(self, request):
+        '''
+        Post request like send() but return reply message as file-like
+        object, which is read incrementally from the connection.
+        '''
+        start = time.perf_counter()
+        data, headers = self._encode(request)
+        resp = self._session.post(
+            request.url,
+            data=data,
+            headers=headers,
+            stream=True,
+            timeout=self._timeout(),
+        )
+        resp.raw.decode_content = True
+        return transport.Reply(
+            resp.status_code,
+            resp.headers,
+            StreamedReply(resp, operation_name(request), start,
+                          len(request.message or b''), len(data or b'')),
+        )
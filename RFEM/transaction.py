@@ -0,0 +1,156 @@
+import re
+from suds import WebFault
+from RFEM.enums import ObjectTypes
+from RFEM.initModel import Model
+from RFEM.modelMirror import objectKey
+from RFEM.modelBuilder import ModelBuilder
+from RFEM.fastSerializer import setObject, deleteObject
+
+# Fault of get_* operation reading object, which doesn't exist
+NOT_FOUND = re.compile(r"not found|does not exist|doesn't exist|not exist", re.IGNORECASE)
+
+def isNotFound(e):
+    '''
+    Exception is the fault of RFEM reporting missing object. Other errors,
+    e.g. timeouts or lost connection, don't say anything about the object.
+    '''
+    return isinstance(e, WebFault) and bool(NOT_FOUND.search(str(getattr(e.fault, 'faultstring', e))))
+
+class TransactionError(Exception):
+    '''
+    Raised when objects of a transaction were not accepted by RFEM.
+    Attribute failures is list of (operation, object number, exception).
+    '''
+    def __init__(self, failures: list, rolledBack: bool = False):
+        self.failures = failures
+        self.rolledBack = rolledBack
+        lines = ['%s(%s): %s' % (operation, no, e) for operation, no, e in failures]
+        Exception.__init__(self, '%d object(s) failed%s:\n%s' % (len(failures), ', changes were rolled back' if rolledBack else '', '\n'.join(lines)))
+
+class Transaction(ModelBuilder):
+    '''
+    Groups object writes into one modification window, so the model is
+    regenerated only once. While the transaction is active, clientModel of
+    the model is replaced by the buffering client, so constructors called
+    with the default model=Model are part of the transaction too.
+    Objects failing in RFEM are reported all at once in TransactionError.
+    If rollback is enabled, state of every written object is read before
+    it is overwritten and restored when the transaction fails; objects
+    created by the transaction are deleted. Only numbered objects can be
+    restored, writes of other set_* operations (e.g. set_model_type,
+    set_addon_statuses or mesh settings) and of operations without
+    ObjectTypes member are not undone.
+
+    Example:
+        with Model.transaction():
+            Node(1, 0.0, 0.0, 0.0)
+            Node(2, 5.0, 0.0, 0.0)
+            Member(1, 1, 2)
+    '''
+    def __init__(self, model = Model, rollback: bool = True, chunk_size: int = None):
+        '''
+        Args:
+            model (RFEM Class, optional): Model to be edited
+            rollback (bool, optional): Restore previous state of the objects on failure
+            chunk_size (int, optional): Number of buffered objects which triggers flush.
+                Everything is sent at the end of the transaction by default.
+        '''
+        ModelBuilder.__init__(self, model, chunk_size)
+        self.rollback = rollback
+        # (operation, parent numbers, object number, previous object or None)
+        self.journal = []
+        self.rollbackFailures = []
+
+    @staticmethod
+    def objectType(operation: str):
+        '''
+        ObjectTypes member of set_* operation, e.g. set_nodal_load -> E_OBJECT_TYPE_NODAL_LOAD.
+        '''
+        return ObjectTypes.__members__.get('E_OBJECT_TYPE_' + operation[4:].upper())
+
+    def snapshot(self, operation: str, args: tuple):
+        '''
+        Read current state of the object, which is going to be written.
+        Nothing is read if the write can't be undone (see class docstring).
+        Errors other than missing object are raised.
+        '''
+        if objectKey(operation, args) is None:
+            return
+        parents, no = args[:-1], args[-1].no
+        try:
+            previous = getattr(self.target.clientModel.service, 'get_' + operation[4:])(no, *parents)
+        except WebFault as e:
+            if not isNotFound(e):
+                raise
+            # Object doesn't exist yet
+            previous = None
+        self.journal.append((operation, parents, no, previous))
+
+    def flush(self):
+        '''
+        Send all buffered objects in one modification window. Objects are sent
+        even if some of them fail, so all failures are reported together.
+        '''
+        if not self.buffer:
+            return
+
+        buffer = self.buffer
+        self.buffer = []
+        failures = []
+        service = self.target.clientModel.service
+        service.begin_modification('Transaction')
+        try:
+            for operation, args in buffer:
+                if self.rollback:
+                    try:
+                        self.snapshot(operation, args)
+                    except Exception:
+                        # State of the object is unknown, so nothing more is written
+                        self.undo()
+                        raise
+                try:
+                    setObject(operation, *args, model=self.target)
+                except Exception as e:
+                    failures.append((operation, getattr(args[-1], 'no', None), e))
+            if failures and self.rollback:
+                self.undo()
+        finally:
+            service.finish_modification()
+
+        if failures:
+            raise TransactionError(failures, self.rollback)
+
+    def undo(self):
+        '''
+        Restore objects written by the transaction in reverse order.
+        Objects which couldn't be restored are listed in rollbackFailures.
+        '''
+        while self.journal:
+            operation, parents, no, previous = self.journal.pop()
+            try:
+                if previous is not None:
+                    setObject(operation, *parents, previous, model=self.target)
+                else:
+                    deleteObject(self.objectType(operation), no, *parents, model=self.target)
+            except Exception as e:
+                self.rollbackFailures.append((operation, no, e))
+
+    def __enter__(self):
+        self.model.clientModel = self.clientModel
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.model.clientModel = self.target.clientModel
+        if exc_type is None:
+            self.flush()
+            self.journal = []
+            return
+
+        self.discard()
+        if self.rollback and self.journal:
+            service = self.target.clientModel.service
+            service.begin_modification('Rollback')
+            try:
+                self.undo()
+            finally:
+                service.finish_modification()
@@ -0,0 +1,220 @@
+import pickle
+import itertools
+import threading
+import traceback
+import multiprocessing
+from multiprocessing.connection import wait
+from concurrent.futures import Future
+
+class WorkerTarget():
+    def __init__(self,
+                 url: str = 'http://127.0.0.1',
+                 port: str = '8081',
+                 model_name: str = 'TestModel.rf6',
+                 new_model: bool = True):
+        '''
+        RFEM instance and model the worker process attaches to.
+
+        Args:
+            url (str): Server url of RFEM instance
+            port (str): Server port of RFEM instance
+            model_name (str): Name of the model
+            new_model (bool): Create new model, or attach to already opened one if False
+        '''
+        self.url = url
+        self.port = port
+        self.model_name = model_name
+        self.new_model = new_model
+
+def attachModel(target: WorkerTarget):
+    '''
+    Default initializer of worker process.
+    Connects to RFEM instance and sets Model.clientModel, so all
+    functions of the library use the model of the worker by default.
+    '''
+    from RFEM.initModel import Model, connectToServer
+    connectToServer(target.url, target.port)
+    Model(target.new_model, target.model_name)
+
+def packOutcome(taskId, succeeded: bool, value):
+    '''
+    Pickle outcome of the task in the worker, so results and exceptions which
+    can't be pickled are reported by the text of the error instead.
+    '''
+    try:
+        return pickle.dumps((taskId, succeeded, value))
+    except Exception:
+        if succeeded:
+            message = 'Result of the task could not be sent:\n' + traceback.format_exc()
+        else:
+            message = ''.join(traceback.format_exception(type(value), value, value.__traceback__))
+        return pickle.dumps((taskId, False, message))
+
+def workerMain(target, initializer, tasks, results, workerId):
+    '''
+    Main loop of worker process. Tasks are (taskId, pickled (function, args, kwargs)),
+    None stops the worker. Outcomes are sent to results connection of the worker
+    as pickled (taskId, succeeded, value), taskId is None if initializer failed.
+    '''
+    if initializer:
+        try:
+            initializer(target)
+        except BaseException:
+            results.send_bytes(packOutcome(None, False, traceback.format_exc()))
+            return
+
+    for taskId, task in iter(tasks.get, None):
+        try:
+            function, args, kwargs = pickle.loads(task)
+            outcome = packOutcome(taskId, True, function(*args, **kwargs))
+        except BaseException as e:
+            outcome = packOutcome(taskId, False, e)
+        results.send_bytes(outcome)
+
+class ModelWorkerPool():
+    '''
+    Pool of worker processes, each bound to one model (model port) or one
+    RFEM instance. Tasks are picklable functions, e.g. building a variant,
+    calculating it or extracting result tables. Results are collected to
+    concurrent.futures.Future objects.
+
+    Example:
+        targets = [WorkerTarget(model_name='Variant%d' % i) for i in range(4)]
+        with ModelWorkerPool(targets) as pool:
+            futures = [pool.submit(buildAndCalculate, params) for params in variants]
+            results = [f.result() for f in futures]
+    '''
+    def __init__(self, targets: list, initializer = attachModel):
+        '''
+        Args:
+            targets (list): List of WorkerTarget, one worker process is started for each
+            initializer (function, optional): Called with WorkerTarget in every worker before first task
+        '''
+        context = multiprocessing.get_context('spawn')
+        self.tasks = [context.Queue() for i in targets]
+        self.pending = [0] * len(targets)
+        self.failed = {}
+        self.futures = {}
+        self.lock = threading.Lock()
+        self.taskIds = itertools.count()
+        # One pipe per worker, so a dying worker can't block results of others
+        # and its death is noticed as end of its pipe
+        pipes = [context.Pipe(duplex=False) for i in targets]
+        self.results = [reader for reader, writer in pipes]
+        self.workers = [context.Process(target=workerMain, args=(target, initializer, self.tasks[i], pipes[i][1], i), daemon=True)
+                        for i, target in enumerate(targets)]
+        for worker in self.workers:
+            worker.start()
+        for reader, writer in pipes:
+            writer.close()
+
+        self.collector = threading.Thread(target=self._collect, daemon=True)
+        self.collector.start()
+
+    def _collect(self):
+        connections = {reader: i for i, reader in enumerate(self.results)}
+        while connections:
+            for connection in wait(list(connections)):
+                workerId = connections[connection]
+                try:
+                    taskId, succeeded, value = pickle.loads(connection.recv_bytes())
+                except EOFError:
+                    # Worker exited, everything it sent was received before
+                    del connections[connection]
+                    connection.close()
+                    self.workers[workerId].join()
+                    self._fail(workerId, 'Worker %d exited with code %s.' % (workerId, self.workers[workerId].exitcode))
+                    continue
+
+                if taskId is None:
+                    # Initializer failed, worker is not available
+                    self._fail(workerId, 'Worker %d failed to attach model:\n%s' % (workerId, value))
+                    continue
+
+                with self.lock:
+                    future, worker = self.futures.pop(taskId)
+                    self.pending[worker] -= 1
+                if succeeded:
+                    future.set_result(value)
+                elif isinstance(value, BaseException):
+                    future.set_exception(value)
+                else:
+                    future.set_exception(RuntimeError(value))
+
+    def _fail(self, workerId: int, message: str):
+        '''
+        Mark worker as not available and fail its outstanding futures.
+        The first reason of the failure is kept.
+        '''
+        with self.lock:
+            message = self.failed.setdefault(workerId, message)
+            taskIds = [t for t in self.futures if self.futures[t][1] == workerId]
+            futures = [self.futures.pop(t)[0] for t in taskIds]
+            self.pending[workerId] = 0
+        for future in futures:
+            future.set_exception(RuntimeError(message))
+
+    def submit(self, function, *args, worker: int = None, **kwargs):
+        '''
+        Submit task to the pool.
+
+        Args:
+            function: Picklable (module level) function
+            args, kwargs: Picklable arguments of the function, the future fails
+                with the pickling error otherwise
+            worker (int, optional): Index of the worker (target) the task is routed to.
+                The least loaded worker is used by default.
+
+        Returns:
+            concurrent.futures.Future
+        '''
+        future = Future()
+        # Pickled here, so unpicklable task fails its future instead of the queue feeder thread
+        try:
+            task = pickle.dumps((function, args, kwargs))
+        except Exception as e:
+            future.set_exception(e)
+            return future
+
+        with self.lock:
+            if worker is None:
+                available = [i for i in range(len(self.workers)) if i not in self.failed]
+                worker = min(available, key=lambda i: self.pending[i]) if available else 0
+            if worker in self.failed:
+                future.set_exception(RuntimeError(self.failed[worker]))
+                return future
+            taskId = next(self.taskIds)
+            self.futures[taskId] = (future, worker)
+            self.pending[worker] += 1
+        self.tasks[worker].put((taskId, task))
+        return future
+
+    def map(self, function, iterable):
+        '''
+        Run function for every item of iterable, results are in the same order.
+        '''
+        futures = [self.submit(function, item) for item in iterable]
+        return [future.result() for future in futures]
+
+    def broadcast(self, function, *args, **kwargs):
+        '''
+        Run function once in every worker, e.g. to set up all models the same way.
+        '''
+        futures = [self.submit(function, *args, worker=i, **kwargs) for i in range(len(self.workers))]
+        return [future.result() for future in futures]
+
+    def close(self):
+        '''
+        Wait for submitted tasks and stop workers.
+        '''
+        for tasks in self.tasks:
+            tasks.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.collector.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
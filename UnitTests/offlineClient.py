@@ -0,0 +1,93 @@
+'''
+Model client for tests that don't need running RFEM.
+It is built from UnitTests/src/model_test.wsdl and answers every request
+with canned reply. Sent messages are recorded.
+'''
+import os
+import re
+from io import BytesIO
+import suds.transport
+from suds.client import Client
+
+with open(os.path.join(os.path.dirname(__file__), 'src', 'model_test.wsdl'), 'rb') as f:
+    WSDL = f.read()
+
+EMPTY_REPLY = b'''<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+<SOAP-ENV:Body><set_nodeResponse xmlns="http://www.dlubal.com/rfem.xsd"/></SOAP-ENV:Body>
+</SOAP-ENV:Envelope>'''
+
+RESULTS_REPLY = b'''<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+<SOAP-ENV:Body><get_results_for_members_internal_forcesResponse xmlns="http://www.dlubal.com/rfem.xsd"><value>
+<element><no>1</no><description>1</description><row>
+  <node_number><type>1</type><value>1</value></node_number><location>0.000000</location>
+  <internal_force_n>-1250.5</internal_force_n><internal_force_vz>12.25</internal_force_vz><specification/>
+</row></element>
+<element><no>2</no><description>1</description><row>
+  <location>2.500000</location><internal_force_n>-1250.5</internal_force_n><internal_force_vz>-7</internal_force_vz>
+</row></element>
+<element><no>3</no><description>Extremes</description><row>
+  <node_number><type>3</type><value>--</value></node_number>
+  <internal_force_n>-1250.5</internal_force_n><specification>N</specification>
+</row></element>
+</value></get_results_for_members_internal_forcesResponse></SOAP-ENV:Body>
+</SOAP-ENV:Envelope>'''
+
+FAULT_REPLY = b'''<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+<SOAP-ENV:Body><SOAP-ENV:Fault><faultcode>SOAP-ENV:Server</faultcode><faultstring>Object failed</faultstring></SOAP-ENV:Fault></SOAP-ENV:Body>
+</SOAP-ENV:Envelope>'''
+
+NOT_FOUND_REPLY = FAULT_REPLY.replace(b'Object failed', b'Object does not exist')
+
+def soapReply(operation, value = b''):
+    '''
+    Reply of operation with given content of value element, e.g.
+    soapReply('get_node', b'<no>1</no>').
+    '''
+    return (b'''<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+<SOAP-ENV:Body><%sResponse xmlns="http://www.dlubal.com/rfem.xsd"><value>%s</value></%sResponse></SOAP-ENV:Body>
+</SOAP-ENV:Envelope>''' % (operation.encode(), value, operation.encode()))
+
+def operationName(message):
+    '''
+    Name of the operation of sent SOAP message.
+    '''
+    return re.search(rb'<\w+:Body>\s*<\w+:(\w+)', message).group(1).decode('utf-8')
+
+class OfflineTransport(suds.transport.Transport):
+    def __init__(self, reply = EMPTY_REPLY):
+        suds.transport.Transport.__init__(self)
+        self.reply = reply
+        # Replies of particular operations, function of the message or bytes;
+        # FAULT_REPLY and other faults are answered with HTTP 500
+        self.replies = {}
+        self.sent = []
+
+    def open(self, request):
+        return BytesIO(WSDL)
+
+    def send(self, request):
+        self.sent.append(request.message)
+        reply = self.replies.get(operationName(request.message), self.reply)
+        if callable(reply):
+            reply = reply(request.message)
+        if b'SOAP-ENV:Fault>' in reply:
+            raise suds.transport.TransportError('Internal Server Error', 500, BytesIO(reply))
+        return suds.transport.Reply(200, {}, reply)
+
+    def operations(self):
+        return [operationName(message) for message in self.sent]
+
+class OfflineModel():
+    clientModel = None
+
+def createModel(reply = EMPTY_REPLY):
+    '''
+    Returns model-like object with clientModel attribute.
+    '''
+    model = OfflineModel()
+    model.clientModel = Client('http://localhost:8082/wsdl', transport=OfflineTransport(reply), location='http://localhost:8082', cache=None)
+    return model
@@ -0,0 +1,66 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import asyncio
+import inspect
+import pytest
+import RFEM.Results.resultTables
+from RFEM.enums import CaseObjectType
+from RFEM.initModel import observeModel
+from RFEM.Results.resultTables import ResultTables
+from RFEM.asyncModel import AsyncModel, AsyncResultTables
+from UnitTests.offlineClient import createModel, OfflineTransport, RESULTS_REPLY
+
+def test_operations(monkeypatch):
+    operations = []
+    monkeypatch.setattr(RFEM.Results.resultTables, 'GetResults', lambda operation, *args, model: operations.append(operation))
+
+    for name, method in inspect.getmembers(ResultTables, inspect.isfunction):
+        if name.startswith('Has'):
+            with pytest.raises(AttributeError):
+                AsyncResultTables.operation(name)
+        else:
+            # Same operation as called by ResultTables
+            method(model=None)
+            assert operations[-1] == AsyncResultTables.operation(name)
+
+def test_notify():
+    model = createModel()
+    changes = []
+    observeModel(lambda operation, args: changes.append((operation, args)), model)
+
+    async def edit():
+        async with AsyncModel(model) as asyncModel:
+            asyncModel.transport.transport = model.clientModel.options.transport
+            node = model.clientModel.factory.create('ns0:node')
+            node.no = 1
+            await asyncModel.service.set_node(node)
+            await asyncModel.service.get_node(1)
+            await asyncModel.service.delete_object('E_OBJECT_TYPE_NODE', 1)
+
+    asyncio.run(edit())
+    # Reads are not notified, deletes are notified with parent number
+    assert [operation for operation, args in changes] == ['set_node', 'delete_object']
+    assert changes[0][1][0].no == 1
+    assert changes[1][1] == ('E_OBJECT_TYPE_NODE', 1, 0)
+
+def test_asyncResultTables():
+    model = createModel(RESULTS_REPLY)
+    syncResults = ResultTables.MembersInternalForces(CaseObjectType.E_OBJECT_TYPE_LOAD_CASE, 1, 1, model=model)
+
+    async def extract():
+        async with AsyncModel(model) as asyncModel:
+            asyncModel.transport.transport = OfflineTransport(RESULTS_REPLY)
+            return await asyncio.gather(*[asyncModel.ResultTables.MembersInternalForces(
+                CaseObjectType.E_OBJECT_TYPE_LOAD_CASE, 1, i) for i in range(1, 6)])
+
+    results = asyncio.run(extract())
+
+    assert len(results) == 5
+    for r in results:
+        assert r == syncResults
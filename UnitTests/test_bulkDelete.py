@@ -0,0 +1,79 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import re
+import RFEM.asyncModel
+from RFEM.enums import ObjectTypes
+from RFEM.BasicObjects.node import Node
+from RFEM.Loads.nodalLoad import NodalLoad
+from RFEM.modelMirror import ModelMirror, GetObject
+from RFEM.bulkDelete import DeleteObjects
+from RFEM.modelBuilder import ModelBuilder
+from UnitTests.offlineClient import createModel
+
+# Nodes and loads assigned to nodes
+SEEDED_TYPES = [ObjectTypes.E_OBJECT_TYPE_NODE, ObjectTypes.E_OBJECT_TYPE_NODAL_LOAD, ObjectTypes.E_OBJECT_TYPE_IMPOSED_NODAL_DEFORMATION]
+
+def test_deleteObjects():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    mirror = ModelMirror.attach(model)
+    mirror.seed(SEEDED_TYPES, model)
+    for i in range(1, 5):
+        Node(i, i*2.0, 0.0, 0.0, model=model)
+    NodalLoad(1, 1, '1 2', model=model)
+    NodalLoad(2, 1, '2 4', model=model)
+
+    sent = len(transport.sent)
+    DeleteObjects({ObjectTypes.E_OBJECT_TYPE_NODE: '1-2'}, loads=True, model=model)
+    assert transport.operations()[sent:] == ['set_nodal_load', 'delete_object', 'delete_object', 'delete_object']
+    assert re.search(rb':nodes>4<', transport.sent[sent])
+    assert re.search(rb':type>E_OBJECT_TYPE_NODAL_LOAD<', transport.sent[sent+1])
+
+    assert GetObject(ObjectTypes.E_OBJECT_TYPE_NODE, 2, model=model) is None
+    # Loads could be changed by RFEM when the nodes were deleted, they are read again
+    assert mirror.complete == {ObjectTypes.E_OBJECT_TYPE_NODE}
+    assert mirror.numbers(ObjectTypes.E_OBJECT_TYPE_NODAL_LOAD, 1) == []
+
+    # Loads are kept by default, deletes are sent inside modification window of the caller
+    sent = len(transport.sent)
+    model.clientModel.service.begin_modification('Delete')
+    Node.DeleteNode('4', model=model)
+    model.clientModel.service.finish_modification()
+    assert transport.operations()[sent:] == ['begin_modification', 'delete_object', 'finish_modification']
+    ModelMirror.detach(model)
+
+def test_deleteObjectsBuilder():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    ModelMirror.attach(model).seed(SEEDED_TYPES, model)
+
+    sent = len(transport.sent)
+    with ModelBuilder(model) as builder:
+        for i in range(1, 4):
+            Node(i, i*2.0, 0.0, 0.0, model=builder)
+        NodalLoad(1, 1, '1 2', model=builder)
+        DeleteObjects({ObjectTypes.E_OBJECT_TYPE_NODE: '1'}, loads=True, model=builder)
+        Node(4, model=builder)
+
+    # Buffered objects are sent before, locations of loads are taken from the mirror
+    assert transport.operations()[sent:] == ['begin_modification', 'set_node', 'set_node', 'set_node', 'set_nodal_load', 'finish_modification',
+                                             'set_nodal_load', 'delete_object',
+                                             'begin_modification', 'set_node', 'finish_modification']
+    assert GetObject(ObjectTypes.E_OBJECT_TYPE_NODE, 1, model=model) is None
+    ModelMirror.detach(model)
+
+def test_pipelineDelete(monkeypatch):
+    model = createModel()
+    transport = model.clientModel.options.transport
+    monkeypatch.setattr(RFEM.asyncModel, 'RequestsTransport', lambda **kwargs: transport)
+
+    DeleteObjects({ObjectTypes.E_OBJECT_TYPE_NODE: range(1, 21)}, concurrency=4, modification=True, model=model)
+    operations = transport.operations()
+    assert operations[0] == 'begin_modification' and operations[-1] == 'finish_modification'
+    assert operations.count('delete_object') == 20
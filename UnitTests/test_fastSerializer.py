@@ -0,0 +1,53 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+from xml.etree.ElementTree import canonicalize
+from RFEM.initModel import clearAttributes, deleteEmptyAttributes
+from RFEM.fastSerializer import FastSerializer, useFastSerializer, setObject
+from UnitTests.offlineClient import createModel
+
+def createObject(client, typeName, **fields):
+    clientObject = clearAttributes(client.factory.create(typeName))
+    for key in fields:
+        clientObject[key] = fields[key]
+    return deleteEmptyAttributes(clientObject)
+
+def sudsMessage(client, operation, *args):
+    method = getattr(client.service, operation).method
+    return method.binding.input.get_message(method, args, {}).plain()
+
+def test_parity():
+    model = createModel()
+    serializer = FastSerializer(model.clientModel)
+
+    node = createObject(model.clientModel, 'ns0:node', no=3, type='TYPE_STANDARD', coordinate_1=1.5, coordinate_3=-2.0, comment='a < b & "c"')
+    assert canonicalize(serializer.serialize('set_node', node)) == canonicalize(sudsMessage(model.clientModel, 'set_node', node))
+
+    load = createObject(model.clientModel, 'ns0:nodal_load', no=1, load_type='LOAD_TYPE_FORCE', nodes='1 2', force_magnitude=5000.0, has_shifted_load=False)
+    assert canonicalize(serializer.serialize('set_nodal_load', 7, load)) == canonicalize(sudsMessage(model.clientModel, 'set_nodal_load', 7, load))
+
+def test_fallback():
+    model = createModel()
+    serializer = FastSerializer(model.clientModel)
+
+    vector = model.clientModel.factory.create('ns0:vector_3d')
+    node = createObject(model.clientModel, 'ns0:node', no=1, global_coordinates=vector)
+    assert serializer.serialize('set_node', node) is None
+
+def test_setObject():
+    model = createModel()
+    node = createObject(model.clientModel, 'ns0:node', no=1, coordinate_1=4.0)
+
+    setObject('set_node', node, model=model)
+    useFastSerializer(True, model)
+    setObject('set_node', node, model=model)
+    useFastSerializer(False, model)
+
+    sent = model.clientModel.options.transport.sent
+    assert len(sent) == 2
+    assert canonicalize(sent[0].decode('utf-8')) == canonicalize(sent[1].decode('utf-8'))
@@ -0,0 +1,68 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+from RFEM.enums import ObjectTypes
+from RFEM.initModel import FirstFreeIdNumber, notifyModel
+from RFEM.BasicObjects.node import Node
+from RFEM.BasicObjects.member import Member
+from RFEM.modelBuilder import ModelBuilder
+from RFEM.idAllocator import IdAllocator, AllocateIdNumbers
+from UnitTests.offlineClient import createModel, soapReply
+
+NODE = ObjectTypes.E_OBJECT_TYPE_NODE
+
+def offlineModel():
+    model = createModel()
+    model.clientModel.options.transport.replies['get_all_object_numbers_by_type'] = soapReply('get_all_object_numbers_by_type',
+        b'<item><type>E_OBJECT_TYPE_NODE</type><no>1</no></item><item><type>E_OBJECT_TYPE_NODE</type><no>3</no></item>')
+    return model
+
+def test_allocator():
+    model = offlineModel()
+    transport = model.clientModel.options.transport
+    IdAllocator.attach(model)
+
+    assert FirstFreeIdNumber(NODE, model=model) == 4
+    # Nothing is reserved by FirstFreeIdNumber
+    assert FirstFreeIdNumber(NODE, model=model) == 4
+    assert AllocateIdNumbers(NODE, 3, model=model) == range(4, 7)
+    assert FirstFreeIdNumber(NODE, model=model) == 7
+    # Objects created by constructors are recorded
+    Node(20, model=model)
+    assert FirstFreeIdNumber(NODE, model=model) == 21
+
+    with ModelBuilder(model) as builder:
+        for i in AllocateIdNumbers(NODE, 2, model=builder):
+            Node(i, model=builder)
+        assert FirstFreeIdNumber(NODE, model=builder) == 23
+
+    assert transport.operations().count('get_all_object_numbers_by_type') == 1
+    assert 'get_first_free_number' not in transport.operations()
+
+    notifyModel(model.clientModel, 'delete_all')
+    assert FirstFreeIdNumber(NODE, model=model) == 1
+    IdAllocator.detach(model)
+
+def test_withoutAllocator():
+    model = offlineModel()
+    assert AllocateIdNumbers(NODE, 2, model=model) == range(4, 6)
+
+def test_implicitObjects():
+    model = offlineModel()
+    transport = model.clientModel.options.transport
+    IdAllocator.attach(model)
+    LINE = ObjectTypes.E_OBJECT_TYPE_LINE
+
+    assert AllocateIdNumbers(LINE, 1, model=model) == range(4, 5)
+    AllocateIdNumbers(NODE, 1, model=model)
+    # Line created by member is not known, numbers of lines are read again
+    Member(1, 1, 2, model=model)
+    AllocateIdNumbers(LINE, 1, model=model)
+    AllocateIdNumbers(NODE, 1, model=model)
+    assert transport.operations().count('get_all_object_numbers_by_type') == 3
+    IdAllocator.detach(model)
@@ -0,0 +1,57 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import pickle
+import subprocess
+from enum import Enum
+import RFEM.enums
+from RFEM.enums import NodalSupportType
+from Benchmarks.importTime import importTime, starImportTime
+
+# Budget of cumulative import time of RFEM.initModel in microseconds
+IMPORT_BUDGET = 100000
+# Budget of from RFEM.enums import * in microseconds, all enums are defined
+STAR_IMPORT_BUDGET = 90000
+
+def importedModules(module):
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    code = 'import sys, %s, RFEM.enums; print(" ".join(sys.modules)); print(" ".join(vars(RFEM.enums)))' % module
+    modules, names = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True).stdout.split('\n')[:2]
+    return modules.split(), names.split()
+
+def test_importBudget():
+    # Best of three, first import also compiles bytecode
+    assert min(importTime('RFEM.initModel') for i in range(3)) < IMPORT_BUDGET
+
+def test_starImportBudget():
+    # Best of three, first import also compiles enums
+    assert min(starImportTime('RFEM.enums') for i in range(3)) < STAR_IMPORT_BUDGET
+
+def test_enumCache():
+    # Compiled enums are cached, the cache is valid for current enumDefinitions.py
+    RFEM.enums.compileDefinitions()
+    assert os.path.exists(RFEM.enums.CACHE)
+    assert RFEM.enums.compileDefinitions().keys() == RFEM.enums.definitions.keys()
+
+def test_lazyImport():
+    modules, names = importedModules('RFEM.BasicObjects.node')
+    for module in ('pytest', 'mock', 'xmltodict', 'requests', 'suds', 'asyncio'):
+        assert module not in modules
+    # Only enums used by imported modules are defined
+    assert len([name for name in names if name in RFEM.enums.definitions]) < 10
+
+def test_enums():
+    assert len(RFEM.enums.definitions) > 300
+    for name in RFEM.enums.definitions:
+        enum = getattr(RFEM.enums, name)
+        assert issubclass(enum, Enum)
+        assert enum.__module__ == 'RFEM.enums'
+        assert getattr(RFEM.enums, name) is enum
+    assert NodalSupportType is RFEM.enums.NodalSupportType
+    assert pickle.loads(pickle.dumps(NodalSupportType.FIXED)) is NodalSupportType.FIXED
+    assert 'ObjectTypes' in dir(RFEM.enums)
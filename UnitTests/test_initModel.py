@@ -6,7 +6,9 @@ PROJECT_ROOT = os.path.abspath(os.path.join(
 )
 sys.path.append(PROJECT_ROOT)
 
-from RFEM.initModel import insertSpaces
+import mock
+from RFEM.initModel import insertSpaces, client, connectionGlobals, clearAttributes, createEmptyObject
+from UnitTests.offlineClient import createModel
 
 def test_insertSpaces():
     """
@@ -14,3 +16,54 @@ def test_insertSpaces():
     """
     assert insertSpaces([1, 2, 3]) == "1 2 3"
 
+
+def test_lazyConnection():
+    """
+    Importing initModel must not connect to the server.
+    """
+    assert not connectionGlobals.connected
+    assert connectionGlobals.client is None
+
+def test_lazyClientConnectsOnFirstUse():
+    """
+    LazyClient calls connectToServer() on first attribute access.
+    """
+    serverClient = mock.Mock()
+
+    def fakeConnect():
+        connectionGlobals.client = serverClient
+        connectionGlobals.connected = True
+
+    try:
+        with mock.patch('RFEM.initModel.connectToServer', side_effect=fakeConnect) as connect:
+            assert client.service is serverClient.service
+            assert client.service is serverClient.service
+            connect.assert_called_once_with()
+    finally:
+        connectionGlobals.client = None
+        connectionGlobals.connected = False
+
+def test_url():
+    """
+    initModel.url follows the url of the connection.
+    """
+    import RFEM.initModel as initModel
+    try:
+        connectionGlobals.url = 'http://192.168.0.2'
+        assert initModel.url == 'http://192.168.0.2'
+    finally:
+        connectionGlobals.url = 'http://127.0.0.1'
+
+def test_createEmptyObject():
+    """
+    Objects of the same type share metadata of the schema type, not attributes.
+    """
+    model = createModel()
+    node = createEmptyObject('ns0:node', model)
+    node.no = 1
+
+    other = createEmptyObject('ns0:node', model)
+    assert other.no is None
+    assert 'no' not in other
+    assert other.__metadata__.sxtype is node.__metadata__.sxtype
+    assert other.__metadata__.ordering == clearAttributes(model.clientModel.factory.create('ns0:node')).__metadata__.ordering
@@ -0,0 +1,38 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+from RFEM.dataTypes import IntRangeSet
+from RFEM.initModel import ConvertToDlString, ConvertStrToListOfInt
+
+def test_construction():
+    assert IntRangeSet('1-3, 5 4 9').runs == [(1, 5), (9, 9)]
+    assert IntRangeSet([7, 3, 4, 5, 5]).runs == [(3, 5), (7, 7)]
+    assert IntRangeSet(range(1, 100001)).runs == [(1, 100000)]
+    assert IntRangeSet(6).runs == [(6, 6)]
+    assert not IntRangeSet()
+    assert IntRangeSet('1-100000') == IntRangeSet(range(1, 100001))
+
+def test_operations():
+    a = IntRangeSet('1-10 20-30')
+    b = IntRangeSet('5-25 40')
+    assert str(a | b) == '1-30 40'
+    assert str(a & b) == '5-10 20-25'
+    assert str(a - b) == '1-4 26-30'
+    assert str(b - a) == '11-19 40'
+    assert len(a) == 21
+    assert 25 in a and 15 not in a and 0 not in a
+    assert list(IntRangeSet('3-5 8')) == [3, 4, 5, 8]
+
+def test_conversions():
+    members = IntRangeSet('1-100000')
+    assert str(members) == '1-100000'
+    assert ConvertToDlString(members) == ConvertToDlString('1-100000')
+    assert ConvertStrToListOfInt(members) == list(range(1, 100001))
+    assert ConvertStrToListOfInt('1,3,5-9') == [1, 3, 5, 6, 7, 8, 9]
+    assert ConvertStrToListOfInt(range(2, 4)) == [2, 3]
+    assert ConvertToDlString('1,  3') == '1 3'
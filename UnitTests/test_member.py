@@ -338,3 +338,24 @@ def test_member_couplingHingeHinge():
 
     assert round(member.analytical_length, 5) == 5.19615
     assert member.type == "TYPE_COUPLING_HINGE_HINGE"
+
+def test_member_fromConnectivity():
+
+    Model.clientModel.service.delete_all()
+    Model.clientModel.service.begin_modification()
+
+    Material(1, 'S235')
+    Section(1, 'IPE 300', 1)
+
+    Model.clientModel.service.finish_modification()
+
+    Node.FromArray([1, 2, 3], [[0, 0, 0], [3, 0, 0], [3, 0, -3]])
+    Member.FromConnectivity([[1, 1, 2, 1, 1, 0.0], [2, 2, 3, 1, 1, 0.2618], [3, 1, 3, 1, 1, 0.0]],
+                            [MemberType.TYPE_BEAM, MemberType.TYPE_BEAM, MemberType.TYPE_TRUSS])
+
+    member = Model.clientModel.service.get_member(2)
+    assert round(member.rotation_angle, 4) == 0.2618
+    member = Model.clientModel.service.get_member(3)
+    assert member.type == "TYPE_TRUSS"
+    assert round(member.analytical_length, 5) == 4.24264
+
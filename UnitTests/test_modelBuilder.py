@@ -0,0 +1,98 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import re
+import pytest
+from math import pi
+from RFEM.enums import NodeCoordinateSystemType, MemberType
+from RFEM.BasicObjects.member import Member
+from RFEM.BasicObjects.node import Node
+from RFEM.modelBuilder import ModelBuilder
+from UnitTests.offlineClient import createModel
+
+def test_chunks():
+    model = createModel()
+
+    with ModelBuilder(model, chunk_size=2) as builder:
+        for i in range(3):
+            Node(i+1, i*1.5, 0.0, 0.0, model=builder)
+        assert len(builder.buffer) == 1
+
+    assert model.clientModel.options.transport.operations() == ['begin_modification', 'set_node', 'set_node', 'finish_modification',
+                                 'begin_modification', 'set_node', 'finish_modification']
+
+def test_passthrough():
+    model = createModel()
+    builder = ModelBuilder(model, chunk_size=None)
+
+    Node(1, model=builder)
+    Node(2, model=builder)
+    assert model.clientModel.options.transport.sent == []
+
+    # Other operations flush the buffer first
+    builder.clientModel.service.get_node(1)
+    assert model.clientModel.options.transport.operations() == ['begin_modification', 'set_node', 'set_node', 'finish_modification', 'get_node']
+
+def test_exception():
+    model = createModel()
+
+    with pytest.raises(ValueError):
+        with ModelBuilder(model) as builder:
+            Node(1, model=builder)
+            raise ValueError()
+
+    assert model.clientModel.options.transport.sent == []
+
+def test_nodeFromArray():
+    model = createModel()
+    transport = model.clientModel.options.transport
+
+    Node.FromArray(range(1, 6), [[i, 0.0, 0.0] for i in range(5)], chunk_size=2, model=model)
+    assert transport.operations().count('begin_modification') == 3
+    assert transport.operations().count('set_node') == 5
+
+    # Angles in degrees are converted to radians as in Node.Standard
+    transport.sent.clear()
+    Node.FromArray([6], [[2.0, 90.0, 45.0]], NodeCoordinateSystemType.COORDINATE_SYSTEM_POLAR, model=model)
+    assert re.search(rb':coordinate_2>%s<' % str(pi/2).encode(), transport.sent[1])
+    assert re.search(rb':coordinate_3>%s<' % str(pi/4).encode(), transport.sent[1])
+
+    with pytest.raises(ValueError):
+        Node.FromArray([1, 2], [[0.0, 0.0, 0.0]], model=model)
+
+    # Nodes are added to the buffer of given builder
+    with ModelBuilder(model, chunk_size=None) as builder:
+        Node.FromArray([7, 8], [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]], model=builder)
+        assert len(builder.buffer) == 2
+
+def test_memberFromConnectivity():
+    model = createModel()
+    transport = model.clientModel.options.transport
+
+    Member.FromConnectivity([[1, 1, 2, 1, 1, 0.0], [2, 2, 3, 2, 3, 0.5], [3, 3, 4, 4, 4, 0.0]],
+                            [MemberType.TYPE_BEAM, MemberType.TYPE_RIGID, MemberType.TYPE_TRUSS],
+                            hinges=[[1, 0], [0, 2], [0, 0]], model=model)
+    assert transport.operations() == ['begin_modification', 'set_member', 'set_member', 'set_member', 'finish_modification']
+
+    beam, rigid, truss = transport.sent[1:4]
+    assert re.search(rb':section_end>1<', beam) and re.search(rb':member_hinge_start>1<', beam)
+    assert re.search(rb':rotation_angle>0.5<', rigid) and not re.search(rb':section_start>', rigid)
+    assert re.search(rb':section_end>4<', truss) and re.search(rb':type>TYPE_TRUSS<', truss)
+
+    # Nothing is sent if any member is invalid
+    transport.sent.clear()
+    for connectivity, kwargs in [([[1, 1, 1]], {}),
+                                 ([[1, 1, 2], [1, 2, 3]], {}),
+                                 ([[1, 1, 2.5]], {}),
+                                 ([[1, 1, 2]], {'member_type': MemberType.TYPE_RIB}),
+                                 ([[1, 1, 2]], {'member_type': MemberType.TYPE_TRUSS, 'hinges': [[1, 1]]}),
+                                 ([[1, 1, 2]], {'eccentricities': [[1, 1], [1, 1]]})]:
+        with pytest.raises(ValueError):
+            Member.FromConnectivity(connectivity, model=model, **kwargs)
+    assert transport.sent == []
+
@@ -0,0 +1,114 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+from RFEM.enums import ObjectTypes
+from RFEM.initModel import FirstFreeIdNumber, notifyModel
+from RFEM.BasicObjects.node import Node
+from RFEM.BasicObjects.member import Member
+from RFEM.Loads.nodalLoad import NodalLoad
+from RFEM.modelMirror import ModelMirror, GetObject, GetObjectLocations, GetModelInfo
+from RFEM.modelBuilder import ModelBuilder
+from RFEM.fastSerializer import deleteObject
+from UnitTests.offlineClient import createModel, soapReply
+
+def test_record():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    mirror = ModelMirror.attach(model)
+    # Empty model
+    mirror.seed([ObjectTypes.E_OBJECT_TYPE_NODE, ObjectTypes.E_OBJECT_TYPE_NODAL_LOAD], model)
+
+    Node(1, 2.0, 0.0, 0.0, model=model)
+    Node(2, 4.0, 0.0, 0.0, model=model)
+    NodalLoad(3, 1, '1 2', model=model)
+
+    assert GetObject(ObjectTypes.E_OBJECT_TYPE_NODE, 1, model=model).coordinate_1 == 2.0
+    assert GetObject(ObjectTypes.E_OBJECT_TYPE_NODAL_LOAD, 3, 1, model=model).nodes == '1 2'
+    # Seeded type, missing object doesn't exist
+    assert GetObject(ObjectTypes.E_OBJECT_TYPE_NODE, 5, model=model) is None
+
+    Node.DeleteNode('1', model=model)
+    assert GetObject(ObjectTypes.E_OBJECT_TYPE_NODE, 1, model=model) is None
+    assert mirror.numbers(ObjectTypes.E_OBJECT_TYPE_NODE) == [2]
+    assert FirstFreeIdNumber(ObjectTypes.E_OBJECT_TYPE_NODE, model=model) == 1
+
+    assert 'get_node' not in transport.operations()
+    assert 'get_first_free_number' not in transport.operations()
+    assert mirror.misses == 0
+
+    ModelMirror.detach(model)
+    Node(6, model=model)
+    assert (ObjectTypes.E_OBJECT_TYPE_NODE, 6, 0) not in mirror.objects
+
+def test_seed():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    transport.replies['get_all_object_numbers_by_type'] = soapReply('get_all_object_numbers_by_type',
+        b'<item><type>E_OBJECT_TYPE_NODE</type><no>1</no></item><item><type>E_OBJECT_TYPE_NODE</type><no>3</no></item>')
+    transport.replies['get_node'] = lambda message: soapReply('get_node', b'<no>%s</no>' % message.split(b':no>')[1].split(b'<')[0])
+    transport.replies['get_model_info'] = soapReply('get_model_info', b'<property_node_count>2</property_node_count>')
+
+    mirror = ModelMirror.attach(model)
+    mirror.seed([ObjectTypes.E_OBJECT_TYPE_NODE], model)
+    assert mirror.numbers(ObjectTypes.E_OBJECT_TYPE_NODE) == [1, 3]
+    assert mirror.firstFreeNumber(ObjectTypes.E_OBJECT_TYPE_NODE) == 2
+    # Type wasn't seeded
+    assert mirror.firstFreeNumber(ObjectTypes.E_OBJECT_TYPE_LINE) is None
+
+    sent = len(transport.sent)
+    assert GetObject(ObjectTypes.E_OBJECT_TYPE_NODE, 3, model=model).no == 3
+    assert GetModelInfo(model).property_node_count == 2
+    assert GetModelInfo(model).property_node_count == 2
+    assert transport.operations()[sent:] == ['get_model_info']
+
+    # Model info is read again after change
+    Node(2, model=model)
+    GetModelInfo(model)
+    assert transport.operations()[-1] == 'get_model_info'
+    assert (mirror.hits, mirror.misses) == (2, 2)
+    ModelMirror.detach(model)
+
+def test_builder():
+    model = createModel()
+    mirror = ModelMirror.attach(model)
+    mirror.seed([ObjectTypes.E_OBJECT_TYPE_NODE], model)
+
+    with ModelBuilder(model) as builder:
+        Node(1, model=builder)
+        Node(2, model=builder)
+        # Deletes through the builder are recorded by the mirror of the model
+        deleteObject(ObjectTypes.E_OBJECT_TYPE_NODE, 1, model=builder)
+
+    assert GetObject(ObjectTypes.E_OBJECT_TYPE_NODE, 1, model=model) is None
+    assert mirror.numbers(ObjectTypes.E_OBJECT_TYPE_NODE) == [2]
+    ModelMirror.detach(model)
+
+def test_implicitObjects():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    mirror = ModelMirror.attach(model)
+    mirror.seed([ObjectTypes.E_OBJECT_TYPE_NODE, ObjectTypes.E_OBJECT_TYPE_LINE, ObjectTypes.E_OBJECT_TYPE_MEMBER], model)
+    Node(1, model=model)
+    Node(2, 1.0, model=model)
+
+    # Member defined by nodes creates its line in RFEM
+    Member(1, 1, 2, model=model)
+    assert mirror.complete == {ObjectTypes.E_OBJECT_TYPE_NODE, ObjectTypes.E_OBJECT_TYPE_MEMBER}
+    sent = len(transport.sent)
+    GetObjectLocations(ObjectTypes.E_OBJECT_TYPE_LINE, model=model)
+    assert transport.operations()[sent:] == ['get_all_object_numbers_by_type']
+
+    # Deleting node deletes objects depending on it, e.g. its lines and members
+    Node.DeleteNode('2', model=model)
+    assert mirror.complete == {ObjectTypes.E_OBJECT_TYPE_NODE}
+    assert mirror.numbers(ObjectTypes.E_OBJECT_TYPE_MEMBER) == []
+
+    # Model check can merge and delete objects of any type
+    notifyModel(model.clientModel, 'model_check__process_object_groups_operation', ('UNITE_NODES_AND_DELETE_UNUSED_NODES', 0.001, None))
+    assert mirror.complete == set() and mirror.objects == {}
+    ModelMirror.detach(model)
@@ -0,0 +1,74 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import re
+from RFEM.enums import ObjectTypes
+from RFEM.BasicObjects.node import Node
+from RFEM.modelMirror import ModelMirror
+from RFEM.modelSync import ModelSync
+from UnitTests.offlineClient import createModel, soapReply
+
+def buildModel(model, d):
+    with ModelSync(model) as sync:
+        Node(1, 0.0, 0.0, 0.0, model=model)
+        Node(2, d, 0.0, 0.0, model=model)
+        if d < 3.0:
+            Node(3, 2*d, 0.0, 0.0, model=model)
+    return sync
+
+def test_sync_mirror():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    ModelMirror.attach(model).seed([ObjectTypes.E_OBJECT_TYPE_NODE], model)
+
+    sync = buildModel(model, 2.0)
+    assert len(sync.created) == 3
+    assert transport.operations().count('set_node') == 3
+
+    sent = len(transport.sent)
+    sync = buildModel(model, 2.0)
+    assert len(sync.unchanged) == 3
+    assert transport.operations()[sent:] == []
+
+    sync = buildModel(model, 4.0)
+    assert sync.modified == [(ObjectTypes.E_OBJECT_TYPE_NODE, 2, 0)]
+    assert sync.deleted == [(ObjectTypes.E_OBJECT_TYPE_NODE, 3, 0)]
+    assert transport.operations()[sent:] == ['begin_modification', 'set_node', 'finish_modification',
+                                             'begin_modification', 'delete_object', 'finish_modification']
+    assert re.search(rb':coordinate_1>4.0<', transport.sent[sent+1])
+    ModelMirror.detach(model)
+
+def test_sync_read():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    transport.replies['get_all_object_numbers_by_type'] = soapReply('get_all_object_numbers_by_type',
+        b'<item><type>E_OBJECT_TYPE_NODE</type><no>1</no></item><item><type>E_OBJECT_TYPE_NODE</type><no>2</no></item>' \
+        b'<item><type>E_OBJECT_TYPE_NODE</type><no>4</no></item>')
+    transport.replies['get_node'] = lambda message: soapReply('get_node',
+        b'<no>%s</no><coordinate_1>0.0</coordinate_1><coordinate_2>0</coordinate_2><coordinate_3>0</coordinate_3><comment/>' % \
+        message.split(b':no>')[1].split(b'<')[0])
+
+    sync = buildModel(model, 2.0)
+    assert sync.unchanged == [(ObjectTypes.E_OBJECT_TYPE_NODE, 1, 0)]
+    assert sync.modified == [(ObjectTypes.E_OBJECT_TYPE_NODE, 2, 0)]
+    assert sync.created == [(ObjectTypes.E_OBJECT_TYPE_NODE, 3, 0)]
+    assert sync.deleted == [(ObjectTypes.E_OBJECT_TYPE_NODE, 4, 0)]
+    assert transport.operations().count('get_all_object_numbers_by_type') == 1
+    assert transport.operations().count('get_node') == 2
+    assert transport.operations().count('set_node') == 2
+
+def test_sync_no_prune():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    ModelMirror.attach(model).seed([ObjectTypes.E_OBJECT_TYPE_NODE], model)
+    buildModel(model, 2.0)
+    with ModelSync(model, prune=False) as sync:
+        Node(1, 0.0, 0.0, 0.0, model=model)
+    assert sync.deleted == []
+    assert 'delete_object' not in transport.operations()
+    ModelMirror.detach(model)
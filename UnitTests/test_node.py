@@ -64,4 +64,18 @@ def test_node_delete():
 
     modelInfo = Model.clientModel.service.get_model_info()
 
-    assert modelInfo.property_node_count == 1
\ No newline at end of file
+    assert modelInfo.property_node_count == 1
+
+def test_node_from_array():
+
+    Model.clientModel.service.delete_all()
+
+    Node.FromArray([1, 2, 3], [[0, 0, 0], [5, 0, 0], [5, 5, 0]])
+    Node.FromArray([4], [[2, 90, 0]], NodeCoordinateSystemType.COORDINATE_SYSTEM_Z_CYLINDRICAL)
+
+    node = Model.clientModel.service.get_node(3)
+    assert node.coordinate_1 == 5
+    assert node.coordinate_2 == 5
+    node = Model.clientModel.service.get_node(4)
+    assert round(node.global_coordinates.y, 6) == 2
+
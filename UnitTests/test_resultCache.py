@@ -0,0 +1,79 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import asyncio
+from RFEM.enums import CaseObjectType
+from RFEM.initModel import notifyModel
+from RFEM.BasicObjects.node import Node
+from RFEM.Results.resultTables import ResultTables
+from RFEM.Results.resultCache import ResultCache
+from RFEM.asyncModel import AsyncModel
+from UnitTests.offlineClient import createModel, soapReply, RESULTS_REPLY
+
+LOAD_CASE = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE
+OPERATION = 'get_results_for_members_internal_forces'
+
+def test_cache():
+    model = createModel(RESULTS_REPLY)
+    transport = model.clientModel.options.transport
+    transport.replies['set_node'] = soapReply('set_node')
+    cache = ResultCache.attach(model)
+
+    rows = ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model=model)
+    assert ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model=model) == rows
+    ResultTables.MembersInternalForces(LOAD_CASE, 1, 2, model=model)
+    assert transport.operations().count(OPERATION) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Changes of the model drop cached results
+    Node(1, model=model)
+    ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model=model)
+    # Notified by Calculate_all()
+    notifyModel(model.clientModel, 'calculate_all', (False,))
+    ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model=model)
+    assert transport.operations().count(OPERATION) == 4
+    assert cache.info() == {'hits': 1, 'misses': 4, 'invalidations': 2, 'size': 1, 'maxsize': 128}
+
+    ResultCache.detach(model)
+    ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model=model)
+    assert transport.operations().count(OPERATION) == 5
+
+def test_lru():
+    model = createModel(RESULTS_REPLY)
+    transport = model.clientModel.options.transport
+    cache = ResultCache.attach(model, maxsize=2)
+
+    for object_no in (1, 2, 1, 3, 1, 2):
+        ResultTables.MembersInternalForces(LOAD_CASE, 1, object_no, model=model)
+
+    # Table of object 2 was the least recently used one when table of object 3 was read
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert transport.operations().count(OPERATION) == 4
+    assert len(cache.tables) == 2
+
+def test_async():
+    model = createModel(RESULTS_REPLY)
+    transport = model.clientModel.options.transport
+    transport.replies['set_node'] = soapReply('set_node')
+    cache = ResultCache.attach(model)
+    rows = ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model=model)
+
+    async def extract():
+        async with AsyncModel(model) as asyncModel:
+            asyncModel.transport.transport = transport
+            cached = await asyncModel.ResultTables.MembersInternalForces(LOAD_CASE, 1, 1)
+            # Change through AsyncService drops cached results
+            await asyncModel.service.set_node(model.clientModel.factory.create('ns0:node'))
+            await asyncModel.ResultTables.MembersInternalForces(LOAD_CASE, 1, 1)
+            return cached
+
+    assert asyncio.run(extract()) == rows
+    assert transport.operations().count(OPERATION) == 2
+    assert (cache.hits, cache.misses, cache.invalidations) == (1, 2, 1)
+    ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model=model)
+    assert cache.hits == 2
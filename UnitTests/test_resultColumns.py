@@ -0,0 +1,56 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import math
+import pytest
+from RFEM.enums import CaseObjectType
+from RFEM.Results.resultTables import ResultTables, ConvertResults, GetMinValue, GetMaxValue
+from UnitTests.offlineClient import createModel, RESULTS_REPLY
+
+LOAD_CASE = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE
+
+def test_columns():
+    model = createModel(RESULTS_REPLY)
+    rows = ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model=model)
+    columns = ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, output='columns', model=model)
+
+    assert set(columns) == set().union(*rows)
+    assert columns['internal_force_n'].dtype == float
+    assert columns['node_number'].dtype == object
+    for name, column in columns.items():
+        assert len(column) == len(rows)
+        for value, row in zip(column, rows):
+            if name not in row:
+                assert value is None or math.isnan(value)
+            else:
+                assert value == row[name]
+
+    # NaN in empty cells
+    assert math.isnan(columns['internal_force_vz'][2])
+    assert GetMaxValue(columns, 'internal_force_vz') == GetMaxValue(rows, 'internal_force_vz') == 12.25
+    assert GetMinValue(columns, 'node_number') == GetMinValue(rows, 'node_number') == 1.0
+
+def test_structured():
+    model = createModel(RESULTS_REPLY)
+    results = model.clientModel.service.get_results_for_members_internal_forces(LOAD_CASE.name, 1, 1)
+    array = ConvertResults(results, 'structured', includeBase=True)
+
+    assert len(array) == 3
+    assert list(array['description']) == ['1.0', '1.0', 'Extremes']
+    assert list(array['internal_force_n']) == [-1250.5] * 3
+    assert GetMinValue(array, 'internal_force_vz') == -7.0
+
+    with pytest.raises(ValueError):
+        ConvertResults(results, 'table')
+
+def test_positional_model():
+    model = createModel(RESULTS_REPLY)
+    # Model stays the fourth argument, as before output was added
+    rows = ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model)
+    assert rows == ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model, 'dicts')
+    assert set(ResultTables.MembersInternalForces(LOAD_CASE, 1, 1, model, 'columns')) == set().union(*rows)
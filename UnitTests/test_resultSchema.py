@@ -0,0 +1,117 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import math
+from RFEM.enums import CaseObjectType
+from RFEM.Results.resultTables import ConvertResultsToListOfDct, ConvertResultsToColumns, GetResultTableParameters
+from RFEM.Results.resultSchema import ResultTableSchema, convertNumber, convertText, convertVariant
+from UnitTests.offlineClient import createModel, soapReply, RESULTS_REPLY
+
+LOAD_CASE = CaseObjectType.E_OBJECT_TYPE_LOAD_CASE.name
+
+def legacyConvertResultsToListOfDct(results, includeBase = False):
+    # Converter guessing type of every cell, the results have to stay the same
+    params = {'base':[], 'row':[]}
+    for i in results[0]:
+        params['base'] = list(set(params['base'] + i.__keylist__))
+        if 'row' in i.__keylist__:
+            params['row'] = list(set(params['row'] + i.row.__keylist__))
+
+    def convert(r, y):
+        try:
+            return float(r.row[y].value)
+        except:
+            try:
+                return r.row[y].value
+            except:
+                return float(r.row[y])
+
+    lstOfDct = []
+    for r in results[0]:
+        dct = {}
+        columns = params['base'] if includeBase else ['row']
+        for i in columns:
+            if i == 'row':
+                for y in params['row']:
+                    try:
+                        dct[y] = convert(r, y)
+                    except:
+                        try:
+                            dct[y] = r.row[y]
+                        except:
+                            pass
+            else:
+                try:
+                    dct[i] = float(r[i])
+                except:
+                    try:
+                        dct[i] = r[i]
+                    except:
+                        pass
+        lstOfDct.append(dct)
+    return lstOfDct
+
+def assertSameDicts(converted, expected):
+    assert len(converted) == len(expected)
+    for c, e in zip(converted, expected):
+        # Same keys in the same order and values of the same types
+        assert list(c) == list(e)
+        assert [(type(i), i) for i in c.values()] == [(type(i), i) for i in e.values()]
+
+def largeReply(count):
+    lines = []
+    for i in range(1, count + 1):
+        node = b'<node_number><type>1</type><value>%d</value></node_number>' % i if i % 3 else b''
+        specification = b'<specification>N</specification>' if i % 7 == 0 else b''
+        lines.append(b'<element><no>%d</no><description>%s</description><row>%s<location>%f</location>'
+                     b'<internal_force_n>%f</internal_force_n><internal_force_vz>%f</internal_force_vz>%s</row></element>'
+                     % (i, b'Extremes' if i % 5 == 0 else str(i).encode(), node, i * 0.1, -i * 2.5, i * 0.5, specification))
+    return soapReply('get_results_for_members_internal_forces', b''.join(lines))
+
+def test_schema():
+    model = createModel(RESULTS_REPLY)
+    results = model.clientModel.service.get_results_for_members_internal_forces(LOAD_CASE, 1, 1)
+    schema = ResultTableSchema.of(results[0][0])
+
+    assert schema.row['node_number'] is convertVariant
+    assert schema.row['internal_force_n'] is convertNumber
+    assert schema.row['specification'] is convertText
+    # Registered once per table type
+    assert ResultTableSchema.of(results[0][1]) is schema
+
+def test_same_dicts():
+    for reply in (RESULTS_REPLY, largeReply(500)):
+        model = createModel(reply)
+        results = model.clientModel.service.get_results_for_members_internal_forces(LOAD_CASE, 1, 1)
+        for includeBase in (False, True):
+            assertSameDicts(ConvertResultsToListOfDct(results, includeBase),
+                            legacyConvertResultsToListOfDct(results, includeBase))
+
+def test_parameters():
+    model = createModel(largeReply(100))
+    results = model.clientModel.service.get_results_for_members_internal_forces(LOAD_CASE, 1, 1)
+    params = GetResultTableParameters(results)
+
+    assert set(params['base']) == {'no', 'description', 'row'}
+    assert set(params['row']) == {'node_number', 'location', 'internal_force_n', 'internal_force_vz', 'specification'}
+    assert params['error'] is None
+    assert GetResultTableParameters([]) == ''
+
+def test_same_columns():
+    model = createModel(largeReply(100))
+    results = model.clientModel.service.get_results_for_members_internal_forces(LOAD_CASE, 1, 1)
+    rows = ConvertResultsToListOfDct(results, True)
+    columns = ConvertResultsToColumns(results, True)
+
+    # Both formats are converted by the same converters
+    for name, column in columns.items():
+        for value, row in zip(column, rows):
+            if name in row:
+                assert value == row[name] and (isinstance(value, float) or type(value) is type(row[name]))
+            else:
+                assert value is None or math.isnan(value)
@@ -0,0 +1,51 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+from io import BytesIO
+from RFEM.enums import CaseObjectType
+from RFEM.Results.resultTables import ConvertResultsToListOfDct
+from RFEM.Results.resultStream import ParseResultRows, StreamResults, StreamResultsInChunks
+import suds.transport
+from UnitTests.offlineClient import createModel, RESULTS_REPLY
+
+def test_ParseResultRows():
+    model = createModel(RESULTS_REPLY)
+    results = model.clientModel.service.get_results_for_members_internal_forces('E_OBJECT_TYPE_LOAD_CASE', 1, 1)
+
+    assert list(ParseResultRows(BytesIO(RESULTS_REPLY))) == ConvertResultsToListOfDct(results)
+    assert list(ParseResultRows(BytesIO(RESULTS_REPLY), True)) == ConvertResultsToListOfDct(results, True)
+
+def test_StreamResults():
+    model = createModel(RESULTS_REPLY)
+
+    rows = list(StreamResults('get_results_for_members_internal_forces', CaseObjectType.E_OBJECT_TYPE_LOAD_COMBINATION, 2, 1, model=model))
+    assert len(rows) == 3
+    assert rows[0]['node_number'] == 1.0
+    assert rows[2]['node_number'] == '--'
+    assert b'E_OBJECT_TYPE_LOAD_COMBINATION' in model.clientModel.options.transport.sent[0]
+
+    chunks = list(StreamResultsInChunks('get_results_for_members_internal_forces', CaseObjectType.E_OBJECT_TYPE_LOAD_CASE, 1, 1, chunk_size=2, model=model))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+def test_StreamResultsClose():
+    model = createModel(RESULTS_REPLY)
+    transport = model.clientModel.options.transport
+    messages = []
+
+    def stream(request):
+        reply = transport.send(request)
+        messages.append(BytesIO(reply.message))
+        return suds.transport.Reply(reply.code, reply.headers, messages[-1])
+    transport.stream = stream
+
+    rows = StreamResults('get_results_for_members_internal_forces', CaseObjectType.E_OBJECT_TYPE_LOAD_CASE, 1, 1, model=model)
+    next(rows)
+    assert not messages[0].closed
+    # Reply is closed when the caller abandons the generator
+    rows.close()
+    assert messages[0].closed
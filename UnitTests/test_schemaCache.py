@@ -0,0 +1,53 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+from io import BytesIO
+import suds.transport
+from suds.client import Client
+from RFEM.schemaCache import SchemaCache, schemaKey
+
+with open(os.path.join(PROJECT_ROOT, 'UnitTests', 'src', 'model_test.wsdl'), 'rb') as f:
+    WSDL = f.read()
+
+class CountingTransport(suds.transport.Transport):
+    def __init__(self):
+        suds.transport.Transport.__init__(self)
+        self.opened = 0
+
+    def open(self, request):
+        self.opened += 1
+        return BytesIO(WSDL)
+
+def test_schemaKey():
+    assert schemaKey(WSDL, '6.02') == schemaKey(WSDL.replace(b'8082', b'8083'), '6.02')
+    assert schemaKey(WSDL, '6.02') != schemaKey(WSDL, '6.03')
+
+def test_schemaCache(tmp_path):
+    SchemaCache.memory.clear()
+    key = schemaKey(WSDL)
+
+    # suds links each transport to options of one Client
+    transports = [CountingTransport() for i in range(3)]
+    first = Client('http://localhost:8082/wsdl', transport=transports[0], location='http://localhost:8082',
+                   cache=SchemaCache(key, str(tmp_path)), cachingpolicy=1)
+    second = Client('http://localhost:8083/wsdl', transport=transports[1], location='http://localhost:8083',
+                    cache=SchemaCache(key, str(tmp_path)), cachingpolicy=1)
+
+    assert transports[0].opened == 1
+    assert transports[1].opened == 0
+    assert second.wsdl is first.wsdl
+    assert second.factory.create('ns0:node').no is None
+
+    # New process starts with empty memory and reads pickled definitions
+    SchemaCache.memory.clear()
+    third = Client('http://localhost:8084/wsdl', transport=transports[2], location='http://localhost:8084',
+                   cache=SchemaCache(key, str(tmp_path)), cachingpolicy=1)
+
+    assert transports[2].opened == 0
+    assert 'get_node' in str(third)
+    SchemaCache.memory.clear()
@@ -0,0 +1,131 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import pytest
+from xml.etree.ElementTree import canonicalize
+from RFEM.initModel import clearAttributes, deleteEmptyAttributes, createEmptyObject
+from RFEM.fastSerializer import FastSerializer
+import RFEM.TypesForMembers.memberTransverseStiffeners as memberTransverseStiffeners
+from RFEM.BasicObjects.node import Node
+from RFEM.TypesForMembers.memberTransverseStiffeners import MemberTransverseStiffeners
+from UnitTests.offlineClient import createModel
+
+NODE_CASES = [
+    {'no': 1},
+    {'no': 2, 'coordinate_1': 1.5, 'coordinate_2': 0.0, 'coordinate_3': -2.0, 'comment': ''},
+    {'no': 3, 'type': None, 'coordinate_1': None, 'comment': 'a < b & "c"'},
+    # fields set in other than schema order
+    {'comment': 'reversed', 'coordinate_3': 3.0, 'coordinate_1': 1.0, 'no': 4},
+]
+
+LOAD_CASES = [
+    {'no': 1, 'load_type': 'LOAD_TYPE_FORCE', 'nodes': '1 2', 'force_magnitude': 5000.0},
+    {'no': 2, 'has_shifted_load': False, 'force_magnitude': None, 'comment': ''},
+]
+
+def legacyObject(model, typeName, fields):
+    clientObject = clearAttributes(model.clientModel.factory.create(typeName))
+    for key in fields:
+        clientObject[key] = fields[key]
+    return deleteEmptyAttributes(clientObject)
+
+def sparseObject(model, typeName, fields):
+    clientObject = createEmptyObject(typeName, model)
+    for key in fields:
+        clientObject[key] = fields[key]
+    return clientObject
+
+def sudsMessage(model, operation, *args):
+    method = getattr(model.clientModel.service, operation).method
+    return canonicalize(method.binding.input.get_message(method, args, {}).plain())
+
+@pytest.mark.parametrize('fields', NODE_CASES)
+def test_node(fields):
+    model = createModel()
+    legacy = legacyObject(model, 'ns0:node', fields)
+    sparse = sparseObject(model, 'ns0:node', fields)
+
+    assert list(sparse) == list(legacy)
+    assert sudsMessage(model, 'set_node', sparse) == sudsMessage(model, 'set_node', legacy)
+
+    serializer = FastSerializer(model.clientModel)
+    assert serializer.serialize('set_node', sparse) == serializer.serialize('set_node', legacy)
+
+@pytest.mark.parametrize('fields', LOAD_CASES)
+def test_nodal_load(fields):
+    model = createModel()
+    legacy = legacyObject(model, 'ns0:nodal_load', fields)
+    sparse = sparseObject(model, 'ns0:nodal_load', fields)
+
+    assert sudsMessage(model, 'set_nodal_load', 7, sparse) == sudsMessage(model, 'set_nodal_load', 7, legacy)
+
+def test_nested():
+    model = createModel()
+    vector = model.clientModel.factory.create('ns0:vector_3d')
+    vector.x, vector.y, vector.z = 1.0, 2.0, 3.0
+    fields = {'no': 1, 'global_coordinates': vector}
+
+    legacy = legacyObject(model, 'ns0:node', fields)
+    sparse = sparseObject(model, 'ns0:node', fields)
+    assert sudsMessage(model, 'set_node', sparse) == sudsMessage(model, 'set_node', legacy)
+
+def test_attributes():
+    model = createModel()
+    sparse = createEmptyObject('ns0:node', model)
+
+    # Fields of the schema read as None, but are not stored
+    assert sparse.coordinate_1 is None
+    assert sparse['comment'] is None
+    assert len(sparse) == 0
+    with pytest.raises(AttributeError):
+        sparse.unknown_field
+
+    sparse.coordinate_1 = 1.0
+    assert 'coordinate_1' in sparse
+    sparse.coordinate_1 = None
+    assert 'coordinate_1' not in sparse
+
+    # Objects don't share fields
+    sparse.no = 5
+    assert createEmptyObject('ns0:node', model).no is None
+
+def test_constructor():
+    model = createModel()
+    Node(4, 1.0, 2.0, 3.0, 'node', params={'type': None}, model=model)
+
+    legacy = legacyObject(model, 'ns0:node', {'no': 4, 'coordinate_1': 1.0, 'coordinate_2': 2.0, 'coordinate_3': 3.0, 'comment': 'node'})
+    sent = model.clientModel.options.transport.sent[0].decode('utf-8')
+    assert canonicalize(sent) == sudsMessage(model, 'set_node', legacy)
+
+def legacyStiffeners(model, no, members, member_sets, components, comment):
+    # Constructor before createEmptyObject(), messages have to stay the same
+    clientObject = clearAttributes(model.clientModel.factory.create('ns0:member_transverse_stiffener'))
+    clientObject.no = no
+    clientObject.members = members
+    clientObject.member_sets = member_sets
+    clientObject.components = model.clientModel.factory.create('ns0:member_transverse_stiffener.components')
+    for i in components:
+        mlvlp = model.clientModel.factory.create('ns0:member_transverse_stiffener_components_row')
+        mlvlp.no = i['no']
+        for key, value in i.items():
+            if key != 'no':
+                mlvlp.row[key] = value.name if hasattr(value, 'name') else value
+        clientObject.components.member_transverse_stiffener_components.append(mlvlp)
+    clientObject.comment = comment
+    return deleteEmptyAttributes(clientObject)
+
+def test_stiffenersConstructor(monkeypatch):
+    model = createModel()
+    # Steel Design add-on is not in the offline WSDL
+    monkeypatch.setattr(memberTransverseStiffeners, 'SetAddonStatus', lambda *args: None)
+    components = [MemberTransverseStiffeners.component, dict(MemberTransverseStiffeners.component, no=2, position=0.5)]
+    MemberTransverseStiffeners(3, '1 2', components=components, comment='stiffeners', model=model)
+
+    legacy = legacyStiffeners(model, 3, '1 2', '', components, 'stiffeners')
+    sent = model.clientModel.options.transport.sent[0].decode('utf-8')
+    assert canonicalize(sent) == sudsMessage(model, 'set_member_transverse_stiffener', legacy)
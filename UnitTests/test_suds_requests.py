@@ -17,6 +17,8 @@
 # License: MIT
 #######################################################################
 
+import gzip
+import io
 import os
 import sys
 import mock
@@ -100,10 +102,119 @@ def test_send():
             'A': 1,
             'B': 2,
         },
+        timeout=None,
     )
     assert reply.code == 200
     assert reply.headers == {
         1: 'A',
         2: 'B',
     }
-    assert reply.message == b'abc123'
\ No newline at end of file
+    assert reply.message == b'abc123'
+
+def test_pool():
+    transport = suds_requests.RequestsTransport(pool_maxsize=4)
+    adapter = transport._session.get_adapter('http://127.0.0.1:8082')
+
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_connections == 1
+
+
+def test_profile_session(tmpdir):
+    session = mock.Mock()
+    session.post.return_value.content = b'<reply/>'
+    session.post.return_value.headers = {'content-type': 'text/xml'}
+    session.post.return_value.status_code = 200
+    transport = suds_requests.RequestsTransport(session)
+    request = suds.transport.Request(
+        'http://url',
+        b'<SOAP-ENV:Envelope><SOAP-ENV:Header/><ns1:Body><ns0:set_node><ns0:value/></ns0:set_node></ns1:Body></SOAP-ENV:Envelope>',
+    )
+
+    transport.send(request)
+    with suds_requests.profile_session() as profile:
+        transport.send(request)
+        transport.send(request)
+    transport.send(request)
+
+    stats = profile.as_list()
+    assert len(stats) == 1
+    assert stats[0]['operation'] == 'set_node'
+    assert stats[0]['count'] == 2
+    assert stats[0]['request_bytes'] == 2 * len(request.message)
+    assert stats[0]['response_bytes'] == 2 * len(b'<reply/>')
+    assert sum(stats[0]['histogram'].values()) == 2
+
+    profile.dump_json(str(tmpdir.join('profile.json')))
+    profile.dump_csv(str(tmpdir.join('profile.csv')))
+    assert 'set_node,2,' in tmpdir.join('profile.csv').read()
+
+
+def test_compression():
+    session = mock.Mock()
+    session.post.return_value.content = b'abc123'
+    session.post.return_value.headers = {'content-type': 'text/xml'}
+    session.post.return_value.status_code = 200
+    transport = suds_requests.RequestsTransport(session, compression=False, compress_requests=True)
+    request = suds.transport.Request('http://url', b'<soap/>' * 100)
+    request.headers = {'A': 1}
+
+    transport.send(request)
+
+    args, kwargs = session.post.call_args
+    assert kwargs['headers'] == {'A': 1, 'Accept-Encoding': 'identity', 'Content-Encoding': 'gzip'}
+    assert gzip.decompress(kwargs['data']) == request.message
+    assert request.headers == {'A': 1}
+
+
+def test_timeout():
+    session = mock.Mock()
+    session.post.side_effect = requests.ReadTimeout()
+    transport = suds_requests.RequestsTransport(session, timeout=(3, 60))
+    request = suds.transport.Request('http://url', b'<soap/>')
+
+    with pytest.raises(suds_requests.DeadlineExceeded):
+        transport.send(request)
+    assert session.post.call_args[1]['timeout'] == (3, 60)
+
+
+def test_deadline():
+    session = mock.Mock()
+    transport = suds_requests.RequestsTransport(session, timeout=(3, 60))
+    request = suds.transport.Request('http://url', b'<soap/>')
+
+    with suds_requests.deadline(10):
+        with suds_requests.deadline(20):
+            transport.send(request)
+            connect, read = session.post.call_args[1]['timeout']
+            assert connect <= 3
+            assert 9 < read <= 10
+
+    with suds_requests.deadline(0):
+        with pytest.raises(suds_requests.DeadlineExceeded):
+            transport.send(request)
+    assert session.post.call_count == 1
+
+
+def test_stream_profile():
+    session = mock.Mock()
+    # Chunked reply without content-length
+    session.post.return_value.raw = io.BytesIO(b'<reply>' + b'x' * 1000 + b'</reply>')
+    session.post.return_value.headers = {'content-type': 'text/xml'}
+    session.post.return_value.status_code = 200
+    transport = suds_requests.RequestsTransport(session)
+    request = suds.transport.Request(
+        'http://url',
+        b'<SOAP-ENV:Envelope><SOAP-ENV:Header/><ns1:Body><ns0:get_results_for_summary/></ns1:Body></SOAP-ENV:Envelope>',
+    )
+
+    with suds_requests.profile_session() as profile:
+        reply = transport.stream(request)
+        while reply.message.read(100):
+            pass
+        reply.message.close()
+
+    stats = profile.as_list()
+    assert stats[0]['operation'] == 'get_results_for_summary'
+    assert stats[0]['count'] == 1
+    assert stats[0]['response_bytes'] == 1015
+    session.post.return_value.close.assert_called_once_with()
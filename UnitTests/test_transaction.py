@@ -0,0 +1,112 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import re
+import pytest
+from suds import WebFault
+from RFEM.initModel import Model
+from RFEM.BasicObjects.node import Node
+from RFEM.transaction import Transaction, TransactionError
+from UnitTests.offlineClient import createModel, FAULT_REPLY, NOT_FOUND_REPLY
+
+NODE_REPLY = b'''<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+<SOAP-ENV:Body><get_nodeResponse xmlns="http://www.dlubal.com/rfem.xsd"><value>
+<no>1</no><coordinate_1>7.5</coordinate_1>
+</value></get_nodeResponse></SOAP-ENV:Body>
+</SOAP-ENV:Envelope>'''
+
+def existingNode(message):
+    # Node 1 exists in the model, others don't
+    return NODE_REPLY if re.search(rb':no>1<', message) else NOT_FOUND_REPLY
+
+def failingNode(message):
+    return FAULT_REPLY if re.search(rb':no>3<', message) else b''
+
+def createTransactionModel():
+    model = createModel()
+    transport = model.clientModel.options.transport
+    transport.replies['get_node'] = existingNode
+    transport.replies['set_node'] = failingNode
+    return model, transport
+
+def test_commit():
+    model, transport = createTransactionModel()
+
+    with Transaction(model, rollback=False) as transaction:
+        Node(1, model=transaction)
+        # Model is redirected to the transaction
+        Node(2, model=model)
+        assert transport.sent == []
+
+    assert model.clientModel is transaction.target.clientModel
+    assert transport.operations() == ['begin_modification', 'set_node', 'set_node', 'finish_modification']
+
+def test_rollback():
+    model, transport = createTransactionModel()
+
+    with pytest.raises(TransactionError) as e:
+        with Transaction(model) as transaction:
+            Node(1, model=transaction)
+            Node(2, model=transaction)
+            Node(3, model=transaction)
+            Node(4, model=transaction)
+
+    assert [(operation, no) for operation, no, exception in e.value.failures] == [('set_node', 3)]
+    assert e.value.rolledBack
+
+    # Existing node 1 is restored, created nodes are deleted, one modification window only
+    assert transport.operations() == ['begin_modification',
+                                      'get_node', 'set_node', 'get_node', 'set_node', 'get_node', 'set_node', 'get_node', 'set_node',
+                                      'delete_object', 'delete_object', 'delete_object', 'set_node',
+                                      'finish_modification']
+    assert re.search(rb':coordinate_1>7.5<', transport.sent[-2])
+    assert transaction.rollbackFailures == []
+
+def test_exception():
+    model, transport = createTransactionModel()
+
+    with pytest.raises(ValueError):
+        with Transaction(model, chunk_size=1) as transaction:
+            Node(2, model=transaction)
+            raise ValueError()
+
+    assert transport.operations() == ['begin_modification', 'get_node', 'set_node', 'finish_modification',
+                                      'begin_modification', 'delete_object', 'finish_modification']
+
+def test_modelMethod():
+    transaction = Model.transaction(rollback=False)
+    assert isinstance(transaction, Transaction)
+    assert transaction.model is Model
+    assert not transaction.rollback
+
+def test_unnumbered():
+    model, transport = createTransactionModel()
+    transaction = Transaction(model)
+    # Not a numbered object, so it can't be restored (and isn't in the offline WSDL)
+    transaction.add('set_model_type', 'E_MODEL_TYPE_3D')
+    Node(2, model=transaction)
+
+    with pytest.raises(TransactionError) as e:
+        transaction.flush()
+
+    assert [(operation, no) for operation, no, exception in e.value.failures] == [('set_model_type', None)]
+    assert transport.operations() == ['begin_modification', 'get_node', 'set_node', 'delete_object', 'finish_modification']
+
+def test_read_error():
+    model, transport = createTransactionModel()
+    # Reading node 3 fails for other reason than missing node
+    transport.replies['get_node'] = lambda message: FAULT_REPLY if re.search(rb':no>3<', message) else NOT_FOUND_REPLY
+
+    with pytest.raises(WebFault):
+        with Transaction(model) as transaction:
+            Node(2, model=transaction)
+            Node(3, model=transaction)
+
+    # Node 3 isn't written, node 2 is deleted again
+    assert transport.operations() == ['begin_modification', 'get_node', 'set_node', 'get_node', 'delete_object', 'finish_modification']
@@ -0,0 +1,68 @@
+import os
+import sys
+PROJECT_ROOT = os.path.abspath(os.path.join(
+                  os.path.dirname(__file__),
+                  os.pardir)
+)
+sys.path.append(PROJECT_ROOT)
+
+import pickle
+import pytest
+import threading
+from RFEM.workerPool import ModelWorkerPool, WorkerTarget
+
+# Workers don't attach any model, RFEM is not needed
+def fakeAttach(target):
+    os.environ['MODEL_NAME'] = target.model_name
+
+def modelName(suffix = ''):
+    return os.environ['MODEL_NAME'] + suffix
+
+def divide(a, b):
+    return a / b
+
+def test_workerPool():
+    targets = [WorkerTarget(model_name='Variant%d' % i) for i in range(2)]
+    with ModelWorkerPool(targets, fakeAttach) as pool:
+        assert pool.submit(modelName, '_a', worker=1).result() == 'Variant1_a'
+        assert pool.broadcast(modelName) == ['Variant0', 'Variant1']
+        assert pool.map(divide, []) == []
+        assert [pool.submit(divide, i, 2).result() for i in range(4)] == [0, 0.5, 1, 1.5]
+
+        with pytest.raises(ZeroDivisionError):
+            pool.submit(divide, 1, 0).result()
+
+def failingAttach(target):
+    raise ConnectionError('Port %s is not open.' % target.port)
+
+def test_workerPoolAttachFailure():
+    with ModelWorkerPool([WorkerTarget(port='8090')], failingAttach) as pool:
+        with pytest.raises(RuntimeError, match='8090'):
+            pool.submit(modelName).result()
+
+def unpicklableResult():
+    return threading.Lock()
+
+def exitWorker(code):
+    os._exit(code)
+
+def test_workerPoolLostResults():
+    with ModelWorkerPool([WorkerTarget(), WorkerTarget()], fakeAttach) as pool:
+        with pytest.raises(RuntimeError, match='pickle'):
+            pool.submit(unpicklableResult).result(timeout=30)
+
+        # Futures of dead worker fail, the other worker keeps working
+        with pytest.raises(RuntimeError, match='exited with code 3'):
+            pool.submit(exitWorker, 3, worker=0).result(timeout=30)
+        assert pool.submit(divide, 1, 2).result(timeout=30) == 0.5
+        with pytest.raises(RuntimeError, match='exited with code 3'):
+            pool.submit(divide, 1, 2, worker=0).result(timeout=30)
+
+def test_workerPoolUnpicklableTask():
+    with ModelWorkerPool([WorkerTarget()], fakeAttach) as pool:
+        for future in (pool.submit(lambda: 1), pool.submit(divide, threading.Lock(), 1)):
+            with pytest.raises((pickle.PicklingError, AttributeError, TypeError)):
+                future.result(timeout=1)
+        # Worker isn't kept busy by the rejected tasks
+        assert pool.pending == [0]
+        assert pool.submit(divide, 1, 2).result(timeout=30) == 0.5